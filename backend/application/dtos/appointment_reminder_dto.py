@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from datetime import datetime
+from backend.core.models.service_type import ServiceType
+
+class AppointmentReminderDTO(BaseModel):
+    appointment_id: str
+    client_name: str
+    client_email: str
+    service_name: str
+    service_description: str
+    service_duration_minutes: int
+    service_price: float | None = None
+    service_type: ServiceType
+    scheduled_start: datetime
+    scheduled_end: datetime
+    view_token: str | None = None
+    cancellation_token: str | None = None
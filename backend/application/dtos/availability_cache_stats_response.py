@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+class AvailabilityCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    stale_sets: int
+    size: int
+    max_entries: int
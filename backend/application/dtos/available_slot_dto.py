@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+class AvailableSlotDTO(BaseModel):
+    service_id: str
+    service_name: str
+    start: datetime
+    end: datetime
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from datetime import datetime
+from backend.core.models.service_type import ServiceType
+from backend.core.models.appointment_status import AppointmentStatus
+
+class CancelledAppointmentDTO(BaseModel):
+    id: str
+    user_id: str
+    service_id: str
+    client_name: str
+    client_email: str
+    service_name: str
+    service_description: str
+    service_type: ServiceType
+    scheduled_start: datetime
+    scheduled_end: datetime
+    status: AppointmentStatus
+    view_token: str
+    cancellation_token: str
+    created_at: datetime
+    updated_at: datetime
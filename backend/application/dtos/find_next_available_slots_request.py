@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime
+from typing import Optional
+from backend.core.models.service_type import ServiceType
+
+class FindNextAvailableSlotsRequest(BaseModel):
+    service_type: Optional[ServiceType] = Field(None, description="Search every service of this type")
+    service_id: Optional[str] = Field(None, description="Search a single service")
+    after: Optional[datetime] = Field(None, description="Search forward from this instant (ISO 8601, defaults to now)")
+    count: int = Field(5, ge=1, le=50, description="Number of free slots to return")
+    horizon_days: int = Field(60, ge=1, le=365, description="How far ahead of the start to search")
+
+    @model_validator(mode="after")
+    def check_single_target(self) -> "FindNextAvailableSlotsRequest":
+        if (self.service_type is None) == (self.service_id is None):
+            raise ValueError("Exactly one of service_type or service_id must be given")
+        return self
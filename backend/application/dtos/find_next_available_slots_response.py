@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from backend.application.dtos.available_slot_dto import AvailableSlotDTO
+
+class FindNextAvailableSlotsResponse(BaseModel):
+    success: bool
+    message: str
+    slots: List[AvailableSlotDTO] = []
+    error_code: Optional[str] = None
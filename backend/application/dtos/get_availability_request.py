@@ -6,6 +6,8 @@ class GetAvailabilityRequest(BaseModel):
     service_type: ServiceType = Field(..., description="Type of service to check availability for")
     start_date: datetime = Field(..., description="Start of the time range to check (ISO 8601 format)")
     end_date: datetime = Field(..., description="End of the time range to check (ISO 8601 format)")
+    per_service: bool = Field(False, description="Compute a separate slot grid for each service of the type")
+    only_available: bool = Field(False, description="Leave busy slots out of the response")
 
     def __init__(self, **data):
         super().__init__(**data)
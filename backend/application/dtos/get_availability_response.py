@@ -1,10 +1,15 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import Dict, List
 from backend.core.models.service_type import ServiceType
 from .time_slot_dto import TimeSlotDTO
 from .service_summary_dto import ServiceSummaryDTO
+from .service_availability_dto import ServiceAvailabilityDTO
 
 class GetAvailabilityResponse(BaseModel):
     service_type: ServiceType
     time_slots: List[TimeSlotDTO]
     available_services: List[ServiceSummaryDTO]
+    service_availability: Dict[str, ServiceAvailabilityDTO] = Field(
+        default_factory=dict,
+        description="Per-service slot grids keyed by service ID (only filled when per_service is requested)"
+    )
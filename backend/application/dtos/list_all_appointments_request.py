@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
 from backend.core.models.appointment_status import AppointmentStatus
@@ -9,3 +9,6 @@ class ListAllAppointmentsRequest(BaseModel):
     service_type: Optional[ServiceType] = None
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
+    page_size: int = Field(50, ge=1, le=500)
+    cursor: Optional[str] = None
+    include_total: bool = False
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 from .admin_appointment_summary_dto import AdminAppointmentSummaryDTO
 
@@ -8,5 +8,6 @@ class ListAllAppointmentsResponse(BaseModel):
     success: bool
     message: str
     appointments: List[AdminAppointmentSummaryDTO]
-    total_count: int
+    total_count: Optional[int] = None
+    next_cursor: Optional[str] = None
     error_code: str | None = None
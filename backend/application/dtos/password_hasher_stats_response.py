@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+class PasswordHasherStatsResponse(BaseModel):
+    max_workers: int
+    max_pending: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    avg_hash_ms: float
+    max_hash_ms: float
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class SendAppointmentRemindersResponse(BaseModel):
+    success: bool
+    message: str
+    queued_count: int = 0
+    error_code: Optional[str] = None
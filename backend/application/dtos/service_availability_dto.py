@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from typing import List
+from .time_slot_dto import TimeSlotDTO
+
+class ServiceAvailabilityDTO(BaseModel):
+    service_id: str
+    duration_minutes: int
+    time_slots: List[TimeSlotDTO]
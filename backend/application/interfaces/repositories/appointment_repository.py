@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from backend.application.dtos.admin_appointment_summary_dto import AdminAppointmentSummaryDTO
+from backend.application.dtos.appointment_reminder_dto import AppointmentReminderDTO
+from backend.application.dtos.cancelled_appointment_dto import CancelledAppointmentDTO
 from backend.core.models.appointment import Appointment
 from backend.core.models.appointment_status import AppointmentStatus
 from backend.core.models.service_type import ServiceType
@@ -17,10 +20,23 @@ class AppointmentRepository(ABC):
     async def find_scheduled_between(self, start: datetime, end: datetime, service_id: str) -> List[Appointment]:
         pass
 
+    @abstractmethod
+    async def find_scheduled_between_for_services(
+            self,
+            start: datetime,
+            end: datetime,
+            service_ids: List[str]
+    ) -> Dict[str, List[Appointment]]:
+        pass
+
     @abstractmethod
     async def find_scheduled_between_for_user(self, user_id: str, start: datetime, end: datetime) -> List[Appointment]:
         pass
 
+    @abstractmethod
+    async def find_scheduled_ending_after(self, since: datetime) -> List[Appointment]:
+        pass
+
     @abstractmethod
     async def find_by_user_id(self, user_id: str) -> List[Appointment]:
         pass
@@ -35,6 +51,32 @@ class AppointmentRepository(ABC):
     ) -> List[Appointment]:
         pass
 
+    @abstractmethod
+    async def find_admin_summaries(
+            self,
+            status: Optional[AppointmentStatus] = None,
+            service_type: Optional[ServiceType] = None,
+            date_from: Optional[datetime] = None,
+            date_to: Optional[datetime] = None,
+            limit: Optional[int] = None,
+            after: Optional[Tuple[datetime, str]] = None
+    ) -> List[AdminAppointmentSummaryDTO]:
+        """Appointments joined with their user and service, ordered by (scheduled_start, id) descending.
+
+        ``after`` is the (scheduled_start, id) of the last row of the previous page.
+        """
+        pass
+
+    @abstractmethod
+    async def count_filtered(
+            self,
+            status: Optional[AppointmentStatus] = None,
+            service_type: Optional[ServiceType] = None,
+            date_from: Optional[datetime] = None,
+            date_to: Optional[datetime] = None
+    ) -> int:
+        pass
+
     @abstractmethod
     async def find_by_view_token(self, token: str) -> Optional[Appointment]:
         pass
@@ -46,3 +88,16 @@ class AppointmentRepository(ABC):
     @abstractmethod
     async def update(self, appointment: Appointment) -> Appointment:
         pass
+
+    @abstractmethod
+    async def cancel_by_token(self, token: str) -> Optional[CancelledAppointmentDTO]:
+        """Cancel the scheduled appointment holding ``token`` in a single conditional update.
+
+        Returns None when no scheduled appointment matches.
+        """
+        pass
+
+    @abstractmethod
+    async def claim_due_reminders(self, start: datetime, end: datetime, limit: int) -> List[AppointmentReminderDTO]:
+        """Mark up to ``limit`` scheduled appointments starting in [start, end) as reminded and return them."""
+        pass
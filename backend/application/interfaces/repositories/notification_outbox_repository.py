@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+from backend.core.models.notification_kind import NotificationKind
+
+class NotificationOutboxRepository(ABC):
+
+    @abstractmethod
+    async def enqueue(self, kind: NotificationKind, recipient: str, details: Dict[str, Any]) -> None:
+        """Stage a notification in the current transaction; it is stored by the caller's next committing write."""
+        pass
@@ -20,3 +20,7 @@ class ServiceRepository(ABC):
     @abstractmethod
     async def find_by_name(self, name: str) -> Optional[Service]:
         pass
+
+    @abstractmethod
+    async def find_all(self) -> List[Service]:
+        pass
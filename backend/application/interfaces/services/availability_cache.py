@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Optional
+from backend.application.dtos.get_availability_request import GetAvailabilityRequest
+from backend.application.dtos.get_availability_response import GetAvailabilityResponse
+from backend.core.models.service_type import ServiceType
+
+class AvailabilityCache(ABC):
+
+    @abstractmethod
+    async def get(self, request: GetAvailabilityRequest) -> Optional[GetAvailabilityResponse]:
+        pass
+
+    @abstractmethod
+    async def generation(self) -> int:
+        """Counter bumped by every invalidation; read it before loading the data a response is built from."""
+        pass
+
+    @abstractmethod
+    async def set(self, request: GetAvailabilityRequest, response: GetAvailabilityResponse,
+                  generation: Optional[int] = None) -> None:
+        """Store the response, unless an invalidation ran since ``generation`` was read."""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, service_type: Optional[ServiceType], start: datetime, end: datetime) -> int:
+        """Drop every cached window of the service type (all types when None) that covers a day of [start, end)."""
+        pass
+
+    @abstractmethod
+    async def stats(self) -> Dict[str, int]:
+        pass
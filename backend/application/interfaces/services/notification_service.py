@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence, Tuple
+from backend.core.models.notification_kind import NotificationKind
+
+Notification = Tuple[NotificationKind, str, Dict[str, Any]]
 
 class NotificationService(ABC):
 
@@ -14,3 +17,8 @@ class NotificationService(ABC):
     @abstractmethod
     async def send_appointment_cancellation(self, recipient: str, details: Dict[str, Any]) -> bool:
         pass
+
+    @abstractmethod
+    async def send_batch(self, notifications: Sequence[Notification]) -> List[bool]:
+        """Deliver (kind, recipient, details) notifications together; returns one delivery flag per notification."""
+        pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import TypedDict
+
+class PasswordHasherStats(TypedDict):
+    max_workers: int
+    max_pending: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    avg_hash_ms: float
+    max_hash_ms: float
+
+class PasswordHasher(ABC):
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Raises PasswordHasherSaturatedError instead of queueing once the hasher is at capacity."""
+        pass
+
+    @abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Raises PasswordHasherSaturatedError instead of queueing once the hasher is at capacity."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> PasswordHasherStats:
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+class UnitOfWork(ABC):
+    """Transaction boundary of a use case: repositories stage writes, the use case commits once."""
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            await self.rollback()
@@ -0,0 +1,18 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+AppointmentCursor = Tuple[datetime, str]
+
+def encode_cursor(scheduled_start: datetime, appointment_id: str) -> str:
+    raw = f"{scheduled_start.isoformat()}|{appointment_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> AppointmentCursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        scheduled_start, appointment_id = raw.split("|", 1)
+        return datetime.fromisoformat(scheduled_start), str(uuid.UUID(appointment_id))
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
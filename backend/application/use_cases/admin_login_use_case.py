@@ -1,32 +1,39 @@
+import asyncio
 import os
-import bcrypt
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 from jose import jwt, JWTError
 from backend.application.dtos.admin_login_request import AdminLoginRequest
 from backend.application.dtos.admin_login_response import AdminLoginResponse
+from backend.application.interfaces.services.password_hasher import PasswordHasher
+from backend.core.exceptions.password_hasher_saturated_error import PasswordHasherSaturatedError
 
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin_user")
-ADMIN_PASSWORD_HASH = bcrypt.hashpw(os.getenv("ADMIN_PASSWORD", "default_password").encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "default_password")
+# A precomputed hash is shared by every worker and costs nothing at startup.
+ADMIN_PASSWORD_HASH = os.getenv("ADMIN_PASSWORD_HASH")
 SECRET_KEY = os.getenv("SECRET_KEY", "your-default-secret-key-change-me-in-production!")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
 class AdminLoginUseCase:
+    # Without ADMIN_PASSWORD_HASH the hash is computed on the first admin login and reused afterwards.
+    _password_hash: Optional[str] = ADMIN_PASSWORD_HASH
+    _password_hash_lock = asyncio.Lock()
+
+    def __init__(self, password_hasher: PasswordHasher):
+        self.password_hasher = password_hasher
+
     async def execute(self, request: AdminLoginRequest) -> AdminLoginResponse:
         try:
-            input_username = request.username
-            input_password = request.password.encode('utf-8')
-
-            if input_username != ADMIN_USERNAME:
+            if request.username != ADMIN_USERNAME:
                 return AdminLoginResponse(
                     success=False,
                     message="Invalid username or password",
                     error_code="INVALID_CREDENTIALS"
                 )
 
-            stored_hash_bytes = ADMIN_PASSWORD_HASH.encode('utf-8')
-
-            if not bcrypt.checkpw(input_password, stored_hash_bytes):
+            if not await self.password_hasher.verify(request.password, await self._admin_password_hash()):
                 return AdminLoginResponse(
                     success=False,
                     message="Invalid username or password",
@@ -35,7 +42,7 @@ class AdminLoginUseCase:
 
             expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
             token_data = {
-                "sub": input_username,
+                "sub": request.username,
                 "role": "admin",
                 "exp": expire.timestamp()
             }
@@ -48,6 +55,12 @@ class AdminLoginUseCase:
                 token_type="bearer"
             )
 
+        except PasswordHasherSaturatedError as e:
+            return AdminLoginResponse(
+                success=False,
+                message=str(e),
+                error_code="SERVICE_UNAVAILABLE"
+            )
         except JWTError:
             return AdminLoginResponse(
                 success=False,
@@ -60,3 +73,11 @@ class AdminLoginUseCase:
                 message="An internal error occurred during admin login.",
                 error_code="INTERNAL_ERROR"
             )
+
+    async def _admin_password_hash(self) -> str:
+        cls = AdminLoginUseCase
+        if cls._password_hash is None:
+            async with cls._password_hash_lock:
+                if cls._password_hash is None:
+                    cls._password_hash = await self.password_hasher.hash(ADMIN_PASSWORD)
+        return cls._password_hash
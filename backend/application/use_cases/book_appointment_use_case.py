@@ -1,12 +1,17 @@
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from backend.application.dtos.book_appointment_request import BookAppointmentRequest
 from backend.application.dtos.book_appointment_response import BookAppointmentResponse
 from backend.application.interfaces.repositories.appointment_repository import AppointmentRepository
+from backend.application.interfaces.repositories.notification_outbox_repository import NotificationOutboxRepository
 from backend.application.interfaces.repositories.service_repository import ServiceRepository
 from backend.application.interfaces.repositories.user_repository import UserRepository
-from backend.application.interfaces.services.notification_service import NotificationService
+from backend.application.interfaces.services.availability_cache import AvailabilityCache
+from backend.application.interfaces.unit_of_work import UnitOfWork
+from backend.core.exceptions.appointment_conflict_error import ServiceTimeSlotConflictError, \
+    UserTimeSlotConflictError
 from backend.core.models.appointment import Appointment
+from backend.core.models.notification_kind import NotificationKind
 from backend.core.models.service import Service
 from backend.core.value_objects.time_slot import TimeSlot
 import uuid
@@ -19,11 +24,14 @@ logger = logging.getLogger(__name__)
 
 class BookAppointmentUseCase:
     def __init__(self, appointment_repo: AppointmentRepository, user_repo: UserRepository, service_repo: ServiceRepository,
-                 notification_service: NotificationService):
+                 notification_outbox: NotificationOutboxRepository, unit_of_work: UnitOfWork,
+                 availability_cache: Optional[AvailabilityCache] = None):
         self.appointment_repo = appointment_repo
         self.user_repo = user_repo
         self.service_repo = service_repo
-        self.notification_service = notification_service
+        self.notification_outbox = notification_outbox
+        self.unit_of_work = unit_of_work
+        self.availability_cache = availability_cache
 
     async def execute(self, request: BookAppointmentRequest, user_id: str) -> BookAppointmentResponse:
         try:
@@ -45,48 +53,59 @@ class BookAppointmentUseCase:
                 user_id=user_id,
                 service_id=request.service_id,
                 scheduled_slot=TimeSlot(start=requested_start, end=requested_end),
+                service_type=service.service_type,
             )
 
-            scheduled_appointments_for_service = await self.appointment_repo.find_scheduled_between(
-                start=requested_start,
-                end=requested_end,
-                service_id=request.service_id
-            )
-
-            for existing_appt in scheduled_appointments_for_service:
-                requested_slot_vo = TimeSlot(start=requested_start, end=requested_end)
-                existing_slot_vo = existing_appt.scheduled_slot
-
-                if requested_slot_vo.overlaps(existing_slot_vo):
-                    return BookAppointmentResponse(
-                        success=False,
-                        message="The requested time slot is not available for this service",
-                        error_code="TIME_SLOT_CONFLICT"
-                    )
-
-            scheduled_appointments_for_user = await self.appointment_repo.find_scheduled_between_for_user(
-                user_id=user_id,
-                start=requested_start,
-                end=requested_end
-            )
+            user = await self.user_repo.find_by_id(user_id)
+            if user:
+                appointment_details = {
+                    "client_name": user.name,
+                    "client_email": user.email.value,
+                    "service_name": service.name,
+                    "service_description": service.description,
+                    "service_duration_minutes": service.duration_minutes,
+                    "service_price": service.price,
+                    "service_type": service.service_type,
+                    "scheduled_start": appointment_entity.scheduled_slot.start,
+                    "scheduled_end": appointment_entity.scheduled_slot.end,
+                    "status": appointment_entity.status,
+                    "view_token": appointment_entity.view_token,
+                    "cancellation_token": appointment_entity.cancellation_token,
+                }
+
+                # Staged in the same transaction as the appointment insert and delivered by the outbox worker.
+                await self.notification_outbox.enqueue(
+                    NotificationKind.CONFIRMATION,
+                    recipient=user.email.value,
+                    details=appointment_details
+                )
 
-            for existing_appt in scheduled_appointments_for_user:
-                new_slot = appointment_entity.scheduled_slot
-                existing_slot = existing_appt.scheduled_slot
+            # Overlaps are rejected by the database's exclusion constraints inside the insert itself.
+            try:
+                saved_appointment = await self.appointment_repo.save(appointment_entity)
+            except ServiceTimeSlotConflictError as e:
+                await self.unit_of_work.rollback()
+                return BookAppointmentResponse(
+                    success=False,
+                    message=str(e),
+                    error_code="TIME_SLOT_CONFLICT"
+                )
+            except UserTimeSlotConflictError as e:
+                await self.unit_of_work.rollback()
+                return BookAppointmentResponse(
+                    success=False,
+                    message=str(e),
+                    error_code="USER_TIME_SLOT_CONFLICT"
+                )
 
-                if new_slot.overlaps(existing_slot):
-                    return BookAppointmentResponse(
-                        success=False,
-                        message="The requested time slot conflicts with another appointment for this user",
-                        error_code="USER_TIME_SLOT_CONFLICT"
-                    )
+            # The appointment and its confirmation become visible together, or not at all.
+            await self.unit_of_work.commit()
 
-            saved_appointment = await self.appointment_repo.save(appointment_entity)
+            if self.availability_cache is not None:
+                await self.availability_cache.invalidate(service.service_type, requested_start, requested_end)
 
-            #---
-            user = await self.user_repo.find_by_id(user_id)
             if not user:
-                logger.error("User %s not found when sending notification for appointment %s.", user_id,
+                logger.error("User %s not found when queueing notification for appointment %s.", user_id,
                              saved_appointment.id)
                 return BookAppointmentResponse(
                     success=False,
@@ -95,42 +114,6 @@ class BookAppointmentUseCase:
                     error_code="USER_DATA_NOT_FOUND_FOR_NOTIFICATION"
                 )
 
-            service_name = service.name
-            service_description = service.description
-            service_duration_minutes = service.duration_minutes
-            service_price = service.price
-            service_type = service.service_type
-            scheduled_start = saved_appointment.scheduled_slot.start
-            scheduled_end = saved_appointment.scheduled_slot.end
-            status = saved_appointment.status
-            view_token = saved_appointment.view_token
-            cancellation_token = saved_appointment.cancellation_token
-
-            appointment_details = {
-                "client_name": user.name,
-                "client_email": user.email.value,
-                "service_name": service_name,
-                "service_description": service_description,
-                "service_duration_minutes": service_duration_minutes,
-                "service_price": service_price,
-                "service_type": service_type,
-                "scheduled_start": scheduled_start,
-                "scheduled_end": scheduled_end,
-                "status": status,
-                "view_token": view_token,
-                "cancellation_token": cancellation_token,
-            }
-
-            notification_sent = await self.notification_service.send_appointment_confirmation(
-                recipient=user.email.value,
-                details=appointment_details
-            )
-
-            if not notification_sent:
-                logger.warning("Failed to send confirmation notification for appointment %s.", saved_appointment.id)
-
-            # ---
-
             return BookAppointmentResponse(
                 success=True,
                 message="Appointment booked successfully",
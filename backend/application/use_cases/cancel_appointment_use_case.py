@@ -1,90 +1,53 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from backend.application.dtos.cancel_appointment_request import CancelAppointmentRequest
 from backend.application.dtos.cancel_appointment_response import CancelAppointmentResponse
+from backend.application.dtos.cancelled_appointment_dto import CancelledAppointmentDTO
 from backend.application.interfaces.repositories.appointment_repository import AppointmentRepository
-from backend.application.interfaces.repositories.service_repository import ServiceRepository
-from backend.application.interfaces.repositories.user_repository import UserRepository
-from backend.application.interfaces.services.notification_service import NotificationService
-from backend.core.models.appointment_status import AppointmentStatus
+from backend.application.interfaces.repositories.notification_outbox_repository import NotificationOutboxRepository
+from backend.application.interfaces.services.availability_cache import AvailabilityCache
+from backend.application.interfaces.unit_of_work import UnitOfWork
+from backend.core.models.notification_kind import NotificationKind
 
 if TYPE_CHECKING:
     pass
 
 class CancelAppointmentUseCase:
-    def __init__(self, appointment_repo: AppointmentRepository, user_repo: UserRepository, service_repo: ServiceRepository,
-                 notification_service: NotificationService):
+    def __init__(self, appointment_repo: AppointmentRepository, notification_outbox: NotificationOutboxRepository,
+                 unit_of_work: UnitOfWork, availability_cache: Optional[AvailabilityCache] = None):
         self.appointment_repo = appointment_repo
-        self.user_repo = user_repo
-        self.service_repo = service_repo
-        self.notification_service = notification_service
+        self.notification_outbox = notification_outbox
+        self.unit_of_work = unit_of_work
+        self.availability_cache = availability_cache
 
     async def execute(self, request: CancelAppointmentRequest) -> CancelAppointmentResponse:
         try:
-            appointment = await self.appointment_repo.find_by_cancellation_token(request.cancellation_token)
+            cancelled = await self.appointment_repo.cancel_by_token(request.cancellation_token)
+
+            if cancelled is None:
+                # Only the failure path pays for a second query, to tell the two errors apart.
+                appointment = await self.appointment_repo.find_by_cancellation_token(request.cancellation_token)
+                if not appointment:
+                    return CancelAppointmentResponse(
+                        success=False,
+                        message="Appointment not found or invalid token",
+                        error_code="APPOINTMENT_NOT_FOUND"
+                    )
 
-            if not appointment:
-                return CancelAppointmentResponse(
-                    success=False,
-                    message="Appointment not found or invalid token",
-                    error_code="APPOINTMENT_NOT_FOUND"
-                )
-
-            if appointment.status != AppointmentStatus.SCHEDULED:
                 return CancelAppointmentResponse(
                     success=False,
                     message="Cannot cancel an appointment that is not scheduled",
                     error_code="INVALID_STATUS_FOR_CANCELLATION"
                 )
 
-            appointment.cancel()
-
-            await self.appointment_repo.update(appointment)
-
-            #---
-
-            user = await self.user_repo.find_by_id(appointment.user_id)
-            if not user:
-                user_name = "Unknown User"
-                user_email_value = "unknown@example.com"
-            else:
-                user_name = user.name
-                user_email_value = user.email.value
-
-            service = await self.service_repo.find_by_id(appointment.service_id)
-            if not service:
-                service_name = "Unknown Service"
-                service_type = None
-                service_description = "N/A"
-            else:
-                service_name = service.name
-                service_type = service.service_type
-                service_description = service.description
+            await self._enqueue_cancellation_notification(cancelled)
+            await self.unit_of_work.commit()
 
-            appointment_details_for_email = {
-                "client_name": user_name,
-                "client_email": user_email_value,
-                "service_name": service_name,
-                "service_type": service_type,
-                "service_description": service_description,
-                "appointment_id": appointment.id,
-                "scheduled_start": appointment.scheduled_slot.start,
-                "scheduled_end": appointment.scheduled_slot.end,
-                "status": appointment.status,
-                "cancellation_token": appointment.cancellation_token,
-                "view_token": appointment.view_token,
-                "created_at": appointment.created_at,
-                "updated_at": appointment.updated_at
-            }
-
-            notification_sent = await self.notification_service.send_appointment_cancellation(
-                recipient=user_email_value,
-                details=appointment_details_for_email
-            )
-
-            if not notification_sent:
-                pass
-
-            #---
+            if self.availability_cache is not None:
+                await self.availability_cache.invalidate(
+                    cancelled.service_type,
+                    cancelled.scheduled_start,
+                    cancelled.scheduled_end
+                )
 
             return CancelAppointmentResponse(
                 success=True,
@@ -102,4 +65,27 @@ class CancelAppointmentUseCase:
                 success=False,
                 message="An internal error occurred while cancelling the appointment.",
                 error_code="INTERNAL_ERROR"
-            )
\ No newline at end of file
+            )
+
+    async def _enqueue_cancellation_notification(self, cancelled: CancelledAppointmentDTO) -> None:
+        appointment_details_for_email = {
+            "client_name": cancelled.client_name,
+            "client_email": cancelled.client_email,
+            "service_name": cancelled.service_name,
+            "service_type": cancelled.service_type,
+            "service_description": cancelled.service_description,
+            "appointment_id": cancelled.id,
+            "scheduled_start": cancelled.scheduled_start,
+            "scheduled_end": cancelled.scheduled_end,
+            "status": cancelled.status,
+            "cancellation_token": cancelled.cancellation_token,
+            "view_token": cancelled.view_token,
+            "created_at": cancelled.created_at,
+            "updated_at": cancelled.updated_at
+        }
+
+        await self.notification_outbox.enqueue(
+            NotificationKind.CANCELLATION,
+            recipient=cancelled.client_email,
+            details=appointment_details_for_email
+        )
@@ -0,0 +1,152 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from backend.application.dtos.available_slot_dto import AvailableSlotDTO
+from backend.application.dtos.find_next_available_slots_request import FindNextAvailableSlotsRequest
+from backend.application.dtos.find_next_available_slots_response import FindNextAvailableSlotsResponse
+from backend.application.interfaces.repositories.appointment_repository import AppointmentRepository
+from backend.application.interfaces.repositories.service_repository import ServiceRepository
+from backend.core.models.appointment import Appointment
+from backend.core.models.service import Service
+from backend.core.scheduling.interval_index import IntervalIndex
+from backend.core.value_objects.epoch_interval import from_epoch_micros, to_epoch_micros, to_micros
+
+logger = logging.getLogger(__name__)
+
+SLOT_ALIGNMENT = timedelta(minutes=15)
+
+class FindNextAvailableSlotsUseCase:
+    def __init__(self, appointment_repo: AppointmentRepository, service_repo: ServiceRepository,
+                 first_chunk: timedelta = timedelta(days=1), max_chunk: timedelta = timedelta(days=16)):
+        self.appointment_repo = appointment_repo
+        self.service_repo = service_repo
+        self.first_chunk = first_chunk
+        self.max_chunk = max_chunk
+
+    async def execute(self, request: FindNextAvailableSlotsRequest,
+                      now: Optional[datetime] = None) -> FindNextAvailableSlotsResponse:
+        try:
+            services = await self._resolve_services(request)
+            if not services:
+                return FindNextAvailableSlotsResponse(
+                    success=False,
+                    message="Service not found",
+                    error_code="SERVICE_NOT_FOUND"
+                )
+
+            now = self._as_utc(now or datetime.now(timezone.utc))
+            start = max(self._as_utc(request.after), now) if request.after is not None else now
+            slots = await self._search(services, start, start + timedelta(days=request.horizon_days), request.count)
+
+            return FindNextAvailableSlotsResponse(
+                success=True,
+                message=f"Found {len(slots)} available slots",
+                slots=slots
+            )
+
+        except ValueError as e:
+            return FindNextAvailableSlotsResponse(
+                success=False,
+                message=f"Validation error: {str(e)}",
+                error_code="VALIDATION_ERROR"
+            )
+        except Exception:
+            logger.exception("Error while searching for available slots")
+            return FindNextAvailableSlotsResponse(
+                success=False,
+                message="An internal error occurred while searching for available slots.",
+                error_code="INTERNAL_ERROR"
+            )
+
+    async def _resolve_services(self, request: FindNextAvailableSlotsRequest) -> Dict[str, Service]:
+        services: List[Service] = []
+        if request.service_id is not None:
+            service = await self.service_repo.find_by_id(request.service_id)
+            services = [service] if service else []
+        elif request.service_type is not None:
+            services = await self.service_repo.find_by_type(request.service_type)
+        return {service.id: service for service in services if service.id is not None}
+
+    async def _search(self, services: Dict[str, Service], start: datetime, horizon: datetime,
+                      count: int) -> List[AvailableSlotDTO]:
+        service_ids = list(services)
+        durations = {
+            service_id: to_micros(timedelta(minutes=service.duration_minutes))
+            for service_id, service in services.items()
+        }
+        longest = timedelta(minutes=max(service.duration_minutes for service in services.values()))
+        step = to_micros(SLOT_ALIGNMENT)
+        horizon_micros = to_epoch_micros(horizon)
+
+        # Chunks double in length, so a nearby answer costs one small query and a distant one only a few.
+        found: List[Tuple[int, int, str]] = []
+        # A slot found near the end of a chunk may run past it, so each service resumes after its last slot.
+        cursors = {service_id: to_epoch_micros(start) for service_id in service_ids}
+        chunk_start, chunk = start, self.first_chunk
+        while chunk_start < horizon:
+            chunk_end = min(chunk_start + chunk, horizon)
+            # Slots may start up to chunk_end, so bookings reaching one slot length past it must be loaded too.
+            appointments_by_service = await self.appointment_repo.find_scheduled_between_for_services(
+                start=chunk_start,
+                end=chunk_end + longest,
+                service_ids=service_ids
+            )
+
+            chunk_slots: List[Tuple[int, int, str]] = []
+            for service_id in service_ids:
+                service_slots = self._free_slots(
+                    appointments_by_service.get(service_id, []),
+                    max(cursors[service_id], to_epoch_micros(chunk_start)),
+                    to_epoch_micros(chunk_end),
+                    durations[service_id],
+                    step,
+                    horizon_micros,
+                    count - len(found),
+                    service_id
+                )
+                if service_slots:
+                    cursors[service_id] = service_slots[-1][1]
+                chunk_slots.extend(service_slots)
+
+            # Every slot of this chunk starts before any slot of a later one, so a full count ends the search.
+            found.extend(sorted(chunk_slots)[:count - len(found)])
+            if len(found) >= count:
+                break
+
+            chunk_start, chunk = chunk_end, min(chunk * 2, self.max_chunk)
+
+        return [
+            AvailableSlotDTO(
+                service_id=service_id,
+                service_name=services[service_id].name,
+                start=from_epoch_micros(slot_start),
+                end=from_epoch_micros(slot_end)
+            )
+            for slot_start, slot_end, service_id in found
+        ]
+
+    @staticmethod
+    def _free_slots(appointments: List[Appointment], after: int, chunk_end: int, duration: int, step: int,
+                    horizon: int, limit: int, service_id: str) -> List[Tuple[int, int, str]]:
+        index: IntervalIndex[Optional[str]] = IntervalIndex(
+            (to_epoch_micros(appointment.scheduled_slot.start), to_epoch_micros(appointment.scheduled_slot.end),
+             appointment.id)
+            for appointment in appointments
+        )
+
+        slots: List[Tuple[int, int, str]] = []
+        cursor = after
+        while len(slots) < limit:
+            slot_start = index.find_gap(cursor, duration, step=step, before=min(chunk_end + duration, horizon))
+            if slot_start is None or slot_start >= chunk_end:
+                break
+            slots.append((slot_start, slot_start + duration, service_id))
+            cursor = slot_start + duration
+        return slots
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        # Naive datetimes are read as UTC, as TimeSlot and the epoch helpers do.
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
@@ -1,23 +1,48 @@
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Optional
 from backend.application.dtos.get_availability_request import GetAvailabilityRequest
 from backend.application.dtos.get_availability_response import GetAvailabilityResponse
+from backend.application.dtos.service_availability_dto import ServiceAvailabilityDTO
 from backend.application.dtos.service_summary_dto import ServiceSummaryDTO
 from backend.application.dtos.time_slot_dto import TimeSlotDTO
 from backend.application.interfaces.repositories.appointment_repository import AppointmentRepository
 from backend.application.interfaces.repositories.service_repository import ServiceRepository
+from backend.application.interfaces.services.availability_cache import AvailabilityCache
+from backend.core.models.appointment import Appointment
+from backend.core.models.service import Service
 from backend.core.models.service_type import ServiceType
-from backend.core.value_objects.time_slot import TimeSlot
+from backend.core.scheduling.occupancy_calendar import OccupancyCalendar
+from backend.core.scheduling.slot_engine import SlotAvailability, SlotEngine
 
 if TYPE_CHECKING:
     pass
 
 class GetAvailabilityUseCase:
-    def __init__(self, appointment_repo: AppointmentRepository, service_repo: ServiceRepository):
+    def __init__(self, appointment_repo: AppointmentRepository, service_repo: ServiceRepository,
+                 availability_cache: Optional[AvailabilityCache] = None,
+                 occupancy_calendar: Optional[OccupancyCalendar] = None):
         self.appointment_repo = appointment_repo
         self.service_repo = service_repo
+        self.availability_cache = availability_cache
+        self.occupancy_calendar = occupancy_calendar
 
     async def execute(self, request: GetAvailabilityRequest) -> GetAvailabilityResponse:
+        generation = None
+        if self.availability_cache is not None:
+            cached_response = await self.availability_cache.get(request)
+            if cached_response is not None:
+                return cached_response
+            # Taken before the reads, so a booking that commits meanwhile keeps this response out of the cache.
+            generation = await self.availability_cache.generation()
+
+        response = await self._compute_availability(request)
+
+        if self.availability_cache is not None and response.available_services:
+            await self.availability_cache.set(request, response, generation)
+
+        return response
+
+    async def _compute_availability(self, request: GetAvailabilityRequest) -> GetAvailabilityResponse:
         service_type = request.service_type
         start_date = request.start_date
         end_date = request.end_date
@@ -30,40 +55,28 @@ class GetAvailabilityUseCase:
                 available_services=[]
             )
 
-        representative_service = available_services_list[0]
-        slot_duration_minutes = representative_service.duration_minutes
-        slot_duration = timedelta(minutes=slot_duration_minutes)
-
         service_ids = [service.id for service in available_services_list]
 
-        scheduled_appointments = []
-        for sid in service_ids:
-            appointments_for_service = await self.appointment_repo.find_scheduled_between(
+        appointments_by_service = None
+        if not self._occupancy_covers(available_services_list, request):
+            appointments_by_service = await self.appointment_repo.find_scheduled_between_for_services(
                 start=start_date,
                 end=end_date,
-                service_id=sid
+                service_ids=service_ids
             )
-            scheduled_appointments.extend(appointments_for_service)
 
         time_slots = []
-        current_start = start_date
-
-        while current_start < end_date:
-            current_end = current_start + slot_duration
-
-            is_available = True
-            for scheduled_appt in scheduled_appointments:
-                requested_slot_vo = TimeSlot(start=current_start, end=current_end)
-                existing_slot_vo = scheduled_appt.scheduled_slot
-
-                if requested_slot_vo.overlaps(existing_slot_vo):
-                    is_available = False
-                    break
-
-            time_slot_dto = TimeSlotDTO(start=current_start, end=current_end, is_available=is_available)
-            time_slots.append(time_slot_dto)
+        service_availability = {}
+        if request.per_service:
+            service_availability = self._compute_per_service_availability(
+                available_services_list, appointments_by_service, request
+            )
+        else:
+            representative_service = available_services_list[0]
+            slot_duration = timedelta(minutes=representative_service.duration_minutes)
 
-            current_start = current_end
+            slots = self._compute_slots(service_ids, appointments_by_service, start_date, end_date, slot_duration)
+            time_slots = self._to_time_slot_dtos(slots, request.only_available)
 
         available_services_dtos = []
         for service in available_services_list:
@@ -83,5 +96,72 @@ class GetAvailabilityUseCase:
         return GetAvailabilityResponse(
             service_type=service_type,
             time_slots=time_slots,
-            available_services=available_services_dtos
-        )
\ No newline at end of file
+            available_services=available_services_dtos,
+            service_availability=service_availability
+        )
+
+    def _compute_per_service_availability(
+            self,
+            services: List[Service],
+            appointments_by_service: Optional[Dict[str, List[Appointment]]],
+            request: GetAvailabilityRequest
+    ) -> Dict[str, ServiceAvailabilityDTO]:
+        return {
+            service.id: ServiceAvailabilityDTO(
+                service_id=service.id,
+                duration_minutes=service.duration_minutes,
+                time_slots=self._to_time_slot_dtos(
+                    self._compute_slots(
+                        [service.id],
+                        appointments_by_service,
+                        request.start_date,
+                        request.end_date,
+                        timedelta(minutes=service.duration_minutes)
+                    ),
+                    request.only_available
+                )
+            )
+            for service in services
+        }
+
+    def _occupancy_covers(self, services: List[Service], request: GetAvailabilityRequest) -> bool:
+        if self.occupancy_calendar is None:
+            return False
+
+        service_ids = [service.id for service in services]
+        slot_services = services if request.per_service else services[:1]
+        return all(
+            self.occupancy_calendar.can_compute_slots(
+                service_ids, request.start_date, request.end_date, timedelta(minutes=service.duration_minutes)
+            )
+            for service in slot_services
+        )
+
+    def _compute_slots(
+            self,
+            service_ids: List[str],
+            appointments_by_service: Optional[Dict[str, List[Appointment]]],
+            start: datetime,
+            end: datetime,
+            slot_duration: timedelta
+    ) -> List[SlotAvailability]:
+        if appointments_by_service is None:
+            occupancy_calendar = self.occupancy_calendar
+            if occupancy_calendar is None:
+                raise ValueError("Appointments are required when no occupancy calendar is configured")
+            return occupancy_calendar.compute_slots(service_ids, start, end, slot_duration)
+
+        busy_slots = [
+            appointment.scheduled_slot
+            for service_id in service_ids
+            for appointment in appointments_by_service.get(service_id, [])
+        ]
+        return SlotEngine(busy_slots).compute_slots(start, end, slot_duration)
+
+    @staticmethod
+    def _to_time_slot_dtos(slots: List[SlotAvailability], only_available: bool) -> List[TimeSlotDTO]:
+        return [
+            TimeSlotDTO(start=slot_start, end=slot_end, is_available=is_available)
+            for slot_start, slot_end, is_available in slots
+            if is_available or not only_available
+        ]
\ No newline at end of file
@@ -1,11 +1,12 @@
 from typing import TYPE_CHECKING
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
-import bcrypt
 import os
 from backend.application.dtos.login_request import LoginRequest
 from backend.application.dtos.login_response import LoginResponse
 from backend.application.interfaces.repositories.user_repository import UserRepository
+from backend.application.interfaces.services.password_hasher import PasswordHasher
+from backend.core.exceptions.password_hasher_saturated_error import PasswordHasherSaturatedError
 from backend.core.models.user import User
 
 if TYPE_CHECKING:
@@ -16,8 +17,9 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 class LoginUseCase:
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, password_hasher: PasswordHasher):
         self.user_repo = user_repo
+        self.password_hasher = password_hasher
 
     async def execute(self, request: LoginRequest) -> LoginResponse:
         try:
@@ -30,10 +32,7 @@ class LoginUseCase:
                     error_code="INVALID_CREDENTIALS"
                 )
 
-            stored_hash = user.hashed_password.value
-            provided_password = request.password.encode("utf-8")
-
-            if not bcrypt.checkpw(provided_password, stored_hash.encode("utf-8")):
+            if not await self.password_hasher.verify(request.password, user.hashed_password.value):
                 return LoginResponse(
                     success=False,
                     message="Invalid email or password",
@@ -59,6 +58,13 @@ class LoginUseCase:
                 user_id=user.id
             )
 
+        except PasswordHasherSaturatedError as e:
+            return LoginResponse(
+                success=False,
+                message=str(e),
+                error_code="SERVICE_UNAVAILABLE"
+            )
+
         except JWTError:
             return LoginResponse(
                 success=False,
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from backend.application.dtos.register_service_request import RegisterServiceRequest
 from backend.application.dtos.register_service_response import RegisterServiceResponse
 from backend.application.interfaces.repositories.service_repository import ServiceRepository
+from backend.application.interfaces.unit_of_work import UnitOfWork
 from backend.core.models.service import Service
 import uuid
 
@@ -10,8 +11,9 @@ if TYPE_CHECKING:
     pass
 
 class RegisterServiceUseCase:
-    def __init__(self, service_repo: ServiceRepository):
+    def __init__(self, service_repo: ServiceRepository, unit_of_work: UnitOfWork):
         self.service_repo = service_repo
+        self.unit_of_work = unit_of_work
 
     async def execute(self, request: RegisterServiceRequest) -> RegisterServiceResponse:
         try:
@@ -25,6 +27,7 @@ class RegisterServiceUseCase:
             )
 
             saved_service = await self.service_repo.save(new_service)
+            await self.unit_of_work.commit()
 
             return RegisterServiceResponse(
                 success=True,
@@ -2,26 +2,28 @@ from typing import TYPE_CHECKING
 from backend.application.dtos.register_user_request import RegisterUserRequest
 from backend.application.dtos.register_user_response import RegisterUserResponse
 from backend.application.interfaces.repositories.user_repository import UserRepository
+from backend.application.interfaces.services.password_hasher import PasswordHasher
+from backend.application.interfaces.unit_of_work import UnitOfWork
+from backend.core.exceptions.password_hasher_saturated_error import PasswordHasherSaturatedError
 from backend.core.models.user import User
 from backend.core.value_objects.email import Email
 from backend.core.value_objects.hashed_password import HashedPassword
-import bcrypt
 
 if TYPE_CHECKING:
     pass
 
 class RegisterUserUseCase:
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, unit_of_work: UnitOfWork, password_hasher: PasswordHasher):
         self.user_repo = user_repo
+        self.unit_of_work = unit_of_work
+        self.password_hasher = password_hasher
 
     async def execute(self, request: RegisterUserRequest) -> RegisterUserResponse:
         try:
             if len(request.password) < 8:
                 raise ValueError("Password must be at least 8 characters long")
 
-            salt = bcrypt.gensalt()
-            password_hash_bytes = bcrypt.hashpw(request.password.encode('utf-8'), salt)
-            password_hash_str = password_hash_bytes.decode('utf-8')
+            password_hash_str = await self.password_hasher.hash(request.password)
 
             user_entity = User(
                 id=None,
@@ -32,6 +34,7 @@ class RegisterUserUseCase:
             )
 
             saved_user = await self.user_repo.save(user_entity)
+            await self.unit_of_work.commit()
 
             return RegisterUserResponse(
                 success=True,
@@ -46,6 +49,13 @@ class RegisterUserUseCase:
                 error_code="VALIDATION_ERROR"
             )
 
+        except PasswordHasherSaturatedError as e:
+            return RegisterUserResponse(
+                success=False,
+                message=str(e),
+                error_code="SERVICE_UNAVAILABLE"
+            )
+
         except Exception as e:
             error_msg = str(e).lower()
             if "duplicate" in error_msg and "email" in error_msg:
@@ -0,0 +1,63 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from backend.application.dtos.send_appointment_reminders_response import SendAppointmentRemindersResponse
+from backend.application.interfaces.repositories.appointment_repository import AppointmentRepository
+from backend.application.interfaces.repositories.notification_outbox_repository import NotificationOutboxRepository
+from backend.application.interfaces.unit_of_work import UnitOfWork
+from backend.core.models.notification_kind import NotificationKind
+
+logger = logging.getLogger(__name__)
+
+class SendAppointmentRemindersUseCase:
+    def __init__(self, appointment_repo: AppointmentRepository, notification_outbox: NotificationOutboxRepository,
+                 unit_of_work: UnitOfWork, lead_time: timedelta = timedelta(hours=24), batch_size: int = 200):
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+
+        self.appointment_repo = appointment_repo
+        self.notification_outbox = notification_outbox
+        self.unit_of_work = unit_of_work
+        self.lead_time = lead_time
+        self.batch_size = batch_size
+
+    async def execute(self, now: Optional[datetime] = None) -> SendAppointmentRemindersResponse:
+        now = now or datetime.now(timezone.utc)
+        window_end = now + self.lead_time
+        queued_count = 0
+
+        try:
+            # Batches are claimed one at a time so memory stays bounded by batch_size however many are due.
+            while True:
+                reminders = await self.appointment_repo.claim_due_reminders(now, window_end, self.batch_size)
+                if not reminders:
+                    break
+
+                # Each claim commits together with its outbox rows, so a crash never leaves a reminder
+                # marked sent without a message for the outbox worker to deliver and retry.
+                for reminder in reminders:
+                    await self.notification_outbox.enqueue(
+                        NotificationKind.REMINDER,
+                        recipient=reminder.client_email,
+                        details=reminder.model_dump()
+                    )
+                await self.unit_of_work.commit()
+                queued_count += len(reminders)
+
+                if len(reminders) < self.batch_size:
+                    break
+        except Exception:
+            logger.exception("Error while queueing appointment reminders")
+            await self.unit_of_work.rollback()
+            return SendAppointmentRemindersResponse(
+                success=False,
+                message="An internal error occurred while queueing appointment reminders.",
+                queued_count=queued_count,
+                error_code="INTERNAL_ERROR"
+            )
+
+        return SendAppointmentRemindersResponse(
+            success=True,
+            message=f"Queued {queued_count} appointment reminders",
+            queued_count=queued_count
+        )
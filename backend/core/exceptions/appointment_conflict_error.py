@@ -0,0 +1,10 @@
+class AppointmentConflictError(Exception):
+    pass
+
+class ServiceTimeSlotConflictError(AppointmentConflictError):
+    def __init__(self, message: str = "The requested time slot is not available for this service"):
+        super().__init__(message)
+
+class UserTimeSlotConflictError(AppointmentConflictError):
+    def __init__(self, message: str = "The requested time slot conflicts with another appointment for this user"):
+        super().__init__(message)
@@ -0,0 +1,3 @@
+class PasswordHasherSaturatedError(Exception):
+    def __init__(self, message: str = "Password hashing capacity is exhausted, please retry shortly"):
+        super().__init__(message)
@@ -4,9 +4,10 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.service_type import ServiceType
 from backend.core.value_objects.time_slot import TimeSlot
 
-@dataclass
+@dataclass(slots=True)
 class Appointment:
     id: Optional[str]
     user_id: str
@@ -17,6 +18,7 @@ class Appointment:
     cancellation_token: Optional[str] = None
     created_at: datetime = None
     updated_at: datetime = None
+    service_type: Optional[ServiceType] = None
 
     def __post_init__(self):
         if not self.user_id:
@@ -32,6 +34,24 @@ class Appointment:
         if self.cancellation_token is None:
             self.cancellation_token = str(uuid.uuid4())
 
+    @classmethod
+    def from_trusted(cls, id: str, user_id: str, service_id: str, scheduled_slot: TimeSlot,
+                     status: AppointmentStatus, view_token: str, cancellation_token: str, created_at: datetime,
+                     updated_at: datetime, service_type: Optional[ServiceType]) -> "Appointment":
+        """Rehydrate a stored appointment without re-running the checks and defaults applied when it was created."""
+        appointment = object.__new__(cls)
+        appointment.id = id
+        appointment.user_id = user_id
+        appointment.service_id = service_id
+        appointment.scheduled_slot = scheduled_slot
+        appointment.status = status
+        appointment.view_token = view_token
+        appointment.cancellation_token = cancellation_token
+        appointment.created_at = created_at
+        appointment.updated_at = updated_at
+        appointment.service_type = service_type
+        return appointment
+
     def cancel(self) -> None:
         if self.status != AppointmentStatus.SCHEDULED:
             raise ValueError("Cannot cancel an appointment that is not scheduled")
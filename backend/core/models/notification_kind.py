@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+class NotificationKind(StrEnum):
+    CONFIRMATION = "confirmation"
+    REMINDER = "reminder"
+    CANCELLATION = "cancellation"
@@ -5,7 +5,7 @@ from backend.core.value_objects.email import Email
 from backend.core.value_objects.hashed_password import HashedPassword
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: Optional[str]
     name: str
@@ -34,6 +34,20 @@ class User:
         if self.updated_at is None:
             self.updated_at = datetime.now(timezone.utc)
 
+    @classmethod
+    def from_trusted(cls, id: str, name: str, email: Email, phone: Optional[str], hashed_password: HashedPassword,
+                     created_at: datetime, updated_at: datetime) -> "User":
+        """Rehydrate a stored user without re-running the checks it passed when it was saved."""
+        user = object.__new__(cls)
+        user.id = id
+        user.name = name
+        user.email = email
+        user.phone = phone
+        user.hashed_password = hashed_password
+        user.created_at = created_at
+        user.updated_at = updated_at
+        return user
+
     def update_profile(self, name: Optional[str] = None, email: Optional[Email] = None, phone: Optional[str] = None):
         if name is not None:
             self.name = name.strip()
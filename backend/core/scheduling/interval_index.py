@@ -0,0 +1,193 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+IndexedInterval = Tuple[int, int, K]
+
+
+class IntervalIndex(Generic[K]):
+    """Half-open integer intervals (e.g. epoch microseconds) answering overlap and free-gap queries.
+
+    Intervals are kept in arrays sorted by start. Because no interval is longer
+    than the longest one stored, an overlap query only has to look at starts in
+    ``(a - longest, b)``, found by bisection. The union of the intervals is kept
+    as sorted, disjoint busy blocks, and a max-tree over the gaps between
+    blocks finds the first gap of a given length in O(log n).
+
+    Inserts and removals bisect to their position; the list shifts are
+    memmoves, and the gap tree is rebuilt lazily on the next gap query.
+    """
+
+    def __init__(self, intervals: Iterable[IndexedInterval] = ()):
+        entries = sorted(intervals, key=lambda entry: (entry[0], entry[1]))
+        for start, end, _ in entries:
+            self._check(start, end)
+
+        self._starts: List[int] = [start for start, _, _ in entries]
+        self._ends: List[int] = [end for _, end, _ in entries]
+        self._keys: List[K] = [key for _, _, key in entries]
+        self._length_counts: Dict[int, int] = {}
+        for start, end, _ in entries:
+            self._length_counts[end - start] = self._length_counts.get(end - start, 0) + 1
+        self._max_length = max(self._length_counts, default=0)
+
+        self._block_starts: List[int] = []
+        self._block_ends: List[int] = []
+        for start, end in zip(self._starts, self._ends):
+            if self._block_ends and start <= self._block_ends[-1]:
+                self._block_ends[-1] = max(self._block_ends[-1], end)
+            else:
+                self._block_starts.append(start)
+                self._block_ends.append(end)
+        self._gap_tree: Optional[_FirstAtLeastTree] = None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def blocks(self) -> List[Tuple[int, int]]:
+        """Disjoint busy blocks covering the union of the intervals, in order."""
+        return list(zip(self._block_starts, self._block_ends))
+
+    def insert(self, start: int, end: int, key: K) -> None:
+        self._check(start, end)
+        position = bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._ends.insert(position, end)
+        self._keys.insert(position, key)
+
+        length = end - start
+        self._length_counts[length] = self._length_counts.get(length, 0) + 1
+        self._max_length = max(self._max_length, length)
+
+        # Blocks touching [start, end) collapse into one, so adjacent bookings leave no zero-length gap.
+        first = bisect_left(self._block_ends, start)
+        last = bisect_right(self._block_starts, end)
+        if first < last:
+            start = min(start, self._block_starts[first])
+            end = max(end, self._block_ends[last - 1])
+        self._block_starts[first:last] = [start]
+        self._block_ends[first:last] = [end]
+        self._gap_tree = None
+
+    def remove(self, start: int, end: int, key: K) -> bool:
+        position = bisect_left(self._starts, start)
+        while position < len(self._starts) and self._starts[position] == start:
+            if self._ends[position] == end and self._keys[position] == key:
+                break
+            position += 1
+        else:
+            return False
+
+        del self._starts[position]
+        del self._ends[position]
+        del self._keys[position]
+
+        length = end - start
+        self._length_counts[length] -= 1
+        if not self._length_counts[length]:
+            del self._length_counts[length]
+            if length == self._max_length:
+                self._max_length = max(self._length_counts, default=0)
+
+        # Only the block that held the interval can change; rebuild it from the intervals starting inside it.
+        block = bisect_right(self._block_starts, start) - 1
+        block_start, block_end = self._block_starts[block], self._block_ends[block]
+        pieces_starts: List[int] = []
+        pieces_ends: List[int] = []
+        for index in range(bisect_left(self._starts, block_start), bisect_left(self._starts, block_end)):
+            piece_start, piece_end = self._starts[index], self._ends[index]
+            if pieces_ends and piece_start <= pieces_ends[-1]:
+                pieces_ends[-1] = max(pieces_ends[-1], piece_end)
+            else:
+                pieces_starts.append(piece_start)
+                pieces_ends.append(piece_end)
+        self._block_starts[block:block + 1] = pieces_starts
+        self._block_ends[block:block + 1] = pieces_ends
+        self._gap_tree = None
+        return True
+
+    def overlapping(self, start: int, end: int) -> List[IndexedInterval]:
+        """Every stored interval that overlaps [start, end), ordered by start."""
+        first = bisect_right(self._starts, start - self._max_length)
+        last = bisect_left(self._starts, end)
+        return [
+            (self._starts[index], self._ends[index], self._keys[index])
+            for index in range(first, last)
+            if self._ends[index] > start
+        ]
+
+    def is_free(self, start: int, end: int) -> bool:
+        block = bisect_right(self._block_starts, start) - 1
+        if block >= 0 and self._block_ends[block] > start:
+            return False
+        return block + 1 == len(self._block_starts) or self._block_starts[block + 1] >= end
+
+    def find_gap(self, after: int, length: int, step: int = 1, before: Optional[int] = None) -> Optional[int]:
+        """Earliest start >= ``after`` of a free [start, start + length), or None if it would end past ``before``.
+
+        Starts are aligned to multiples of ``step``.
+        """
+        if length <= 0 or step <= 0:
+            raise ValueError("Gap length and step must be positive")
+
+        block_count = len(self._block_starts)
+        cursor = after
+        while True:
+            candidate = -(-cursor // step) * step
+            if before is not None and candidate + length > before:
+                return None
+
+            next_block = bisect_right(self._block_starts, candidate)
+            if next_block and self._block_ends[next_block - 1] > candidate:
+                cursor = self._block_ends[next_block - 1]
+                continue
+            if next_block == block_count or self._block_starts[next_block] >= candidate + length:
+                return candidate
+
+            # Jump to the end of the block before the first later gap that is wide enough, ignoring alignment.
+            gap = self._gaps().first_at_least(next_block, length)
+            cursor = self._block_ends[gap if gap is not None else block_count - 1]
+
+    def _gaps(self) -> "_FirstAtLeastTree":
+        if self._gap_tree is None:
+            self._gap_tree = _FirstAtLeastTree([
+                next_start - end for end, next_start in zip(self._block_ends, self._block_starts[1:])
+            ])
+        return self._gap_tree
+
+    @staticmethod
+    def _check(start: int, end: int) -> None:
+        if start >= end:
+            raise ValueError("Start time must be before end time")
+
+
+class _FirstAtLeastTree:
+    """Max segment tree answering "first index >= i whose value is >= v" in O(log n)."""
+
+    def __init__(self, values: List[int]):
+        self._count = len(values)
+        self._size = 1
+        while self._size < max(1, self._count):
+            self._size *= 2
+        self._tree = [-1] * (2 * self._size)
+        self._tree[self._size:self._size + self._count] = values
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def first_at_least(self, first: int, value: int) -> Optional[int]:
+        if first >= self._count:
+            return None
+        return self._descend(1, 0, self._size, first, value)
+
+    def _descend(self, node: int, node_first: int, node_end: int, first: int, value: int) -> Optional[int]:
+        if node_end <= first or self._tree[node] < value:
+            return None
+        if node >= self._size:
+            return node - self._size
+        middle = (node_first + node_end) // 2
+        found = self._descend(2 * node, node_first, middle, first, value)
+        if found is not None:
+            return found
+        return self._descend(2 * node + 1, middle, node_end, first, value)
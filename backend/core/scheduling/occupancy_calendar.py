@@ -0,0 +1,159 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from backend.core.models.appointment import Appointment
+from backend.core.scheduling.slot_engine import SlotAvailability
+from backend.core.value_objects.time_slot import TimeSlot
+
+CELL_MINUTES = 15
+CELLS_PER_DAY = 24 * 60 // CELL_MINUTES
+CELL = timedelta(minutes=CELL_MINUTES)
+
+Bucket = Tuple[str, date]
+
+
+class OccupancyCalendar:
+    """Per-service, per-day occupancy bitmaps on a 15-minute UTC grid.
+
+    Bit ``i`` of a day's bitmap is set when the cell starting ``i * 15``
+    minutes after midnight is booked. Buckets that received an off-grid or
+    overlapping booking can no longer be released exactly, so they are
+    flagged and callers fall back to range queries until the next rebuild.
+    """
+
+    def __init__(self):
+        self._bitmaps: Dict[Bucket, int] = {}
+        self._inexact: Set[Bucket] = set()
+        self._loaded_from: Optional[date] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_from is not None
+
+    def rebuild(self, appointments: Iterable[Appointment], loaded_from: datetime) -> None:
+        """Replace the bitmaps with the given scheduled appointments, authoritative from ``loaded_from``'s day on."""
+        self._bitmaps = {}
+        self._inexact = set()
+        for appointment in appointments:
+            self.occupy(appointment.service_id, appointment.scheduled_slot)
+        self._loaded_from = self._as_utc(loaded_from).date()
+
+    def occupy(self, service_id: str, slot: TimeSlot) -> None:
+        exact = self.is_aligned(slot.start) and self.is_aligned(slot.end)
+        for day, mask in self._masks(slot.start, slot.end):
+            bucket = (service_id, day)
+            current = self._bitmaps.get(bucket, 0)
+            if not exact or current & mask:
+                self._inexact.add(bucket)
+            self._bitmaps[bucket] = current | mask
+
+    def release(self, service_id: str, slot: TimeSlot) -> None:
+        for day, mask in self._masks(slot.start, slot.end):
+            bucket = (service_id, day)
+            remaining = self._bitmaps.get(bucket, 0) & ~mask
+            if remaining:
+                self._bitmaps[bucket] = remaining
+            else:
+                self._bitmaps.pop(bucket, None)
+
+    def is_authoritative(self, service_ids: Iterable[str], start: datetime, end: datetime) -> bool:
+        """Whether the bitmaps alone can answer queries about [start, end) for these services."""
+        if self._loaded_from is None:
+            return False
+        if not (self.is_aligned(start) and self.is_aligned(end)):
+            return False
+
+        days = self._days(start, end)
+        if days[0] < self._loaded_from:
+            return False
+
+        if self._inexact:
+            service_id_set = set(service_ids)
+            first_day, last_day = days[0], days[-1]
+            for service_id, day in self._inexact:
+                if service_id in service_id_set and first_day <= day <= last_day:
+                    return False
+        return True
+
+    def can_compute_slots(
+            self,
+            service_ids: Iterable[str],
+            start: datetime,
+            end: datetime,
+            slot_duration: timedelta
+    ) -> bool:
+        if slot_duration <= timedelta(0) or slot_duration % CELL:
+            return False
+        slot_count = -((start - end) // slot_duration)
+        return self.is_authoritative(service_ids, start, start + slot_count * slot_duration)
+
+    def is_free(self, service_id: str, start: datetime, end: datetime) -> bool:
+        for day, mask in self._masks(start, end):
+            if self._bitmaps.get((service_id, day), 0) & mask:
+                return False
+        return True
+
+    def compute_slots(
+            self,
+            service_ids: List[str],
+            start: datetime,
+            end: datetime,
+            slot_duration: timedelta
+    ) -> List[SlotAvailability]:
+        """Same contract as SlotEngine.compute_slots, answered from the bitmaps of the given services."""
+        if slot_duration <= timedelta(0):
+            raise ValueError("Slot duration must be positive")
+
+        combined: Dict[date, int] = {}
+
+        def occupancy(day: date) -> int:
+            if day not in combined:
+                bitmap = 0
+                for service_id in service_ids:
+                    bitmap |= self._bitmaps.get((service_id, day), 0)
+                combined[day] = bitmap
+            return combined[day]
+
+        slots = []
+        current_start = start
+        while current_start < end:
+            current_end = current_start + slot_duration
+            is_available = all(
+                not occupancy(day) & mask for day, mask in self._masks(current_start, current_end)
+            )
+            slots.append((current_start, current_end, is_available))
+            current_start = current_end
+
+        return slots
+
+    @staticmethod
+    def is_aligned(value: datetime) -> bool:
+        value = OccupancyCalendar._as_utc(value)
+        return value.second == 0 and value.microsecond == 0 and value.minute % CELL_MINUTES == 0
+
+    @staticmethod
+    def _masks(start: datetime, end: datetime) -> List[Tuple[date, int]]:
+        """Bitmask of the cells touched by [start, end) for every UTC day it spans."""
+        start = OccupancyCalendar._as_utc(start)
+        end = OccupancyCalendar._as_utc(end)
+
+        masks = []
+        for day in OccupancyCalendar._days(start, end):
+            day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+            first_cell = max(0, (start - day_start) // CELL)
+            last_cell = min(CELLS_PER_DAY, -((day_start - end) // CELL))
+            if last_cell > first_cell:
+                masks.append((day, (1 << last_cell) - (1 << first_cell)))
+        return masks
+
+    @staticmethod
+    def _days(start: datetime, end: datetime) -> List[date]:
+        start_day = OccupancyCalendar._as_utc(start).date()
+        end_day = (OccupancyCalendar._as_utc(end) - timedelta(microseconds=1)).date()
+        return [start_day + timedelta(days=offset) for offset in range((end_day - start_day).days + 1)]
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from typing import Iterable, List, Tuple
+
+from backend.core.value_objects.epoch_interval import to_epoch_micros, to_micros
+from backend.core.value_objects.time_slot import TimeSlot
+
+SlotAvailability = Tuple[datetime, datetime, bool]
+
+
+class SlotEngine:
+    """Computes the availability of a slot grid against a set of busy intervals.
+
+    Busy intervals are sorted and merged once; the grid is then swept together
+    with them, so a window costs O(slots + intervals log intervals). The sweep
+    compares integer epoch microseconds, and datetimes are only built for the output.
+    """
+
+    def __init__(self, busy_slots: Iterable[TimeSlot]):
+        self._busy = self._merge(
+            (to_epoch_micros(slot.start), to_epoch_micros(slot.end)) for slot in busy_slots
+        )
+
+    def compute_slots(self, start: datetime, end: datetime, slot_duration: timedelta) -> List[SlotAvailability]:
+        """Split [start, end) into consecutive slots and flag the ones that overlap a busy interval."""
+        if slot_duration <= timedelta(0):
+            raise ValueError("Slot duration must be positive")
+
+        busy_starts, busy_ends = self._busy
+        busy_count = len(busy_starts)
+        busy_index = 0
+
+        step = to_micros(slot_duration)
+        current_micros = to_epoch_micros(start)
+        end_micros = to_epoch_micros(end)
+
+        slots = []
+        current_start = start
+        while current_micros < end_micros:
+            current_end = current_start + slot_duration
+            current_end_micros = current_micros + step
+
+            while busy_index < busy_count and busy_ends[busy_index] <= current_micros:
+                busy_index += 1
+
+            is_available = busy_index == busy_count or busy_starts[busy_index] >= current_end_micros
+            slots.append((current_start, current_end, is_available))
+
+            current_start = current_end
+            current_micros = current_end_micros
+
+        return slots
+
+    @staticmethod
+    def _merge(busy_intervals: Iterable[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+        starts: List[int] = []
+        ends: List[int] = []
+        for interval_start, interval_end in sorted(busy_intervals):
+            if ends and interval_start <= ends[-1]:
+                if interval_end > ends[-1]:
+                    ends[-1] = interval_end
+            else:
+                starts.append(interval_start)
+                ends.append(interval_end)
+        return starts, ends
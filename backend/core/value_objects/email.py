@@ -1,14 +1,21 @@
 from dataclasses import dataclass
 from email_validator import validate_email, EmailNotValidError
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email:
     value: str
 
+    @classmethod
+    def trusted(cls, value: str) -> "Email":
+        """Wrap an address that was already validated and normalized, e.g. one read back from our database."""
+        email = object.__new__(cls)
+        object.__setattr__(email, "value", value)
+        return email
+
     def __post_init__(self):
         try:
             validated = validate_email(self.value, check_deliverability=False)
             normalized_email = validated.normalized
             object.__setattr__(self, "value", normalized_email)
         except EmailNotValidError:
-            raise ValueError(f"Invalid email: {self.value}")
\ No newline at end of file
+            raise ValueError(f"Invalid email: {self.value}")
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+from backend.core.value_objects.time_slot import TimeSlot
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """UTC microseconds since the Unix epoch; naive datetimes are read as UTC, like TimeSlot does."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // MICROSECOND
+
+
+def from_epoch_micros(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+def to_micros(value: timedelta) -> int:
+    return value // MICROSECOND
+
+
+class EpochInterval:
+    """Half-open [start, end) held as integer UTC epoch microseconds.
+
+    A compact stand-in for TimeSlot in scheduling loops: two ints instead of
+    two timezone-aware datetimes, and comparisons that never touch tzinfo.
+    Instances are treated as immutable.
+    """
+
+    __slots__ = ("start", "end")
+
+    def __init__(self, start: int, end: int):
+        if start >= end:
+            raise ValueError("Start time must be before end time")
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def from_time_slot(cls, slot: TimeSlot) -> "EpochInterval":
+        return cls(to_epoch_micros(slot.start), to_epoch_micros(slot.end))
+
+    @classmethod
+    def from_datetimes(cls, start: datetime, end: datetime) -> "EpochInterval":
+        return cls(to_epoch_micros(start), to_epoch_micros(end))
+
+    def to_time_slot(self) -> TimeSlot:
+        return TimeSlot.trusted(from_epoch_micros(self.start), from_epoch_micros(self.end))
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    def overlaps(self, other: "EpochInterval") -> bool:
+        return self.start < other.end and other.start < self.end
+
+    def contains(self, instant: int) -> bool:
+        return self.start <= instant < self.end
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EpochInterval):
+            return NotImplemented
+        return self.start == other.start and self.end == other.end
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.end))
+
+    def __repr__(self) -> str:
+        return f"EpochInterval(start={self.start}, end={self.end})"
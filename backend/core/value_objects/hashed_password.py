@@ -1,10 +1,17 @@
 from dataclasses import dataclass
 import re
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HashedPassword:
     value: str
 
+    @classmethod
+    def trusted(cls, value: str) -> "HashedPassword":
+        """Wrap a hash that was already validated, e.g. one read back from our database."""
+        hashed_password = object.__new__(cls)
+        object.__setattr__(hashed_password, "value", value)
+        return hashed_password
+
     def __post_init__(self):
         if not self.value:
             raise ValueError("Hashed password cannot be empty")
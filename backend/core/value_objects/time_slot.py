@@ -1,11 +1,19 @@
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeSlot:
     start: datetime
     end: datetime
 
+    @classmethod
+    def trusted(cls, start: datetime, end: datetime) -> "TimeSlot":
+        """Build a slot from timezone-aware bounds that are known to be ordered, e.g. a stored appointment."""
+        slot = object.__new__(cls)
+        object.__setattr__(slot, "start", start)
+        object.__setattr__(slot, "end", end)
+        return slot
+
     def __post_init__(self):
         # Converter para offset-aware (UTC) se necessário
         if self.start.tzinfo is None:
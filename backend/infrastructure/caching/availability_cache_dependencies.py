@@ -0,0 +1,11 @@
+import os
+from backend.application.interfaces.services.availability_cache import AvailabilityCache
+from backend.infrastructure.caching.in_memory_availability_cache import InMemoryAvailabilityCache
+
+availability_cache = InMemoryAvailabilityCache(
+    max_entries=int(os.getenv("AVAILABILITY_CACHE_MAX_ENTRIES", 1024)),
+    ttl_seconds=float(os.getenv("AVAILABILITY_CACHE_TTL_SECONDS", 30))
+)
+
+def get_availability_cache() -> AvailabilityCache:
+    return availability_cache
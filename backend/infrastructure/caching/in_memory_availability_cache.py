@@ -0,0 +1,103 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+from backend.application.dtos.get_availability_request import GetAvailabilityRequest
+from backend.application.dtos.get_availability_response import GetAvailabilityResponse
+from backend.application.interfaces.services.availability_cache import AvailabilityCache
+from backend.core.models.service_type import ServiceType
+from backend.infrastructure.caching.ttl_lru_cache import TTLLRUCache
+
+DayBucket = Tuple[ServiceType, date]
+
+class InMemoryAvailabilityCache(AvailabilityCache):
+    """Per-process availability cache.
+
+    Entries are keyed by the full request (service type, window and response
+    options) and indexed by the (service type, UTC day) buckets the window
+    covers, so a write only drops the windows that include its day. Every
+    invalidation also bumps a generation counter, so a response computed from
+    reads that raced with a write is not stored.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 30.0):
+        self._entries: TTLLRUCache[Hashable, GetAvailabilityResponse] = TTLLRUCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            on_remove=self._unindex
+        )
+        self._keys_by_bucket: Dict[DayBucket, Set[Hashable]] = defaultdict(set)
+        self._buckets_by_key: Dict[Hashable, List[DayBucket]] = {}
+        self._generation = 0
+        self.invalidations = 0
+        self.stale_sets = 0
+
+    async def get(self, request: GetAvailabilityRequest) -> Optional[GetAvailabilityResponse]:
+        return self._entries.get(self._key(request))
+
+    async def generation(self) -> int:
+        return self._generation
+
+    async def set(self, request: GetAvailabilityRequest, response: GetAvailabilityResponse,
+                  generation: Optional[int] = None) -> None:
+        if generation is not None and generation != self._generation:
+            self.stale_sets += 1
+            return
+
+        key = self._key(request)
+        if key not in self._buckets_by_key:
+            buckets = [(request.service_type, day) for day in self._days(request.start_date, request.end_date)]
+            self._buckets_by_key[key] = buckets
+            for bucket in buckets:
+                self._keys_by_bucket[bucket].add(key)
+        self._entries.set(key, response)
+
+    async def invalidate(self, service_type: Optional[ServiceType], start: datetime, end: datetime) -> int:
+        self._generation += 1
+        service_types = [service_type] if service_type is not None else list(ServiceType)
+
+        stale_keys: Set[Hashable] = set()
+        for day in self._days(start, end):
+            for current_type in service_types:
+                stale_keys.update(self._keys_by_bucket.get((current_type, day), ()))
+
+        for key in stale_keys:
+            self._entries.pop(key)
+
+        self.invalidations += len(stale_keys)
+        return len(stale_keys)
+
+    async def stats(self) -> Dict[str, int]:
+        stats = self._entries.stats()
+        stats["invalidations"] = self.invalidations
+        stats["stale_sets"] = self.stale_sets
+        return stats
+
+    def _unindex(self, key: Hashable) -> None:
+        for bucket in self._buckets_by_key.pop(key, []):
+            keys = self._keys_by_bucket.get(bucket)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_bucket[bucket]
+
+    @staticmethod
+    def _key(request: GetAvailabilityRequest) -> Hashable:
+        return (
+            request.service_type,
+            request.start_date.isoformat(),
+            request.end_date.isoformat(),
+            request.per_service,
+            request.only_available,
+        )
+
+    @staticmethod
+    def _days(start: datetime, end: datetime) -> List[date]:
+        start_day = InMemoryAvailabilityCache._as_utc(start).date()
+        end_day = (InMemoryAvailabilityCache._as_utc(end) - timedelta(microseconds=1)).date()
+        return [start_day + timedelta(days=offset) for offset in range((end_day - start_day).days + 1)]
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
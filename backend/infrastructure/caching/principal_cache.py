@@ -0,0 +1,51 @@
+from collections import defaultdict
+from typing import Dict, Optional, Set, Tuple
+from backend.core.models.user import User
+from backend.infrastructure.caching.ttl_lru_cache import TTLLRUCache
+
+PrincipalKey = Tuple[str, float]
+
+class PrincipalCache:
+    """Authenticated users keyed by (user id, token exp), so each token is resolved once per TTL.
+
+    Entries never outlive the TTL, and invalidate() drops every cached token
+    of a user whose record changed.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 30.0):
+        self._entries: TTLLRUCache[PrincipalKey, User] = TTLLRUCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            on_remove=self._unindex
+        )
+        self._keys_by_user: Dict[str, Set[PrincipalKey]] = defaultdict(set)
+        self.invalidations = 0
+
+    def get(self, user_id: str, expires_at: float) -> Optional[User]:
+        return self._entries.get((user_id, expires_at))
+
+    def set(self, user_id: str, expires_at: float, user: User) -> None:
+        key = (user_id, expires_at)
+        self._keys_by_user[user_id].add(key)
+        self._entries.set(key, user)
+
+    def invalidate(self, user_id: str) -> int:
+        keys = list(self._keys_by_user.get(user_id, ()))
+        for key in keys:
+            self._entries.pop(key)
+        self.invalidations += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._entries.stats(), "invalidations": self.invalidations}
+
+    def _unindex(self, key: PrincipalKey) -> None:
+        user_id = key[0]
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
@@ -0,0 +1,18 @@
+import os
+from typing import Optional
+from backend.infrastructure.caching.principal_cache import PrincipalCache
+
+PRINCIPAL_CACHE_ENABLED = os.getenv("PRINCIPAL_CACHE_ENABLED", "true").lower() == "true"
+
+principal_cache = PrincipalCache(
+    max_entries=int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 4096)),
+    ttl_seconds=float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 30))
+) if PRINCIPAL_CACHE_ENABLED else None
+
+def get_principal_cache() -> Optional[PrincipalCache]:
+    return principal_cache
+
+def invalidate_principal(user_id: str) -> None:
+    """Call after changing or deleting a user so their cached tokens stop resolving to the old record."""
+    if principal_cache is not None:
+        principal_cache.invalidate(user_id)
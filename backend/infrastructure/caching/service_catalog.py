@@ -0,0 +1,83 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from backend.core.models.service import Service
+from backend.core.models.service_type import ServiceType
+
+
+class ServiceCatalogSnapshot:
+    """Immutable view of every service, indexed by id, type and name."""
+
+    def __init__(self, services: Iterable[Service]):
+        self.by_id: Dict[str, Service] = {}
+        self.by_name: Dict[str, Service] = {}
+        by_type: Dict[ServiceType, List[Service]] = defaultdict(list)
+        for service in services:
+            self.by_id[service.id] = service
+            self.by_name[service.name] = service
+            by_type[service.service_type].append(service)
+        self.by_type: Dict[ServiceType, List[Service]] = dict(by_type)
+
+
+class ServiceCatalog:
+    """Per-process copy of the service catalog, reloaded in full when stale or invalidated.
+
+    Each process refreshes on a TTL, so a service registered through another
+    worker shows up here within ``ttl_seconds``. Invalidation bumps a
+    generation counter, so a reload that raced with a write is not kept.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        if ttl_seconds <= 0:
+            raise ValueError("Cache TTL must be positive")
+
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._snapshot: Optional[ServiceCatalogSnapshot] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.reloads = 0
+        self.invalidations = 0
+
+    async def get(self, load: Callable[[], Awaitable[List[Service]]]) -> ServiceCatalogSnapshot:
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            self.hits += 1
+            return snapshot
+
+        # Concurrent misses share one reload instead of each querying the catalog.
+        async with self._lock:
+            snapshot = self._fresh_snapshot()
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+
+            generation = self._generation
+            snapshot = ServiceCatalogSnapshot(await load())
+            self.reloads += 1
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self._expires_at = self._clock() + self.ttl_seconds
+            return snapshot
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._snapshot = None
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "reloads": self.reloads,
+            "invalidations": self.invalidations,
+            "size": len(self._snapshot.by_id) if self._snapshot is not None else 0,
+        }
+
+    def _fresh_snapshot(self) -> Optional[ServiceCatalogSnapshot]:
+        if self._snapshot is None or self._expires_at <= self._clock():
+            return None
+        return self._snapshot
@@ -0,0 +1,12 @@
+import os
+from typing import Optional
+from backend.infrastructure.caching.service_catalog import ServiceCatalog
+
+SERVICE_CATALOG_CACHE_ENABLED = os.getenv("SERVICE_CATALOG_CACHE_ENABLED", "true").lower() == "true"
+
+service_catalog = ServiceCatalog(
+    ttl_seconds=float(os.getenv("SERVICE_CATALOG_TTL_SECONDS", 60))
+) if SERVICE_CATALOG_CACHE_ENABLED else None
+
+def get_service_catalog() -> Optional[ServiceCatalog]:
+    return service_catalog
@@ -2,21 +2,35 @@ from typing import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.infrastructure.caching.service_catalog_dependencies import get_service_catalog
 from backend.infrastructure.database.postgres_config import async_sessionmaker_instance
+from backend.infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from backend.infrastructure.repositories.cached_service_repository import CachedServiceRepository
 from backend.infrastructure.repositories.postgres_appointment_repository import PostgresAppointmentRepository
+from backend.infrastructure.repositories.postgres_notification_outbox_repository import \
+    PostgresNotificationOutboxRepository
 from backend.infrastructure.repositories.postgres_service_repository import PostgresServiceRepository
 from backend.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+from backend.infrastructure.scheduling.occupancy_calendar_dependencies import get_occupancy_calendar
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_sessionmaker_instance() as session:
         yield session
 
 def get_postgres_appointment_repository(session: AsyncSession = Depends(get_db_session)):
-    return PostgresAppointmentRepository(session)
+    return PostgresAppointmentRepository(session, occupancy_calendar=get_occupancy_calendar())
 
 def get_postgres_user_repository(session: AsyncSession = Depends(get_db_session)):
     return PostgresUserRepository(session)
 
 def get_postgres_service_repository(session: AsyncSession = Depends(get_db_session)):
-    return PostgresServiceRepository(session)
+    service_catalog = get_service_catalog()
+    if service_catalog is None:
+        return PostgresServiceRepository(session)
+    return CachedServiceRepository(PostgresServiceRepository(session), service_catalog)
 
+def get_postgres_notification_outbox_repository(session: AsyncSession = Depends(get_db_session)):
+    return PostgresNotificationOutboxRepository(session)
+
+def get_unit_of_work(session: AsyncSession = Depends(get_db_session)):
+    return SQLAlchemyUnitOfWork(session)
@@ -0,0 +1,64 @@
+import logging
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import AddConstraint
+from backend.infrastructure.models.appointment_model import AppointmentModel, SERVICE_OVERLAP_CONSTRAINT, \
+    USER_OVERLAP_CONSTRAINT
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_EXTENSIONS = ["btree_gist"]
+APPOINTMENT_CONSTRAINTS = [SERVICE_OVERLAP_CONSTRAINT, USER_OVERLAP_CONSTRAINT]
+APPOINTMENT_COLUMNS = [
+    "ALTER TABLE appointments ADD COLUMN IF NOT EXISTS reminder_sent_at TIMESTAMP WITH TIME ZONE",
+    "ALTER TABLE appointments ADD COLUMN IF NOT EXISTS service_type servicetype",
+    # Superseded by ix_appointments_type_start_id.
+    "DROP INDEX IF EXISTS ix_appointments_service_type",
+]
+APPOINTMENT_BACKFILLS = [
+    "UPDATE appointments SET service_type = services.service_type FROM services "
+    "WHERE appointments.service_id = services.id AND appointments.service_type IS NULL",
+]
+
+async def create_extensions(conn: AsyncConnection) -> None:
+    if conn.dialect.name != "postgresql":
+        return
+    for extension in REQUIRED_EXTENSIONS:
+        await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+
+async def apply_schema_upgrades(conn: AsyncConnection) -> None:
+    """Bring tables created by older versions up to date; create_all never alters existing tables."""
+    if conn.dialect.name != "postgresql":
+        return
+
+    for ddl in APPOINTMENT_COLUMNS:
+        await conn.execute(text(ddl))
+
+    for backfill in APPOINTMENT_BACKFILLS:
+        result = await conn.execute(text(backfill))
+        if result.rowcount:
+            logger.info("Backfilled %s appointment rows.", result.rowcount)
+
+    for index in AppointmentModel.__table__.indexes:
+        await conn.run_sync(index.create, checkfirst=True)
+
+    constraints = {constraint.name: constraint for constraint in AppointmentModel.__table__.constraints}
+    for constraint_name in APPOINTMENT_CONSTRAINTS:
+        exists = await conn.scalar(
+            text("SELECT 1 FROM pg_constraint WHERE conname = :name"),
+            {"name": constraint_name}
+        )
+        if exists:
+            continue
+
+        ddl = str(AddConstraint(constraints[constraint_name]).compile(dialect=conn.dialect))
+        try:
+            async with conn.begin_nested():
+                await conn.execute(text(ddl))
+            logger.info("Added constraint %s.", constraint_name)
+        except Exception as e:
+            # Bookings rely on these constraints to reject overlaps, so serving without them is not safe.
+            logger.error("Could not add constraint %s, existing rows probably overlap: %s", constraint_name, e)
+            raise RuntimeError(
+                f"Constraint {constraint_name} could not be added; resolve the overlapping appointments and restart"
+            ) from e
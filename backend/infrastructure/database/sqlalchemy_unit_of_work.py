@@ -0,0 +1,24 @@
+from typing import Callable, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.application.interfaces.unit_of_work import UnitOfWork
+
+AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Defer an in-process side effect (cache, calendar) until the session's work is committed."""
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def commit(self) -> None:
+        await self.db_session.commit()
+        callbacks: List[Callable[[], None]] = self.db_session.info.pop(AFTER_COMMIT_KEY, [])
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        await self.db_session.rollback()
+        self.db_session.info.pop(AFTER_COMMIT_KEY, None)
@@ -1,20 +1,63 @@
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.sql import func
 import uuid
 from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.service_type import ServiceType
 from .base import Base
 
+SERVICE_OVERLAP_CONSTRAINT = "excl_appointments_service_overlap"
+USER_OVERLAP_CONSTRAINT = "excl_appointments_user_overlap"
+
+SCHEDULED_ONLY = text(f"status = '{AppointmentStatus.SCHEDULED.name}'")
+
 class AppointmentModel(Base):
     __tablename__ = "appointments"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     service_id = Column(UUID(as_uuid=True), ForeignKey('services.id'), nullable=False)
+    # Copied from the service at booking time so type filters do not need a join.
+    service_type = Column(SQLEnum(ServiceType), nullable=True)
     scheduled_start = Column(DateTime(timezone=True), nullable=False)
     scheduled_end = Column(DateTime(timezone=True), nullable=False)
     status = Column(SQLEnum(AppointmentStatus), default=AppointmentStatus.SCHEDULED)
     cancellation_token = Column(String, unique=True, nullable=True)
     view_token = Column(String, unique=True, nullable=True)
+    reminder_sent_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Scheduled appointments may not overlap per service nor per user (requires the btree_gist extension).
+    __table_args__ = (
+        ExcludeConstraint(
+            (service_id, "="),
+            (func.tstzrange(scheduled_start, scheduled_end), "&&"),
+            name=SERVICE_OVERLAP_CONSTRAINT,
+            using="gist",
+            where=SCHEDULED_ONLY
+        ).ddl_if(dialect="postgresql"),
+        ExcludeConstraint(
+            (user_id, "="),
+            (func.tstzrange(scheduled_start, scheduled_end), "&&"),
+            name=USER_OVERLAP_CONSTRAINT,
+            using="gist",
+            where=SCHEDULED_ONLY
+        ).ddl_if(dialect="postgresql"),
+        # Availability and booking checks: scheduled rows of one or more services in a time window.
+        Index("ix_appointments_scheduled_service_window", service_id, scheduled_start, scheduled_end,
+              postgresql_where=SCHEDULED_ONLY),
+        # Per-user overlap checks.
+        Index("ix_appointments_scheduled_user_window", user_id, scheduled_start, scheduled_end,
+              postgresql_where=SCHEDULED_ONLY),
+        # Occupancy calendar rebuild.
+        Index("ix_appointments_scheduled_end", scheduled_end, postgresql_where=SCHEDULED_ONLY),
+        # Reminder claims only ever look at scheduled rows that were not reminded yet.
+        Index("ix_appointments_reminder_due", scheduled_start,
+              postgresql_where=text(f"status = '{AppointmentStatus.SCHEDULED.name}' AND reminder_sent_at IS NULL")),
+        # "My appointments".
+        Index("ix_appointments_user_start", user_id, scheduled_start),
+        # Admin list keyset pages, unfiltered and filtered by type.
+        Index("ix_appointments_start_id", scheduled_start, id),
+        Index("ix_appointments_type_start_id", service_type, scheduled_start, id),
+    )
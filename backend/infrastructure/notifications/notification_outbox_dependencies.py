@@ -0,0 +1,18 @@
+import os
+from backend.infrastructure.database.postgres_config import async_sessionmaker_instance
+from backend.infrastructure.notifications.email_notification_dependencies import smtp_service
+from backend.infrastructure.notifications.notification_outbox_worker import NotificationOutboxWorker
+
+NOTIFICATION_OUTBOX_WORKER_ENABLED = os.getenv("NOTIFICATION_OUTBOX_WORKER_ENABLED", "true").lower() == "true"
+
+notification_outbox_worker = NotificationOutboxWorker(
+    session_factory=async_sessionmaker_instance,
+    notification_service=smtp_service,
+    batch_size=int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", 50)),
+    poll_interval_seconds=float(os.getenv("NOTIFICATION_OUTBOX_POLL_INTERVAL_SECONDS", 2)),
+    max_attempts=int(os.getenv("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", 5)),
+    base_backoff_seconds=float(os.getenv("NOTIFICATION_OUTBOX_BACKOFF_SECONDS", 10)),
+)
+
+def get_notification_outbox_worker() -> NotificationOutboxWorker:
+    return notification_outbox_worker
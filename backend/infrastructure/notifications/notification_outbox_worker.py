@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.application.interfaces.services.notification_service import NotificationService
+from backend.core.models.notification_kind import NotificationKind
+from backend.infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from backend.infrastructure.models.notification_outbox_model import NotificationOutboxModel
+from backend.infrastructure.notifications.outbox_payload import deserialize_details
+from backend.infrastructure.repositories.postgres_notification_outbox_repository import \
+    PostgresNotificationOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+class NotificationOutboxWorker:
+    """Delivers staged notifications in batches, retrying failures with exponential backoff."""
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            notification_service: NotificationService,
+            batch_size: int = 50,
+            poll_interval_seconds: float = 2.0,
+            max_attempts: int = 5,
+            base_backoff_seconds: float = 10.0,
+            max_backoff_seconds: float = 3600.0,
+            repository_factory: Callable[[AsyncSession], PostgresNotificationOutboxRepository] =
+            PostgresNotificationOutboxRepository
+    ):
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        if max_attempts <= 0:
+            raise ValueError("Max attempts must be positive")
+
+        self.session_factory = session_factory
+        self.notification_service = notification_service
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.repository_factory = repository_factory
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        seconds = self.base_backoff_seconds * 2 ** max(0, attempts - 1)
+        return timedelta(seconds=min(seconds, self.max_backoff_seconds))
+
+    async def run_once(self) -> int:
+        async with self.session_factory() as session:
+            outbox_repo = self.repository_factory(session)
+            messages = await outbox_repo.claim_due(self.batch_size)
+            if not messages:
+                return 0
+
+            errors = await self._deliver(messages)
+
+            now = datetime.now(timezone.utc)
+            for message, error in zip(messages, errors):
+                if error is None:
+                    outbox_repo.mark_sent(message)
+                elif message.attempts + 1 >= self.max_attempts:
+                    logger.error("Giving up on notification %s after %s attempts: %s",
+                                 message.id, message.attempts + 1, error)
+                    outbox_repo.mark_failed(message, error)
+                else:
+                    outbox_repo.mark_retry(message, error, now + self.retry_delay(message.attempts + 1))
+
+            await SQLAlchemyUnitOfWork(session).commit()
+            return len(messages)
+
+    async def _deliver(self, messages: List[NotificationOutboxModel]) -> List[Optional[str]]:
+        errors: List[Optional[str]] = [None] * len(messages)
+        notifications = []
+        indexes = []
+        for index, message in enumerate(messages):
+            try:
+                notifications.append(
+                    (NotificationKind(message.kind), message.recipient, deserialize_details(message.payload))
+                )
+            except Exception as e:
+                logger.exception("Error reading notification %s", message.id)
+                errors[index] = str(e) or type(e).__name__
+            else:
+                indexes.append(index)
+
+        if not notifications:
+            return errors
+
+        # Sent as one batch so the notification service can reuse SMTP sessions across messages.
+        try:
+            results = await self.notification_service.send_batch(notifications)
+        except Exception as e:
+            logger.exception("Error delivering %s notifications", len(notifications))
+            results = [False] * len(notifications)
+            failure = str(e) or type(e).__name__
+        else:
+            failure = "Notification service reported a failed delivery"
+
+        for index, sent in zip(indexes, results):
+            if not sent:
+                errors[index] = failure
+        return errors
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:
+                logger.exception("Notification outbox batch failed")
+                processed = 0
+
+            # A full batch means more rows are probably due, so drain without sleeping.
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
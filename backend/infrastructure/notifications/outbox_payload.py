@@ -0,0 +1,29 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Type
+from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.service_type import ServiceType
+
+# Details keys that the notification templates format as dates or read as enums.
+DATETIME_FIELDS = ("scheduled_start", "scheduled_end", "created_at", "updated_at")
+ENUM_FIELDS: Dict[str, Type[Enum]] = {"service_type": ServiceType, "status": AppointmentStatus}
+
+def serialize_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    payload = {}
+    for key, value in details.items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, Enum):
+            value = value.value
+        payload[key] = value
+    return payload
+
+def deserialize_details(payload: Dict[str, Any]) -> Dict[str, Any]:
+    details = dict(payload)
+    for key in DATETIME_FIELDS:
+        if isinstance(details.get(key), str):
+            details[key] = datetime.fromisoformat(details[key])
+    for key, enum_type in ENUM_FIELDS.items():
+        if isinstance(details.get(key), str):
+            details[key] = enum_type(details[key])
+    return details
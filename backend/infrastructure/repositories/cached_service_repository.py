@@ -0,0 +1,42 @@
+import uuid
+from typing import List, Optional
+from backend.application.interfaces.repositories.service_repository import ServiceRepository
+from backend.core.models.service import Service
+from backend.core.models.service_type import ServiceType
+from backend.infrastructure.caching.service_catalog import ServiceCatalog, ServiceCatalogSnapshot
+from backend.infrastructure.database.sqlalchemy_unit_of_work import run_after_commit
+from backend.infrastructure.repositories.postgres_service_repository import PostgresServiceRepository
+
+class CachedServiceRepository(ServiceRepository):
+    """Answers reads from the in-process ServiceCatalog and writes through to Postgres."""
+
+    def __init__(self, inner: PostgresServiceRepository, catalog: ServiceCatalog):
+        self.inner = inner
+        self.catalog = catalog
+
+    async def save(self, service: Service) -> Service:
+        saved_service = await self.inner.save(service)
+        self.catalog.invalidate()
+        # A reload between the insert and the commit would not see the new row yet.
+        run_after_commit(self.inner.db_session, self.catalog.invalidate)
+        return saved_service
+
+    async def find_by_id(self, service_id: str) -> Optional[Service]:
+        # Catalog keys are canonical UUID strings; accept any spelling Postgres would, as the inner repository does.
+        try:
+            service_id = str(uuid.UUID(service_id))
+        except ValueError:
+            return None
+        return (await self._snapshot()).by_id.get(service_id)
+
+    async def find_by_type(self, service_type: ServiceType) -> List[Service]:
+        return list((await self._snapshot()).by_type.get(service_type, []))
+
+    async def find_by_name(self, name: str) -> Optional[Service]:
+        return (await self._snapshot()).by_name.get(name)
+
+    async def find_all(self) -> List[Service]:
+        return list((await self._snapshot()).by_id.values())
+
+    async def _snapshot(self) -> ServiceCatalogSnapshot:
+        return await self.catalog.get(self.inner.find_all)
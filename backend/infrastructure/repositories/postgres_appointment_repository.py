@@ -1,26 +1,46 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy.sql import func
+from sqlalchemy import select, insert, update, and_, tuple_
+from sqlalchemy.exc import IntegrityError
+from backend.application.dtos.admin_appointment_summary_dto import AdminAppointmentSummaryDTO
+from backend.application.dtos.appointment_reminder_dto import AppointmentReminderDTO
+from backend.application.dtos.cancelled_appointment_dto import CancelledAppointmentDTO
 from backend.application.interfaces.repositories.appointment_repository import AppointmentRepository
+from backend.core.exceptions.appointment_conflict_error import ServiceTimeSlotConflictError, \
+    UserTimeSlotConflictError
 from backend.core.models.appointment import Appointment
 from backend.core.models.appointment_status import AppointmentStatus
 from backend.core.models.service_type import ServiceType
+from backend.core.scheduling.occupancy_calendar import OccupancyCalendar
 from backend.core.value_objects.email import Email
 from backend.core.value_objects.time_slot import TimeSlot
-from backend.infrastructure.models.appointment_model import AppointmentModel
+from backend.infrastructure.database.sqlalchemy_unit_of_work import run_after_commit
+from backend.infrastructure.models.service_model import ServiceModel
+from backend.infrastructure.models.user_model import UserModel
+from backend.infrastructure.models.appointment_model import AppointmentModel, SERVICE_OVERLAP_CONSTRAINT, \
+    USER_OVERLAP_CONSTRAINT
 import uuid
 
 class PostgresAppointmentRepository(AppointmentRepository):
 
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, occupancy_calendar: Optional[OccupancyCalendar] = None):
         self.db_session = db_session
+        self.occupancy_calendar = occupancy_calendar
 
     async def save(self, appointment: Appointment) -> Appointment:
-        db_appointment = AppointmentModel(
-            id=uuid.UUID(appointment.id) if appointment.id else None,
-            user_id = uuid.UUID(appointment.user_id),
-            service_id=uuid.UUID(appointment.service_id),
+        service_uuid = uuid.UUID(appointment.service_id)
+        service_type = appointment.service_type
+        if service_type is None:
+            service_type = select(ServiceModel.service_type).where(ServiceModel.id == service_uuid).scalar_subquery()
+
+        # Server-generated values come back with the INSERT itself instead of a follow-up refresh SELECT.
+        stmt = insert(AppointmentModel).values(
+            id=uuid.UUID(appointment.id) if appointment.id else uuid.uuid4(),
+            user_id=uuid.UUID(appointment.user_id),
+            service_id=service_uuid,
+            service_type=service_type,
             scheduled_start=appointment.scheduled_slot.start,
             scheduled_end=appointment.scheduled_slot.end,
             status=appointment.status,
@@ -28,14 +48,26 @@ class PostgresAppointmentRepository(AppointmentRepository):
             cancellation_token=appointment.cancellation_token,
             created_at=appointment.created_at,
             updated_at=appointment.updated_at
-        )
+        ).returning(AppointmentModel.id, AppointmentModel.service_type)
 
-        self.db_session.add(db_appointment)
-        await self.db_session.commit()
-        await self.db_session.refresh(db_appointment)
+        try:
+            result = await self.db_session.execute(stmt)
+            appointment_id, saved_service_type = result.one()
+        except IntegrityError as e:
+            constraint_name = self._violated_constraint(e)
+            if constraint_name == SERVICE_OVERLAP_CONSTRAINT:
+                raise ServiceTimeSlotConflictError() from e
+            if constraint_name == USER_OVERLAP_CONSTRAINT:
+                raise UserTimeSlotConflictError() from e
+            raise
+
+        appointment.id = str(appointment_id)
+        appointment.service_type = saved_service_type
+
+        if self.occupancy_calendar is not None and appointment.status == AppointmentStatus.SCHEDULED:
+            calendar, slot = self.occupancy_calendar, appointment.scheduled_slot
+            run_after_commit(self.db_session, lambda: calendar.occupy(str(service_uuid), slot))
 
-        if not appointment.id:
-            appointment.id = str(db_appointment.id)
         return appointment
 
     async def find_scheduled_between(self, start: datetime, end: datetime, service_id: str) -> List[Appointment]:
@@ -62,6 +94,43 @@ class PostgresAppointmentRepository(AppointmentRepository):
 
         return domain_appointments
 
+    async def find_scheduled_between_for_services(
+            self,
+            start: datetime,
+            end: datetime,
+            service_ids: List[str]
+    ) -> Dict[str, List[Appointment]]:
+        service_uuids = []
+        for service_id in service_ids:
+            try:
+                service_uuids.append(uuid.UUID(service_id))
+            except ValueError:
+                continue
+
+        grouped_appointments: Dict[str, List[Appointment]] = {
+            str(service_uuid): [] for service_uuid in service_uuids
+        }
+
+        if not service_uuids:
+            return grouped_appointments
+
+        stmt = select(AppointmentModel).where(
+            and_(
+                AppointmentModel.status == AppointmentStatus.SCHEDULED,
+                AppointmentModel.service_id.in_(service_uuids),
+                AppointmentModel.scheduled_start < end,
+                AppointmentModel.scheduled_end > start
+            )
+        )
+
+        result = await self.db_session.execute(stmt)
+        db_appointments = result.scalars().all()
+
+        for db_app in db_appointments:
+            grouped_appointments[str(db_app.service_id)].append(self._to_domain_entity(db_app))
+
+        return grouped_appointments
+
     async def find_scheduled_between_for_user(self, user_id: str, start: datetime, end: datetime) -> List[
         Appointment]:
         try:
@@ -88,6 +157,23 @@ class PostgresAppointmentRepository(AppointmentRepository):
         return domain_appointments
 
 
+    async def find_scheduled_ending_after(self, since: datetime) -> List[Appointment]:
+        stmt = select(AppointmentModel).where(
+            and_(
+                AppointmentModel.status == AppointmentStatus.SCHEDULED,
+                AppointmentModel.scheduled_end > since
+            )
+        )
+
+        result = await self.db_session.execute(stmt)
+        db_appointments = result.scalars().all()
+
+        domain_appointments = []
+        for db_app in db_appointments:
+            domain_appointments.append(self._to_domain_entity(db_app))
+
+        return domain_appointments
+
     async def find_by_user_id(self, user_id: str) -> List[Appointment]:
         try:
             user_uuid = uuid.UUID(user_id)
@@ -114,19 +200,13 @@ class PostgresAppointmentRepository(AppointmentRepository):
 
         stmt = select(AppointmentModel)
 
-        conditions = []
-        if status is not None:
-            conditions.append(AppointmentModel.status == status)
-        if service_type is not None:
-            conditions.append(AppointmentModel.service_type == service_type)
-        if date_from is not None:
-            conditions.append(AppointmentModel.scheduled_end > date_from)
-        if date_to is not None:
-            conditions.append(AppointmentModel.scheduled_start < date_to)
+        conditions = self._filter_conditions(status, service_type, date_from, date_to)
 
         if conditions:
             stmt = stmt.where(and_(*conditions))
 
+        stmt = stmt.order_by(AppointmentModel.scheduled_start.desc(), AppointmentModel.id.desc())
+
         result = await self.db_session.execute(stmt)
         db_appointments = result.scalars().all()
 
@@ -137,6 +217,97 @@ class PostgresAppointmentRepository(AppointmentRepository):
         return domain_appointments
 
 
+    async def find_admin_summaries(
+            self,
+            status: Optional[AppointmentStatus] = None,
+            service_type: Optional[ServiceType] = None,
+            date_from: Optional[datetime] = None,
+            date_to: Optional[datetime] = None,
+            limit: Optional[int] = None,
+            after: Optional[Tuple[datetime, str]] = None
+    ) -> List[AdminAppointmentSummaryDTO]:
+
+        stmt = select(
+            AppointmentModel.id,
+            AppointmentModel.user_id,
+            AppointmentModel.service_id,
+            UserModel.name,
+            UserModel.email,
+            UserModel.phone,
+            ServiceModel.name,
+            ServiceModel.description,
+            ServiceModel.duration_minutes,
+            ServiceModel.price,
+            ServiceModel.service_type,
+            AppointmentModel.scheduled_start,
+            AppointmentModel.scheduled_end,
+            AppointmentModel.status,
+            AppointmentModel.view_token,
+            AppointmentModel.cancellation_token,
+            AppointmentModel.created_at,
+            AppointmentModel.updated_at
+        ).join(UserModel, AppointmentModel.user_id == UserModel.id) \
+            .join(ServiceModel, AppointmentModel.service_id == ServiceModel.id)
+
+        conditions = self._filter_conditions(status, service_type, date_from, date_to)
+        if after is not None:
+            after_start, after_id = after
+            conditions.append(
+                tuple_(AppointmentModel.scheduled_start, AppointmentModel.id) < (after_start, uuid.UUID(after_id))
+            )
+
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        stmt = stmt.order_by(AppointmentModel.scheduled_start.desc(), AppointmentModel.id.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.db_session.execute(stmt)
+
+        return [
+            AdminAppointmentSummaryDTO(
+                id=str(appointment_id),
+                user_id=str(user_id),
+                service_id=str(service_id),
+                client_name=client_name,
+                client_email=client_email,
+                client_phone=client_phone,
+                service_name=service_name,
+                service_description=service_description,
+                service_duration_minutes=service_duration_minutes,
+                service_price=service_price,
+                service_type=service_type_detail,
+                scheduled_start=scheduled_start,
+                scheduled_end=scheduled_end,
+                status=appointment_status,
+                view_token=view_token,
+                cancellation_token=cancellation_token,
+                created_at=created_at,
+                updated_at=updated_at
+            )
+            for (appointment_id, user_id, service_id, client_name, client_email, client_phone, service_name,
+                 service_description, service_duration_minutes, service_price, service_type_detail, scheduled_start,
+                 scheduled_end, appointment_status, view_token, cancellation_token, created_at, updated_at)
+            in result.all()
+        ]
+
+    async def count_filtered(
+            self,
+            status: Optional[AppointmentStatus] = None,
+            service_type: Optional[ServiceType] = None,
+            date_from: Optional[datetime] = None,
+            date_to: Optional[datetime] = None
+    ) -> int:
+        stmt = select(func.count()).select_from(AppointmentModel)
+
+        conditions = self._filter_conditions(status, service_type, date_from, date_to)
+
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        return await self.db_session.scalar(stmt)
+
     async def find_by_view_token(self, token: str) -> Optional[Appointment]:
         stmt = select(AppointmentModel).where(AppointmentModel.view_token == token)
         result = await self.db_session.execute(stmt)
@@ -165,17 +336,172 @@ class PostgresAppointmentRepository(AppointmentRepository):
         db_appointment.status = appointment.status
         db_appointment.updated_at = appointment.updated_at
 
-        await self.db_session.commit()
-        await self.db_session.refresh(db_appointment)
+        await self.db_session.flush()
 
-        return self._to_domain_entity(db_appointment)
+        updated_appointment = self._to_domain_entity(db_appointment)
+        if self.occupancy_calendar is not None and updated_appointment.status != AppointmentStatus.SCHEDULED:
+            calendar = self.occupancy_calendar
+            run_after_commit(self.db_session, lambda: calendar.release(
+                updated_appointment.service_id, updated_appointment.scheduled_slot
+            ))
+
+        return updated_appointment
+
+    async def claim_due_reminders(self, start: datetime, end: datetime, limit: int) -> List[AppointmentReminderDTO]:
+        due_ids = select(AppointmentModel.id).where(
+            and_(
+                AppointmentModel.status == AppointmentStatus.SCHEDULED,
+                AppointmentModel.reminder_sent_at.is_(None),
+                AppointmentModel.scheduled_start >= start,
+                AppointmentModel.scheduled_start < end
+            )
+        ).order_by(AppointmentModel.scheduled_start).limit(limit).with_for_update(skip_locked=True).scalar_subquery()
+
+        # One statement claims the batch and returns everything the reminder template needs.
+        stmt = update(AppointmentModel).where(
+            and_(
+                AppointmentModel.id.in_(due_ids),
+                AppointmentModel.user_id == UserModel.id,
+                AppointmentModel.service_id == ServiceModel.id
+            )
+        ).values(reminder_sent_at=func.now(), updated_at=AppointmentModel.updated_at).returning(
+            AppointmentModel.id,
+            AppointmentModel.scheduled_start,
+            AppointmentModel.scheduled_end,
+            AppointmentModel.view_token,
+            AppointmentModel.cancellation_token,
+            UserModel.name,
+            UserModel.email,
+            ServiceModel.name,
+            ServiceModel.description,
+            ServiceModel.duration_minutes,
+            ServiceModel.price,
+            ServiceModel.service_type
+        ).execution_options(synchronize_session=False)
+
+        result = await self.db_session.execute(stmt)
+        rows = result.all()
+
+        return [
+            AppointmentReminderDTO(
+                appointment_id=str(appointment_id),
+                client_name=client_name,
+                client_email=client_email,
+                service_name=service_name,
+                service_description=service_description,
+                service_duration_minutes=service_duration_minutes,
+                service_price=service_price,
+                service_type=service_type,
+                scheduled_start=scheduled_start,
+                scheduled_end=scheduled_end,
+                view_token=view_token,
+                cancellation_token=cancellation_token
+            )
+            for (appointment_id, scheduled_start, scheduled_end, view_token, cancellation_token, client_name,
+                 client_email, service_name, service_description, service_duration_minutes, service_price,
+                 service_type) in rows
+        ]
+
+    @staticmethod
+    def _filter_conditions(
+            status: Optional[AppointmentStatus],
+            service_type: Optional[ServiceType],
+            date_from: Optional[datetime],
+            date_to: Optional[datetime]
+    ) -> list:
+        conditions = []
+        if status is not None:
+            conditions.append(AppointmentModel.status == status)
+        if service_type is not None:
+            conditions.append(AppointmentModel.service_type == service_type)
+        if date_from is not None:
+            conditions.append(AppointmentModel.scheduled_end > date_from)
+        if date_to is not None:
+            conditions.append(AppointmentModel.scheduled_start < date_to)
+        return conditions
+
+    @staticmethod
+    def _violated_constraint(error: IntegrityError) -> Optional[str]:
+        driver_error = getattr(error.orig, "__cause__", None)
+        constraint_name = getattr(driver_error, "constraint_name", None)
+        if constraint_name:
+            return constraint_name
+
+        message = str(error.orig)
+        for name in (SERVICE_OVERLAP_CONSTRAINT, USER_OVERLAP_CONSTRAINT):
+            if name in message:
+                return name
+        return None
+
+    async def cancel_by_token(self, token: str) -> Optional[CancelledAppointmentDTO]:
+        # The status predicate makes concurrent cancels race-free: only one UPDATE can match the row.
+        stmt = update(AppointmentModel).where(
+            and_(
+                AppointmentModel.cancellation_token == token,
+                AppointmentModel.status == AppointmentStatus.SCHEDULED,
+                AppointmentModel.user_id == UserModel.id,
+                AppointmentModel.service_id == ServiceModel.id
+            )
+        ).values(status=AppointmentStatus.CANCELLED, updated_at=func.now()).returning(
+            AppointmentModel.id,
+            AppointmentModel.user_id,
+            AppointmentModel.service_id,
+            UserModel.name,
+            UserModel.email,
+            ServiceModel.name,
+            ServiceModel.description,
+            ServiceModel.service_type,
+            AppointmentModel.scheduled_start,
+            AppointmentModel.scheduled_end,
+            AppointmentModel.status,
+            AppointmentModel.view_token,
+            AppointmentModel.cancellation_token,
+            AppointmentModel.created_at,
+            AppointmentModel.updated_at
+        ).execution_options(synchronize_session=False)
+
+        result = await self.db_session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        (appointment_id, user_id, service_id, client_name, client_email, service_name, service_description,
+         service_type, scheduled_start, scheduled_end, appointment_status, view_token, cancellation_token,
+         created_at, updated_at) = row
+        cancelled = CancelledAppointmentDTO(
+            id=str(appointment_id),
+            user_id=str(user_id),
+            service_id=str(service_id),
+            client_name=client_name,
+            client_email=client_email,
+            service_name=service_name,
+            service_description=service_description,
+            service_type=service_type,
+            scheduled_start=scheduled_start,
+            scheduled_end=scheduled_end,
+            status=appointment_status,
+            view_token=view_token,
+            cancellation_token=cancellation_token,
+            created_at=created_at,
+            updated_at=updated_at
+        )
+
+        if self.occupancy_calendar is not None:
+            calendar = self.occupancy_calendar
+            run_after_commit(self.db_session, lambda: calendar.release(
+                cancelled.service_id, TimeSlot(start=scheduled_start, end=scheduled_end)
+            ))
+
+        return cancelled
 
-    def _to_domain_entity(self, db_appointment: AppointmentModel) -> Appointment:
-        return Appointment(
+    @staticmethod
+    def _to_domain_entity(db_appointment: AppointmentModel) -> Appointment:
+        # Rows were validated on the way in and timestamptz columns come back timezone-aware.
+        return Appointment.from_trusted(
             id=str(db_appointment.id),
             user_id=str(db_appointment.user_id),
             service_id=str(db_appointment.service_id),
-            scheduled_slot=TimeSlot(
+            scheduled_slot=TimeSlot.trusted(
                 start=db_appointment.scheduled_start,
                 end=db_appointment.scheduled_end
             ),
@@ -184,4 +510,5 @@ class PostgresAppointmentRepository(AppointmentRepository):
             cancellation_token=db_appointment.cancellation_token,
             created_at=db_appointment.created_at,
             updated_at=db_appointment.updated_at,
+            service_type=db_appointment.service_type,
         )
\ No newline at end of file
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.application.interfaces.repositories.notification_outbox_repository import NotificationOutboxRepository
+from backend.core.models.notification_kind import NotificationKind
+from backend.infrastructure.models.notification_outbox_model import NotificationOutboxModel, OUTBOX_PENDING, \
+    OUTBOX_SENT, OUTBOX_FAILED
+from backend.infrastructure.notifications.outbox_payload import serialize_details
+
+class PostgresNotificationOutboxRepository(NotificationOutboxRepository):
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def enqueue(self, kind: NotificationKind, recipient: str, details: Dict[str, Any]) -> None:
+        self.db_session.add(NotificationOutboxModel(
+            kind=kind.value,
+            recipient=recipient,
+            payload=serialize_details(details),
+            status=OUTBOX_PENDING,
+            attempts=0,
+            next_attempt_at=datetime.now(timezone.utc)
+        ))
+
+    async def claim_due(self, limit: int) -> List[NotificationOutboxModel]:
+        # Rows stay locked until the caller commits; concurrent workers skip them instead of waiting.
+        stmt = select(NotificationOutboxModel).where(
+            and_(
+                NotificationOutboxModel.status == OUTBOX_PENDING,
+                NotificationOutboxModel.next_attempt_at <= datetime.now(timezone.utc)
+            )
+        ).order_by(NotificationOutboxModel.next_attempt_at).limit(limit).with_for_update(skip_locked=True)
+
+        result = await self.db_session.execute(stmt)
+        return list(result.scalars().all())
+
+    def mark_sent(self, message: NotificationOutboxModel) -> None:
+        message.status = OUTBOX_SENT
+        message.attempts += 1
+        message.sent_at = datetime.now(timezone.utc)
+        message.last_error = None
+
+    def mark_retry(self, message: NotificationOutboxModel, error: str, next_attempt_at: datetime) -> None:
+        message.attempts += 1
+        message.last_error = error
+        message.next_attempt_at = next_attempt_at
+
+    def mark_failed(self, message: NotificationOutboxModel, error: str) -> None:
+        message.status = OUTBOX_FAILED
+        message.attempts += 1
+        message.last_error = error
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from backend.application.interfaces.repositories.service_repository import ServiceRepository
 from backend.core.models.service import Service
 from backend.infrastructure.models.service_model import ServiceModel
@@ -13,21 +13,21 @@ class PostgresServiceRepository(ServiceRepository):
         self.db_session = db_session
 
     async def save(self, service: Service) -> Service:
-        db_service = ServiceModel(
-            id=uuid.UUID(service.id) if service.id else None,
+        stmt = insert(ServiceModel).values(
+            id=uuid.UUID(service.id) if service.id else uuid.uuid4(),
             name=service.name,
             description=service.description,
             duration_minutes=service.duration_minutes,
             price=service.price,
             service_type=service.service_type
-        )
+        ).returning(ServiceModel.id, ServiceModel.created_at, ServiceModel.updated_at)
 
-        self.db_session.add(db_service)
-        await self.db_session.commit()
-        await self.db_session.refresh(db_service)
+        result = await self.db_session.execute(stmt)
+        service_id, created_at, updated_at = result.one()
 
-        if not service.id:
-            service.id = str(db_service.id)
+        service.id = str(service_id)
+        service.created_at = created_at
+        service.updated_at = updated_at
         return service
 
     async def find_by_id(self, service_id: str) -> Optional[Service]:
@@ -54,6 +54,10 @@ class PostgresServiceRepository(ServiceRepository):
             domain_services.append(self._to_domain_entity(db_serv))
         return domain_services
 
+    async def find_all(self) -> List[Service]:
+        stmt = select(ServiceModel).order_by(ServiceModel.name)
+        result = await self.db_session.execute(stmt)
+        return [self._to_domain_entity(db_service) for db_service in result.scalars().all()]
 
     async def find_by_name(self, name: str) -> Optional[Service]:
         stmt = select(ServiceModel).where(ServiceModel.name == name)
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from backend.application.interfaces.repositories.user_repository import UserRepository
 from backend.core.models.user import User
 from backend.infrastructure.models.user_model import UserModel
@@ -14,22 +14,20 @@ class PostgresUserRepository(UserRepository):
         self.db_session = db_session
 
     async def save(self, user: User) -> User:
-        db_user = UserModel(
-            id=uuid.UUID(user.id) if user.id else None,
+        stmt = insert(UserModel).values(
+            id=uuid.UUID(user.id) if user.id else uuid.uuid4(),
             name=user.name,
             email=user.email.value,
             phone=user.phone,
             hashed_password=user.hashed_password.value
-        )
-
-        self.db_session.add(db_user)
-        await self.db_session.commit()
-        await self.db_session.refresh(db_user)
+        ).returning(UserModel.id, UserModel.created_at, UserModel.updated_at)
 
-        if not user.id:
-            user.id = str(db_user.id)
+        result = await self.db_session.execute(stmt)
+        user_id, created_at, updated_at = result.one()
 
-        user.updated_at = db_user.updated_at
+        user.id = str(user_id)
+        user.created_at = created_at
+        user.updated_at = updated_at
 
         return user
 
@@ -46,15 +44,7 @@ class PostgresUserRepository(UserRepository):
         if not db_user:
             return None
 
-        return User(
-            id=str(db_user.id),
-            name=db_user.name,
-            email=Email(db_user.email),
-            phone=db_user.phone,
-            hashed_password=HashedPassword(db_user.hashed_password),
-            created_at=db_user.created_at,
-            updated_at=db_user.updated_at
-        )
+        return self._to_domain_entity(db_user)
 
     async def find_by_email(self, email_str: str) -> Optional[User]:
         stmt = select(UserModel).where(UserModel.email == email_str)
@@ -64,12 +54,17 @@ class PostgresUserRepository(UserRepository):
         if not db_user:
             return None
 
-        return User(
+        return self._to_domain_entity(db_user)
+
+    @staticmethod
+    def _to_domain_entity(db_user: UserModel) -> User:
+        # Rows were validated and normalized on the way in, so they skip the value-object checks.
+        return User.from_trusted(
             id=str(db_user.id),
             name=db_user.name,
-            email=Email(db_user.email),
+            email=Email.trusted(db_user.email),
             phone=db_user.phone,
-            hashed_password=HashedPassword(db_user.hashed_password),
+            hashed_password=HashedPassword.trusted(db_user.hashed_password),
             created_at=db_user.created_at,
             updated_at=db_user.updated_at
         )
@@ -0,0 +1,21 @@
+import os
+from datetime import timedelta
+from backend.application.use_cases.send_appointment_reminders_use_case import SendAppointmentRemindersUseCase
+from backend.infrastructure.database.postgres_config import async_sessionmaker_instance
+from backend.infrastructure.scheduling.appointment_reminder_scheduler import AppointmentReminderScheduler
+
+APPOINTMENT_REMINDERS_ENABLED = os.getenv("APPOINTMENT_REMINDERS_ENABLED", "true").lower() == "true"
+REMINDER_LEAD_TIME = timedelta(minutes=int(os.getenv("REMINDER_LEAD_TIME_MINUTES", 24 * 60)))
+REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", 200))
+
+appointment_reminder_scheduler = AppointmentReminderScheduler(
+    session_factory=async_sessionmaker_instance,
+    use_case_factory=lambda appointment_repo, notification_outbox, unit_of_work: SendAppointmentRemindersUseCase(
+        appointment_repo=appointment_repo,
+        notification_outbox=notification_outbox,
+        unit_of_work=unit_of_work,
+        lead_time=REMINDER_LEAD_TIME,
+        batch_size=REMINDER_BATCH_SIZE
+    ),
+    interval_seconds=float(os.getenv("REMINDER_INTERVAL_SECONDS", 60))
+)
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.application.dtos.send_appointment_reminders_response import SendAppointmentRemindersResponse
+from backend.application.interfaces.unit_of_work import UnitOfWork
+from backend.application.use_cases.send_appointment_reminders_use_case import SendAppointmentRemindersUseCase
+from backend.infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from backend.infrastructure.repositories.postgres_appointment_repository import PostgresAppointmentRepository
+from backend.infrastructure.repositories.postgres_notification_outbox_repository import \
+    PostgresNotificationOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+class AppointmentReminderScheduler:
+    """Runs SendAppointmentRemindersUseCase every ``interval_seconds`` until stopped."""
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            use_case_factory: Callable[
+                [PostgresAppointmentRepository, PostgresNotificationOutboxRepository, UnitOfWork],
+                SendAppointmentRemindersUseCase
+            ],
+            interval_seconds: float = 60.0
+    ):
+        self.session_factory = session_factory
+        self.use_case_factory = use_case_factory
+        self.interval_seconds = interval_seconds
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def run_once(self) -> SendAppointmentRemindersResponse:
+        async with self.session_factory() as session:
+            use_case = self.use_case_factory(
+                PostgresAppointmentRepository(session),
+                PostgresNotificationOutboxRepository(session),
+                SQLAlchemyUnitOfWork(session)
+            )
+            response = await use_case.execute()
+
+        if response.queued_count:
+            logger.info("Appointment reminders: %s queued for delivery.", response.queued_count)
+        return response
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Appointment reminder run failed")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
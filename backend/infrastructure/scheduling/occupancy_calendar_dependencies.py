@@ -0,0 +1,24 @@
+import os
+from datetime import datetime, time, timezone
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.core.scheduling.occupancy_calendar import OccupancyCalendar
+from backend.infrastructure.repositories.postgres_appointment_repository import PostgresAppointmentRepository
+
+# The calendar lives in process memory and only sees this process's bookings after startup,
+# so it is opt-in and must stay off whenever more than one worker or instance serves bookings.
+OCCUPANCY_BITMAPS_ENABLED = os.getenv("OCCUPANCY_BITMAPS_ENABLED", "false").lower() == "true"
+
+occupancy_calendar = OccupancyCalendar() if OCCUPANCY_BITMAPS_ENABLED else None
+
+def get_occupancy_calendar() -> Optional[OccupancyCalendar]:
+    return occupancy_calendar
+
+async def rebuild_occupancy_calendar(session: AsyncSession) -> int:
+    if occupancy_calendar is None:
+        return 0
+
+    loaded_from = datetime.combine(datetime.now(timezone.utc).date(), time.min, tzinfo=timezone.utc)
+    appointments = await PostgresAppointmentRepository(session).find_scheduled_ending_after(loaded_from)
+    occupancy_calendar.rebuild(appointments, loaded_from=loaded_from)
+    return len(appointments)
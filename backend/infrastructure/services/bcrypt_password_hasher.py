@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+import bcrypt
+from backend.application.interfaces.services.password_hasher import PasswordHasher, PasswordHasherStats
+from backend.core.exceptions.password_hasher_saturated_error import PasswordHasherSaturatedError
+
+T = TypeVar("T")
+
+class BcryptPasswordHasher(PasswordHasher):
+    """bcrypt on a dedicated thread pool, so a burst of logins cannot stall the event loop.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism.
+    At most ``max_workers`` hashes run and ``max_pending`` more may wait;
+    anything beyond that is rejected immediately rather than queued.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 32, rounds: int = 12,
+                 clock: Callable[[], float] = time.perf_counter):
+        if max_workers <= 0:
+            raise ValueError("Password hasher workers must be positive")
+        if max_pending < 0:
+            raise ValueError("Password hasher queue size cannot be negative")
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+
+        self._admitted = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self._hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._submit(self._verify, password, hashed_password)
+
+    def stats(self) -> PasswordHasherStats:
+        with self._lock:
+            running = self._running
+            completed = self.completed
+            total_seconds = self._total_seconds
+            max_seconds = self._max_seconds
+            admitted = self._admitted
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": running,
+            "queued": max(0, admitted - running),
+            "completed": completed,
+            "rejected": self.rejected,
+            "avg_hash_ms": total_seconds / completed * 1000 if completed else 0.0,
+            "max_hash_ms": max_seconds * 1000,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._admitted >= self.max_workers + self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherSaturatedError()
+            self._admitted += 1
+
+        # The slot is released when the job itself finishes, not when its caller stops waiting:
+        # a cancelled request whose hash is already queued or running still occupies the executor.
+        future = self._executor.submit(self._timed, func, *args)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._admitted -= 1
+
+    def _timed(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            self._running += 1
+        started = self._clock()
+        try:
+            return func(*args)
+        finally:
+            elapsed = self._clock() - started
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+    def _hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)).decode("utf-8")
+
+    @staticmethod
+    def _verify(password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
@@ -0,0 +1,12 @@
+import os
+from backend.application.interfaces.services.password_hasher import PasswordHasher
+from backend.infrastructure.services.bcrypt_password_hasher import BcryptPasswordHasher
+
+bcrypt_password_hasher = BcryptPasswordHasher(
+    max_workers=int(os.getenv("PASSWORD_HASH_MAX_WORKERS", min(4, os.cpu_count() or 1))),
+    max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", 32)),
+    rounds=int(os.getenv("BCRYPT_ROUNDS", 12))
+)
+
+def get_password_hasher() -> PasswordHasher:
+    return bcrypt_password_hasher
@@ -0,0 +1,176 @@
+import logging
+import smtplib
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+OutgoingMessage = Tuple[str, str, str]
+
+
+class _PooledConnection:
+    __slots__ = ("smtp", "messages_sent", "last_used")
+
+    def __init__(self, smtp: smtplib.SMTP, now: float):
+        self.smtp = smtp
+        self.messages_sent = 0
+        self.last_used = now
+
+
+class SMTPConnectionPool:
+    """Thread-safe pool of authenticated SMTP sessions.
+
+    ``connect`` must return a connected, logged-in ``smtplib.SMTP``. A session is
+    closed after ``max_messages_per_connection`` messages, after sitting idle for
+    ``idle_timeout_seconds``, or as soon as it raises an SMTP/socket error.
+    """
+
+    def __init__(
+            self,
+            connect: Callable[[], smtplib.SMTP],
+            max_connections: int = 4,
+            max_messages_per_connection: int = 100,
+            idle_timeout_seconds: float = 30.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        if max_connections <= 0:
+            raise ValueError("Pool size must be positive")
+        if max_messages_per_connection <= 0:
+            raise ValueError("Messages per connection must be positive")
+
+        self._connect = connect
+        self.max_connections = max_connections
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock
+        self._idle: Deque[_PooledConnection] = deque()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._opened = 0
+        self._reused = 0
+        self._recycled = 0
+
+    def send(self, sender: str, recipient: str, message: str) -> None:
+        # A pooled session may have been dropped by the server while idle: retry once on a fresh one.
+        try:
+            with self._session() as connection:
+                self._sendmail(connection, sender, recipient, message)
+        except smtplib.SMTPServerDisconnected:
+            with self._session(fresh=True) as connection:
+                self._sendmail(connection, sender, recipient, message)
+
+    def send_batch(self, messages: Sequence[OutgoingMessage]) -> List[Optional[Exception]]:
+        """Send messages over as few sessions as possible; returns one error (or None) per message."""
+        errors: List[Optional[Exception]] = []
+        pending = deque(messages)
+        fresh = False
+        while pending:
+            connected = False
+            sent_on_session = 0
+            try:
+                with self._session(fresh=fresh) as connection:
+                    connected = True
+                    while pending and connection.messages_sent < self.max_messages_per_connection:
+                        sender, recipient, message = pending[0]
+                        try:
+                            self._sendmail(connection, sender, recipient, message)
+                        except smtplib.SMTPRecipientsRefused as e:
+                            connection.smtp.rset()
+                            errors.append(e)
+                        else:
+                            errors.append(None)
+                        pending.popleft()
+                        sent_on_session += 1
+                fresh = False
+            except Exception as e:
+                if not connected:
+                    # No session could be opened (server down, login rejected): the rest would fail the same way.
+                    errors.extend([e] * len(pending))
+                    break
+                if isinstance(e, smtplib.SMTPServerDisconnected) and sent_on_session == 0 and not fresh:
+                    # A pooled session may have been dropped by the server while idle: retry once on a fresh one.
+                    fresh = True
+                    continue
+                # The session broke mid-batch: fail the message in flight and continue on a new session.
+                errors.append(e)
+                pending.popleft()
+                fresh = False
+        return errors
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for connection in idle:
+            self._quit(connection)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "opened": self._opened,
+                "reused": self._reused,
+                "recycled": self._recycled,
+                "idle": len(self._idle),
+                "max_connections": self.max_connections,
+            }
+
+    @contextmanager
+    def _session(self, fresh: bool = False) -> Iterator[_PooledConnection]:
+        self._slots.acquire()
+        connection = None
+        try:
+            connection = None if fresh else self._take_idle()
+            if connection is None:
+                connection = _PooledConnection(self._connect(), self._clock())
+                with self._lock:
+                    self._opened += 1
+            try:
+                yield connection
+            except BaseException:
+                # Whatever failed, the session may be mid-transaction: never hand it back to the pool.
+                self._quit(connection)
+                connection = None
+                raise
+            self._give_back(connection)
+        finally:
+            self._slots.release()
+
+    def _take_idle(self) -> Optional[_PooledConnection]:
+        stale = []
+        with self._lock:
+            # The idle queue is ordered from least to most recently used.
+            now = self._clock()
+            while self._idle and now - self._idle[0].last_used >= self.idle_timeout_seconds:
+                stale.append(self._idle.popleft())
+            self._recycled += len(stale)
+            found = self._idle.pop() if self._idle else None
+            if found is not None:
+                self._reused += 1
+        for connection in stale:
+            self._quit(connection)
+        return found
+
+    def _give_back(self, connection: _PooledConnection) -> None:
+        connection.last_used = self._clock()
+        with self._lock:
+            if not self._closed and connection.messages_sent < self.max_messages_per_connection:
+                self._idle.append(connection)
+                return
+            self._recycled += 1
+        self._quit(connection)
+
+    @staticmethod
+    def _sendmail(connection: _PooledConnection, sender: str, recipient: str, message: str) -> None:
+        connection.messages_sent += 1
+        connection.smtp.sendmail(sender, recipient, message)
+
+    @staticmethod
+    def _quit(connection: _PooledConnection) -> None:
+        try:
+            connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.smtp.close()
@@ -1,11 +1,15 @@
+import asyncio
 import smtplib
 import ssl
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from backend.application.interfaces.services.notification_service import NotificationService
+from backend.application.interfaces.services.notification_service import Notification, NotificationService
+from backend.core.models.notification_kind import NotificationKind
+from backend.infrastructure.services.smtp_connection_pool import SMTPConnectionPool
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence
 
 
 logger = logging.getLogger(__name__)
@@ -16,6 +20,20 @@ class SMTPNotificationService(NotificationService):
         self.smtp_port = int(os.getenv("SMTP_PORT", 587))
         self.sender_email = os.getenv("EMAIL_ADDRESS")
         self.sender_password = os.getenv("EMAIL_PASSWORD")
+        self.use_tls = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+        self.timeout_seconds = float(os.getenv("SMTP_TIMEOUT_SECONDS", 30))
+        self.max_concurrency = int(os.getenv("SMTP_MAX_CONCURRENCY", 4))
+        if self.max_concurrency <= 0:
+            raise ValueError("SMTP concurrency must be positive")
+
+        # smtplib is blocking: every SMTP session runs on this bounded pool instead of the event loop.
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="smtp")
+        self._pool = SMTPConnectionPool(
+            self._connect,
+            max_connections=self.max_concurrency,
+            max_messages_per_connection=int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", 100)),
+            idle_timeout_seconds=float(os.getenv("SMTP_IDLE_TIMEOUT_SECONDS", 30))
+        )
 
         # logger.warning(f"---------------> { self.sender_email} e {self.sender_password}")
 
@@ -31,35 +49,57 @@ class SMTPNotificationService(NotificationService):
     async def send_appointment_cancellation(self, recipient: str, details: Dict[str, Any]) -> bool:
         return await self._send_email(recipient, details, "Appointment Cancellation", self._create_text_cancellation_body, self._create_html_cancellation_body)
 
+    async def send_batch(self, notifications: Sequence[Notification]) -> List[bool]:
+        results = [False] * len(notifications)
+        if not self.sender_email or not self.sender_password:
+            logger.error("Cannot send %s notifications: SMTP credentials are not configured.", len(notifications))
+            return results
+
+        templates = {
+            NotificationKind.CONFIRMATION: ("Appointment Confirmation", self._create_text_body, self._create_html_body),
+            NotificationKind.REMINDER: ("Appointment Reminder", self._create_text_reminder_body, self._create_html_reminder_body),
+            NotificationKind.CANCELLATION: ("Appointment Cancellation", self._create_text_cancellation_body, self._create_html_cancellation_body),
+        }
+        outgoing = []
+        for index, (kind, recipient, details) in enumerate(notifications):
+            try:
+                message = self._build_message(recipient, details, *templates[kind])
+            except Exception:
+                logger.exception("Error rendering %s email to %s", kind, recipient)
+                continue
+            outgoing.append((index, (self.sender_email, recipient, message)))
+
+        # One chunk per pooled session, so the batch reuses at most max_concurrency logins.
+        chunks = [outgoing[offset::self.max_concurrency] for offset in range(min(self.max_concurrency, len(outgoing)))]
+        loop = asyncio.get_running_loop()
+        chunk_errors = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, self._pool.send_batch, [item for _, item in chunk]) for chunk in chunks),
+            return_exceptions=True
+        )
+
+        for chunk, errors in zip(chunks, chunk_errors):
+            if isinstance(errors, BaseException):
+                logger.error("Error sending a batch of %s emails: %s", len(chunk), errors)
+                continue
+            for (index, (_, recipient, _)), error in zip(chunk, errors):
+                if error is None:
+                    results[index] = True
+                else:
+                    logger.error("Error sending email to %s: %s", recipient, error)
+
+        logger.info("Sent %s of %s batched emails", sum(results), len(results))
+        return results
+
     async def _send_email(self, recipient_email: str, details: Dict[str, Any], subject_prefix: str, body_text_func, body_html_func) -> bool:
         if not self.sender_email or not self.sender_password:
             logger.error(f"Cannot send {subject_prefix.lower()}: SMTP credentials are not configured.")
             return False
 
         try:
-            message = MIMEMultipart("alternative")
-            subject = f"{subject_prefix} - {details.get('service_name', 'Service')}"
-            message["Subject"] = subject
-            message["From"] = self.sender_email
-            message["To"] = recipient_email
-
-            text_body = body_text_func(details)
-            html_body = body_html_func(details)
-
-            part1 = MIMEText(text_body, "plain")
-            part2 = MIMEText(html_body, "html")
+            message = self._build_message(recipient_email, details, subject_prefix, body_text_func, body_html_func)
 
-            message.attach(part1)
-            message.attach(part2)
-
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.sender_email, self.sender_password)
-                server.sendmail(self.sender_email, recipient_email, message.as_string())
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._deliver, recipient_email, message)
 
             logger.info(f"Confirmation email sent to {recipient_email}")
             return True
@@ -68,6 +108,44 @@ class SMTPNotificationService(NotificationService):
             logger.exception(f"Error sending {subject_prefix.lower()} email to {recipient_email}: {e}")
             return False
 
+    def _build_message(self, recipient_email: str, details: Dict[str, Any], subject_prefix: str, body_text_func, body_html_func) -> str:
+        message = MIMEMultipart("alternative")
+        subject = f"{subject_prefix} - {details.get('service_name', 'Service')}"
+        message["Subject"] = subject
+        message["From"] = self.sender_email
+        message["To"] = recipient_email
+
+        text_body = body_text_func(details)
+        html_body = body_html_func(details)
+
+        part1 = MIMEText(text_body, "plain")
+        part2 = MIMEText(html_body, "html")
+
+        message.attach(part1)
+        message.attach(part2)
+        return message.as_string()
+
+    def _deliver(self, recipient_email: str, message: str) -> None:
+        self._pool.send(self.sender_email, recipient_email, message)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout_seconds)
+        try:
+            if self.use_tls:
+                context = ssl.create_default_context()
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+                server.starttls(context=context)
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._pool.close()
+
     def _create_text_body(self, details: Dict[str, Any]) -> str:
         return f"""
         Hello {details.get('client_name', 'Client')},
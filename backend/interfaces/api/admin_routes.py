@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
+from backend.application.dtos.availability_cache_stats_response import AvailabilityCacheStatsResponse
 from backend.application.dtos.list_all_appointments_request import ListAllAppointmentsRequest
+from backend.application.dtos.password_hasher_stats_response import PasswordHasherStatsResponse
 from backend.application.dtos.list_all_appointments_response import ListAllAppointmentsResponse
 from backend.application.dtos.register_service_request import RegisterServiceRequest
 from backend.application.dtos.register_service_response import RegisterServiceResponse
 from backend.application.use_cases.list_all_appointments_use_case import ListAllAppointmentsUseCase
+from backend.application.interfaces.services.availability_cache import AvailabilityCache
+from backend.application.interfaces.services.password_hasher import PasswordHasher
 from backend.application.use_cases.register_service_use_case import RegisterServiceUseCase
 from backend.interfaces.dependencies import get_list_all_appointments_use_case, get_current_admin, \
-    get_create_service_use_case
+    get_create_service_use_case, get_availability_cache, get_password_hasher
 from backend.core.models.user import User
 import logging
 
@@ -25,6 +29,7 @@ async def list_all_appointments(
 
         if not response.success:
             status_code_map = {
+                "INVALID_CURSOR": 400,
                 "INTERNAL_ERROR": 500,
             }
             status_code = status_code_map.get(response.error_code, 500)
@@ -61,3 +66,16 @@ async def register_service(
         logger.exception("Unexpected error while creating service: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error while creating service.")
 
+@router.get("/availability-cache/stats", response_model=AvailabilityCacheStatsResponse)
+async def get_availability_cache_stats(
+    current_admin: str = Depends(get_current_admin),
+    availability_cache: AvailabilityCache = Depends(get_availability_cache)
+):
+    return AvailabilityCacheStatsResponse(**await availability_cache.stats())
+
+@router.get("/password-hasher/stats", response_model=PasswordHasherStatsResponse)
+async def get_password_hasher_stats(
+    current_admin: str = Depends(get_current_admin),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
+):
+    return PasswordHasherStatsResponse(**password_hasher.stats())
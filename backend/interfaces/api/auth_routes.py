@@ -27,6 +27,7 @@ async def admin_login(
         if not response.success:
             status_code_map = {
                 "INVALID_CREDENTIALS": 401,
+                "SERVICE_UNAVAILABLE": 503,
                 "TOKEN_GENERATION_ERROR": 500,
                 "INTERNAL_ERROR": 500,
             }
@@ -51,6 +52,7 @@ async def register_user(
             status_code_map = {
                 "VALIDATION_ERROR": 400,
                 "EMAIL_DUPLICATED": 409,
+                "SERVICE_UNAVAILABLE": 503,
                 "INTERNAL_ERROR": 500,
             }
             status_code = status_code_map.get(response.error_code, 400)
@@ -77,6 +79,7 @@ async def login_user(
             status_code_map = {
                 "INVALID_CREDENTIALS": 401,
                 "VALIDATION_ERROR": 400,
+                "SERVICE_UNAVAILABLE": 503,
             }
             status_code = status_code_map.get(response.error_code, 400)
             raise HTTPException(status_code=status_code, detail=response.message)
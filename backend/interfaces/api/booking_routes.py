@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
 from backend.application.dtos.book_appointment_request import BookAppointmentRequest
@@ -9,10 +10,13 @@ from backend.application.dtos.get_appointment_details_request import GetAppointm
 from backend.application.dtos.get_appointment_details_response import GetAppointmentDetailsResponse
 from backend.application.dtos.get_availability_request import GetAvailabilityRequest
 from backend.application.dtos.get_availability_response import GetAvailabilityResponse
+from backend.application.dtos.find_next_available_slots_request import FindNextAvailableSlotsRequest
+from backend.application.dtos.find_next_available_slots_response import FindNextAvailableSlotsResponse
 from backend.application.dtos.list_my_appointments_response import ListMyAppointmentsResponse
 from backend.application.use_cases.cancel_appointment_use_case import CancelAppointmentUseCase
 from backend.application.use_cases.get_appointment_details_use_case import GetAppointmentDetailsUseCase
 from backend.application.use_cases.get_availability_use_case import GetAvailabilityUseCase
+from backend.application.use_cases.find_next_available_slots_use_case import FindNextAvailableSlotsUseCase
 from backend.application.use_cases.book_appointment_use_case import BookAppointmentUseCase
 from backend.application.use_cases.list_my_appointments_use_case import ListMyAppointmentsUseCase
 from backend.core.models.service_type import ServiceType
@@ -20,7 +24,8 @@ from backend.core.models.user import User
 from backend.interfaces.dependencies import (
     get_book_appointment_use_case,
     get_get_availability_use_case, get_cancel_appointment_use_case, get_get_appointment_details_use_case,
-    get_current_logged_in_user, get_list_my_appointments_use_case,
+    get_current_logged_in_user, get_current_user_id, get_list_my_appointments_use_case,
+    get_find_next_available_slots_use_case,
 )
 import logging
 logger = logging.getLogger(__name__)
@@ -40,6 +45,7 @@ async def book_appointment(
         status_code_map = {
             "VALIDATION_ERROR": 400,
             "TIME_SLOT_CONFLICT": 409,
+            "USER_TIME_SLOT_CONFLICT": 409,
             "SERVICE_NOT_FOUND": 404,
             "INTERNAL_ERROR": 500,
         }
@@ -54,6 +60,8 @@ async def get_availability(
     service_type: ServiceType = Query(..., description="Type of service to check availability for"),
     start_date: datetime = Query(..., description="Start of the time range to check (ISO 8601 format)"),
     end_date: datetime = Query(..., description="End of the time range to check (ISO 8601 format)"),
+    per_service: bool = Query(False, description="Compute a separate slot grid for each service of the type"),
+    only_available: bool = Query(False, description="Leave busy slots out of the response"),
     use_case: GetAvailabilityUseCase = Depends(get_get_availability_use_case)
 ):
     if start_date >= end_date:
@@ -62,7 +70,9 @@ async def get_availability(
     request_data = GetAvailabilityRequest(
         service_type=service_type,
         start_date=start_date,
-        end_date=end_date
+        end_date=end_date,
+        per_service=per_service,
+        only_available=only_available
     )
 
     try:
@@ -72,13 +82,46 @@ async def get_availability(
     except Exception:
         raise HTTPException(status_code=500, detail="Internal server error while fetching availability.")
 
+@router.get("/next-available", response_model=FindNextAvailableSlotsResponse)
+async def find_next_available_slots(
+    service_type: Optional[ServiceType] = Query(None, description="Search every service of this type"),
+    service_id: Optional[str] = Query(None, description="Search a single service"),
+    after: Optional[datetime] = Query(None, description="Search forward from this instant (ISO 8601, defaults to now)"),
+    count: int = Query(5, ge=1, le=50, description="Number of free slots to return"),
+    horizon_days: int = Query(60, ge=1, le=365, description="How far ahead of the start to search"),
+    use_case: FindNextAvailableSlotsUseCase = Depends(get_find_next_available_slots_use_case)
+):
+    try:
+        request_data = FindNextAvailableSlotsRequest(
+            service_type=service_type,
+            service_id=service_id,
+            after=after,
+            count=count,
+            horizon_days=horizon_days
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
+
+    response = await use_case.execute(request_data)
+
+    if not response.success:
+        status_code_map = {
+            "VALIDATION_ERROR": 400,
+            "SERVICE_NOT_FOUND": 404,
+            "INTERNAL_ERROR": 500,
+        }
+        status_code = status_code_map.get(response.error_code, 400)
+        raise HTTPException(status_code=status_code, detail=response.message)
+
+    return response
+
 @router.get("/my-appointments", response_model=ListMyAppointmentsResponse)
 async def list_my_appointments(
-    current_user: User = Depends(get_current_logged_in_user),
+    current_user_id: str = Depends(get_current_user_id),
     use_case: ListMyAppointmentsUseCase = Depends(get_list_my_appointments_use_case)
 ):
     try:
-        response = await use_case.execute(user_id=current_user.id)
+        response = await use_case.execute(user_id=current_user_id)
 
         if not response.success:
             status_code_map = {
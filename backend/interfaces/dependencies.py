@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Optional, Tuple
 from fastapi import Depends
 import os
 from fastapi import Depends, HTTPException, status
@@ -7,12 +7,16 @@ from jose import jwt, JWTError
 
 from backend.application.interfaces.repositories.service_repository import ServiceRepository
 from backend.application.interfaces.repositories.user_repository import UserRepository
-from backend.application.interfaces.services.notification_service import NotificationService
+from backend.application.interfaces.services.availability_cache import AvailabilityCache
+from backend.application.interfaces.services.password_hasher import PasswordHasher
+from backend.application.interfaces.repositories.notification_outbox_repository import NotificationOutboxRepository
+from backend.application.interfaces.unit_of_work import UnitOfWork
 from backend.application.use_cases.admin_login_use_case import AdminLoginUseCase
 from backend.application.use_cases.book_appointment_use_case import BookAppointmentUseCase
 from backend.application.use_cases.cancel_appointment_use_case import CancelAppointmentUseCase
 from backend.application.use_cases.get_appointment_details_use_case import GetAppointmentDetailsUseCase
 from backend.application.use_cases.get_availability_use_case import GetAvailabilityUseCase
+from backend.application.use_cases.find_next_available_slots_use_case import FindNextAvailableSlotsUseCase
 from backend.application.use_cases.list_all_appointments_use_case import ListAllAppointmentsUseCase
 from backend.application.use_cases.list_my_appointments_use_case import ListMyAppointmentsUseCase
 from backend.application.use_cases.login_use_case import LoginUseCase
@@ -20,26 +24,42 @@ from backend.application.use_cases.register_service_use_case import RegisterServ
 from backend.application.use_cases.register_user_use_case import RegisterUserUseCase
 from backend.core.models.user import User
 from backend.infrastructure.database.postgres_dependencies import get_postgres_appointment_repository, \
-    get_postgres_user_repository, get_postgres_service_repository
+    get_postgres_user_repository, get_postgres_service_repository, get_postgres_notification_outbox_repository, \
+    get_unit_of_work
 from backend.application.interfaces.repositories.appointment_repository import AppointmentRepository
-from backend.infrastructure.notifications.email_notification_dependencies import get_notification_service
+from backend.infrastructure.caching.availability_cache_dependencies import get_availability_cache
+from backend.infrastructure.caching.principal_cache import PrincipalCache
+from backend.infrastructure.caching.principal_cache_dependencies import get_principal_cache
+from backend.infrastructure.services.password_hasher_dependencies import get_password_hasher
+from backend.infrastructure.scheduling.occupancy_calendar_dependencies import get_occupancy_calendar
+from backend.core.scheduling.occupancy_calendar import OccupancyCalendar
 
 
 def get_book_appointment_use_case(
     appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)],
     user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)],
     service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)],
-    notification_service: Annotated[NotificationService, Depends(get_notification_service)]
+    notification_outbox: Annotated[NotificationOutboxRepository, Depends(get_postgres_notification_outbox_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+    availability_cache: Annotated[AvailabilityCache, Depends(get_availability_cache)]
 ) -> BookAppointmentUseCase:
-    return BookAppointmentUseCase(appointment_repo=appointment_repo, user_repo=user_repo, service_repo=service_repo, notification_service=notification_service)
+    return BookAppointmentUseCase(appointment_repo=appointment_repo, user_repo=user_repo, service_repo=service_repo, notification_outbox=notification_outbox, unit_of_work=unit_of_work, availability_cache=availability_cache)
 
 
 def get_get_availability_use_case(
     appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)],
-    service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)]
+    service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)],
+    availability_cache: Annotated[AvailabilityCache, Depends(get_availability_cache)],
+    occupancy_calendar: Annotated[Optional[OccupancyCalendar], Depends(get_occupancy_calendar)]
 
 ) -> GetAvailabilityUseCase:
-    return GetAvailabilityUseCase(appointment_repo=appointment_repo,service_repo=service_repo)
+    return GetAvailabilityUseCase(appointment_repo=appointment_repo,service_repo=service_repo, availability_cache=availability_cache, occupancy_calendar=occupancy_calendar)
+
+def get_find_next_available_slots_use_case(
+    appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)],
+    service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)]
+) -> FindNextAvailableSlotsUseCase:
+    return FindNextAvailableSlotsUseCase(appointment_repo=appointment_repo, service_repo=service_repo)
 
 def get_get_appointment_details_use_case(
     appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)],
@@ -51,12 +71,12 @@ def get_get_appointment_details_use_case(
 
 def get_cancel_appointment_use_case(
         appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)],
-        user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)],
-        service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)],
-        notification_service: Annotated[NotificationService, Depends(get_notification_service)]
+        notification_outbox: Annotated[NotificationOutboxRepository, Depends(get_postgres_notification_outbox_repository)],
+        unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+        availability_cache: Annotated[AvailabilityCache, Depends(get_availability_cache)]
 
 ) -> CancelAppointmentUseCase:
-    return CancelAppointmentUseCase(appointment_repo=appointment_repo, user_repo=user_repo, service_repo=service_repo, notification_service=notification_service)
+    return CancelAppointmentUseCase(appointment_repo=appointment_repo, notification_outbox=notification_outbox, unit_of_work=unit_of_work, availability_cache=availability_cache)
 
 def get_list_my_appointments_use_case(
     appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)],
@@ -65,26 +85,28 @@ def get_list_my_appointments_use_case(
     return ListMyAppointmentsUseCase(appointment_repo=appointment_repo, service_repo=service_repo)
 
 def get_register_user_use_case(
-    user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)]
+    user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+    password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)]
 ) -> RegisterUserUseCase:
-    return RegisterUserUseCase(user_repo=user_repo)
+    return RegisterUserUseCase(user_repo=user_repo, unit_of_work=unit_of_work, password_hasher=password_hasher)
 
 def get_create_service_use_case(
-    service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)]
+    service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)]
 ) -> RegisterServiceUseCase:
-    return RegisterServiceUseCase(service_repo=service_repo)
+    return RegisterServiceUseCase(service_repo=service_repo, unit_of_work=unit_of_work)
 
 def get_login_use_case(
-    user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)]
+    user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)],
+    password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)]
 ) -> LoginUseCase:
-    return LoginUseCase(user_repo=user_repo)
+    return LoginUseCase(user_repo=user_repo, password_hasher=password_hasher)
 
 def get_list_all_appointments_use_case(
-    appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)],
-    user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)],
-    service_repo: Annotated[ServiceRepository, Depends(get_postgres_service_repository)]
+    appointment_repo: Annotated[AppointmentRepository, Depends(get_postgres_appointment_repository)]
 ) -> ListAllAppointmentsUseCase:
-    return ListAllAppointmentsUseCase(appointment_repo=appointment_repo, user_repo=user_repo, service_repo=service_repo)
+    return ListAllAppointmentsUseCase(appointment_repo=appointment_repo)
 
 
 
@@ -117,16 +139,13 @@ async def get_current_admin(
     return user_id
 
 
-def get_admin_login_use_case():
-    return AdminLoginUseCase()
-
-
-async def get_current_logged_in_user(
-    credentials: Annotated[HTTPAuthorizationCredentials,Depends(security_scheme)],
-    user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)]
+def get_admin_login_use_case(
+    password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)]
+) -> AdminLoginUseCase:
+    return AdminLoginUseCase(password_hasher=password_hasher)
 
 
-) -> User:
+def _decode_user_token(credentials: HTTPAuthorizationCredentials) -> Tuple[str, float]:
     unauthorized_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -147,8 +166,37 @@ async def get_current_logged_in_user(
     except JWTError:
         raise unauthorized_exception
 
+    return user_id, payload["exp"]
+
+
+async def get_current_user_id(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security_scheme)]
+) -> str:
+    """Principal from the signed claims alone, for read-only routes that only need the caller's id."""
+    user_id, _ = _decode_user_token(credentials)
+    return user_id
+
+
+async def get_current_logged_in_user(
+    credentials: Annotated[HTTPAuthorizationCredentials,Depends(security_scheme)],
+    user_repo: Annotated[UserRepository, Depends(get_postgres_user_repository)],
+    principal_cache: Annotated[Optional[PrincipalCache], Depends(get_principal_cache)]
+) -> User:
+    user_id, expires_at = _decode_user_token(credentials)
+
+    if principal_cache is not None:
+        cached_user = principal_cache.get(user_id, expires_at)
+        if cached_user is not None:
+            return cached_user
+
     user = await user_repo.find_by_id(user_id)
     if user is None:
-        raise unauthorized_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
+    if principal_cache is not None:
+        principal_cache.set(user_id, expires_at, user)
     return user
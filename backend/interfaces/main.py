@@ -5,8 +5,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from backend.core.models.service import Service
 from backend.core.models.service_type import ServiceType
 from backend.infrastructure.database.postgres_config import engine
+from backend.infrastructure.database.schema_upgrades import create_extensions, apply_schema_upgrades
+from backend.infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from backend.infrastructure.models.base import Base
+from backend.infrastructure.notifications.email_notification_dependencies import smtp_service
+from backend.infrastructure.notifications.notification_outbox_dependencies import notification_outbox_worker, \
+    NOTIFICATION_OUTBOX_WORKER_ENABLED
 from backend.infrastructure.repositories.postgres_service_repository import PostgresServiceRepository
+from backend.infrastructure.services.password_hasher_dependencies import bcrypt_password_hasher
+from backend.infrastructure.scheduling.appointment_reminder_dependencies import appointment_reminder_scheduler, \
+    APPOINTMENT_REMINDERS_ENABLED
+from backend.infrastructure.scheduling.occupancy_calendar_dependencies import rebuild_occupancy_calendar, \
+    OCCUPANCY_BITMAPS_ENABLED
 from backend.interfaces.api.booking_routes import router as booking_router
 from backend.interfaces.api.auth_routes import router as auth_router
 from backend.interfaces.api.admin_routes import router as admin_router
@@ -32,7 +42,9 @@ load_dotenv()
 async def lifespan(app: FastAPI):
     logger.info("Initializing database tables...")
     async with engine.begin() as conn:
+        await create_extensions(conn)
         await conn.run_sync(Base.metadata.create_all)
+        await apply_schema_upgrades(conn)
     logger.info("Database tables initialized.")
 
     logger.info("Checking for initial services...")
@@ -91,9 +103,32 @@ async def lifespan(app: FastAPI):
             else:
                 logger.info("Service %s already exists, skipping creation.", service_data.name)
 
+        await SQLAlchemyUnitOfWork(session).commit()
+
     logger.info("Initial services checked/created.")
+
+    if OCCUPANCY_BITMAPS_ENABLED:
+        logger.info("Rebuilding occupancy bitmaps...")
+        async with async_sessionmaker_instance() as session:
+            loaded_count = await rebuild_occupancy_calendar(session)
+        logger.info("Occupancy bitmaps rebuilt from %s scheduled appointments.", loaded_count)
+
+    if NOTIFICATION_OUTBOX_WORKER_ENABLED:
+        notification_outbox_worker.start()
+        logger.info("Notification outbox worker started.")
+
+    if APPOINTMENT_REMINDERS_ENABLED:
+        appointment_reminder_scheduler.start()
+        logger.info("Appointment reminder scheduler started.")
+
     yield
     logger.info("Shutting down...")
+    if APPOINTMENT_REMINDERS_ENABLED:
+        await appointment_reminder_scheduler.stop()
+    if NOTIFICATION_OUTBOX_WORKER_ENABLED:
+        await notification_outbox_worker.stop()
+    smtp_service.shutdown()
+    bcrypt_password_hasher.shutdown()
 
 
 app = FastAPI(
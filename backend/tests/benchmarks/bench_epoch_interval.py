@@ -0,0 +1,105 @@
+"""Compares TimeSlot with EpochInterval, and the epoch-based SlotEngine sweep with the former datetime sweep.
+
+Run from the repository root:
+
+    python -m backend.tests.benchmarks.bench_epoch_interval
+
+Windows are parsed by pydantic, as the availability endpoint does. pydantic attaches its own UTC
+tzinfo, while rows from asyncpg carry datetime.timezone.utc, and datetimes with different tzinfo
+objects take CPython's slow comparison path.
+"""
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from pydantic import TypeAdapter
+
+from backend.core.scheduling.slot_engine import SlotEngine
+from backend.core.value_objects.epoch_interval import EpochInterval
+from backend.core.value_objects.time_slot import TimeSlot
+
+COUNT = 100_000
+SLOT_DURATION = timedelta(minutes=30)
+BOOKINGS_PER_DAY = 20
+DAY_ZERO = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_sweep(busy_slots, start, end, slot_duration):
+    merged = []
+    for slot_start, slot_end in sorted((slot.start, slot.end) for slot in busy_slots):
+        if merged and slot_start <= merged[-1][1]:
+            if slot_end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], slot_end)
+        else:
+            merged.append((slot_start, slot_end))
+
+    slots, busy_index = [], 0
+    current_start = start
+    while current_start < end:
+        current_end = current_start + slot_duration
+        while busy_index < len(merged) and merged[busy_index][1] <= current_start:
+            busy_index += 1
+        slots.append((current_start, current_end, busy_index == len(merged) or merged[busy_index][0] >= current_end))
+        current_start = current_end
+    return slots
+
+
+def best_of(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bytes_per_item(factory):
+    tracemalloc.start()
+    items = [factory(index) for index in range(COUNT)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current / COUNT
+
+
+def main():
+    time_slot_bytes = bytes_per_item(
+        lambda index: TimeSlot(DAY_ZERO + timedelta(minutes=index), DAY_ZERO + timedelta(minutes=index + 30))
+    )
+    epoch_bytes = bytes_per_item(
+        lambda index: EpochInterval.from_datetimes(DAY_ZERO + timedelta(minutes=index),
+                                                   DAY_ZERO + timedelta(minutes=index + 30))
+    )
+    print(f"memory per interval: TimeSlot {time_slot_bytes:.0f} B, EpochInterval {epoch_bytes:.0f} B")
+
+    parse = TypeAdapter(datetime).validate_python
+    slots = [TimeSlot(DAY_ZERO + timedelta(minutes=15 * index), DAY_ZERO + timedelta(minutes=15 * index + 30))
+             for index in range(COUNT)]
+    probe = TimeSlot(parse("2024-01-02T10:00:00Z"), parse("2024-01-02T11:00:00Z"))
+    intervals = [EpochInterval.from_time_slot(slot) for slot in slots]
+    epoch_probe = EpochInterval.from_time_slot(probe)
+    time_slot_seconds, _ = best_of(lambda: sum(probe.overlaps(slot) for slot in slots))
+    epoch_seconds, _ = best_of(lambda: sum(epoch_probe.overlaps(interval) for interval in intervals))
+    print(f"{COUNT} overlap checks: TimeSlot {time_slot_seconds * 1000:.1f} ms, "
+          f"EpochInterval {epoch_seconds * 1000:.1f} ms")
+
+    rng = random.Random(7)
+    print(f"\n{'days':>5} {'bookings':>9} {'datetime sweep ms':>18} {'epoch sweep ms':>15}")
+    for days in (7, 31, 90, 365):
+        start = parse(DAY_ZERO.isoformat())
+        end = parse((DAY_ZERO + timedelta(days=days)).isoformat())
+        bookings = []
+        for _ in range(days * BOOKINGS_PER_DAY):
+            booking_start = DAY_ZERO + timedelta(minutes=rng.randrange(0, days * 24 * 60, 15))
+            bookings.append(TimeSlot(booking_start, booking_start + timedelta(minutes=rng.choice([30, 45, 90]))))
+
+        legacy_seconds, legacy_slots = best_of(lambda: datetime_sweep(bookings, start, end, SLOT_DURATION))
+        engine_seconds, engine_slots = best_of(lambda: SlotEngine(bookings).compute_slots(start, end, SLOT_DURATION))
+        assert legacy_slots == engine_slots
+        print(f"{days:>5} {len(bookings):>9} {legacy_seconds * 1000:>18.1f} {engine_seconds * 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
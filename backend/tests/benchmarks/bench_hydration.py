@@ -0,0 +1,96 @@
+"""Compares validated and trusted hydration of users and appointments read from the database.
+
+Run from the repository root:
+
+    python -m backend.tests.benchmarks.bench_hydration
+
+Rows are plain objects shaped like the ORM models, so only the row -> domain mapping is timed.
+"""
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from backend.core.models.appointment import Appointment
+from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.service_type import ServiceType
+from backend.core.models.user import User
+from backend.core.value_objects.email import Email
+from backend.core.value_objects.hashed_password import HashedPassword
+from backend.core.value_objects.time_slot import TimeSlot
+from backend.infrastructure.repositories.postgres_appointment_repository import PostgresAppointmentRepository
+from backend.infrastructure.repositories.postgres_user_repository import PostgresUserRepository
+
+ROWS = 100_000
+START = datetime(2030, 1, 1, tzinfo=timezone.utc)
+HASH = "$2b$12$" + "a" * 53
+
+
+def validated_user(db_user):
+    return User(
+        id=str(db_user.id),
+        name=db_user.name,
+        email=Email(db_user.email),
+        phone=db_user.phone,
+        hashed_password=HashedPassword(db_user.hashed_password),
+        created_at=db_user.created_at,
+        updated_at=db_user.updated_at
+    )
+
+
+def validated_appointment(db_appointment):
+    return Appointment(
+        id=str(db_appointment.id),
+        user_id=str(db_appointment.user_id),
+        service_id=str(db_appointment.service_id),
+        scheduled_slot=TimeSlot(start=db_appointment.scheduled_start, end=db_appointment.scheduled_end),
+        status=db_appointment.status,
+        view_token=db_appointment.view_token,
+        cancellation_token=db_appointment.cancellation_token,
+        created_at=db_appointment.created_at,
+        updated_at=db_appointment.updated_at,
+        service_type=db_appointment.service_type,
+    )
+
+
+def make_user_rows():
+    return [
+        SimpleNamespace(id=uuid.uuid4(), name=f"Client {index}", email=f"client{index}@example.com",
+                        phone="5511999998888", hashed_password=HASH, created_at=START, updated_at=START)
+        for index in range(ROWS)
+    ]
+
+
+def make_appointment_rows():
+    return [
+        SimpleNamespace(id=uuid.uuid4(), user_id=uuid.uuid4(), service_id=uuid.uuid4(),
+                        scheduled_start=START + timedelta(minutes=30 * index),
+                        scheduled_end=START + timedelta(minutes=30 * index + 30),
+                        status=AppointmentStatus.SCHEDULED, view_token="view", cancellation_token="cancel",
+                        created_at=START, updated_at=START, service_type=ServiceType.CONSULTATION)
+        for index in range(ROWS)
+    ]
+
+
+def measure(mapper, rows):
+    started = time.perf_counter()
+    for row in rows:
+        mapper(row)
+    return time.perf_counter() - started
+
+
+def main():
+    print(f"{'entity':<12} {'validated':>14} {'trusted':>14} {'speedup':>8}")
+    for label, rows, validated, trusted in (
+        ("users", make_user_rows(), validated_user, PostgresUserRepository._to_domain_entity),
+        ("appointments", make_appointment_rows(), validated_appointment,
+         PostgresAppointmentRepository._to_domain_entity),
+    ):
+        validated_seconds = measure(validated, rows)
+        trusted_seconds = measure(trusted, rows)
+        print(f"{label:<12} {ROWS / validated_seconds:>10.0f} /s {ROWS / trusted_seconds:>10.0f} /s "
+              f"{validated_seconds / trusted_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
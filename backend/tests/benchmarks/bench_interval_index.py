@@ -0,0 +1,91 @@
+"""Compares IntervalIndex with linear scans over TimeSlot for overlap and free-gap queries.
+
+Run from the repository root:
+
+    python -m backend.tests.benchmarks.bench_interval_index
+
+Bookings are 15-minute aligned, like the booking flow produces, and the calendar gets denser as it
+grows. The linear baselines are the TimeSlot.overlaps scan and a sorted walk for the first gap.
+"""
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.core.scheduling.interval_index import IntervalIndex
+from backend.core.value_objects.epoch_interval import EpochInterval, to_epoch_micros, to_micros
+from backend.core.value_objects.time_slot import TimeSlot
+
+QUERIES = 1000
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+STEP = timedelta(minutes=15)
+
+
+def make_bookings(count, rng):
+    span_cells = count * 4
+    bookings = []
+    for _ in range(count):
+        booking_start = START + STEP * rng.randrange(span_cells)
+        bookings.append(TimeSlot(booking_start, booking_start + STEP * rng.choice([2, 3, 6])))
+    return bookings
+
+
+def linear_overlapping(bookings, probe):
+    return [booking for booking in bookings if booking.overlaps(probe)]
+
+
+def linear_find_gap(sorted_bookings, after, length):
+    cursor = after
+    for booking in sorted_bookings:
+        if booking.end <= cursor:
+            continue
+        if booking.start - cursor >= length:
+            return cursor
+        cursor = max(cursor, booking.end)
+    return cursor
+
+
+def timed(func, iterations):
+    started = time.perf_counter()
+    for iteration in range(iterations):
+        func(iteration)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    rng = random.Random(3)
+    print(f"{'bookings':>9} {'scan overlap us':>16} {'index overlap us':>17} "
+          f"{'scan gap us':>12} {'index gap us':>13} {'insert+remove us':>17}")
+    for count in (1_000, 10_000, 100_000):
+        bookings = make_bookings(count, rng)
+        sorted_bookings = sorted(bookings, key=lambda booking: booking.start)
+        index = IntervalIndex(
+            (interval.start, interval.end, key)
+            for key, interval in enumerate(EpochInterval.from_time_slot(booking) for booking in bookings)
+        )
+
+        probes = [TimeSlot(START + STEP * offset, START + STEP * (offset + 4))
+                  for offset in (rng.randrange(count * 4) for _ in range(QUERIES))]
+        epoch_probes = [EpochInterval.from_time_slot(probe) for probe in probes]
+        gap_length = timedelta(hours=3)
+
+        scan_overlap = timed(lambda i: linear_overlapping(bookings, probes[i]), min(QUERIES, 200))
+        index_overlap = timed(lambda i: index.overlapping(epoch_probes[i].start, epoch_probes[i].end), QUERIES)
+        scan_gap = timed(lambda i: linear_find_gap(sorted_bookings, probes[i].start, gap_length), min(QUERIES, 200))
+        index_gap = timed(
+            lambda i: index.find_gap(epoch_probes[i].start, to_micros(gap_length), step=to_micros(STEP)), QUERIES
+        )
+        for i in range(10):
+            assert index.find_gap(epoch_probes[i].start, to_micros(gap_length)) == \
+                to_epoch_micros(linear_find_gap(sorted_bookings, probes[i].start, gap_length))
+
+        def insert_and_remove(i):
+            index.insert(epoch_probes[i].start, epoch_probes[i].end, -1)
+            index.remove(epoch_probes[i].start, epoch_probes[i].end, -1)
+
+        churn = timed(insert_and_remove, QUERIES)
+        print(f"{count:>9} {scan_overlap:>16.1f} {index_overlap:>17.1f} "
+              f"{scan_gap:>12.1f} {index_gap:>13.1f} {churn:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
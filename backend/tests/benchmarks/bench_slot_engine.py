@@ -0,0 +1,78 @@
+"""Compares the sweep-line SlotEngine with the former pairwise overlap loop.
+
+Run from the repository root:
+
+    python -m backend.tests.benchmarks.bench_slot_engine
+
+The window grows together with the number of bookings, so a linear algorithm
+keeps a flat cost per slot while the pairwise loop grows with the window size.
+"""
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.core.scheduling.slot_engine import SlotEngine
+from backend.core.value_objects.time_slot import TimeSlot
+
+SLOT_DURATION = timedelta(minutes=30)
+BOOKINGS_PER_DAY = 20
+
+
+def pairwise_compute_slots(start, end, slot_duration, busy_slots):
+    slots = []
+    current_start = start
+    while current_start < end:
+        current_end = current_start + slot_duration
+        is_available = True
+        for busy_slot in busy_slots:
+            if TimeSlot(start=current_start, end=current_end).overlaps(busy_slot):
+                is_available = False
+                break
+        slots.append((current_start, current_end, is_available))
+        current_start = current_end
+    return slots
+
+
+def generate_bookings(start, days, rng):
+    bookings = []
+    for _ in range(days * BOOKINGS_PER_DAY):
+        booking_start = start + timedelta(minutes=rng.randrange(0, days * 24 * 60, 15))
+        bookings.append(TimeSlot(booking_start, booking_start + timedelta(minutes=rng.choice([30, 45, 90]))))
+    return bookings
+
+
+def measure(func, *args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    print(f"{'days':>5} {'slots':>7} {'bookings':>9} {'pairwise ms':>12} {'engine ms':>10} {'engine us/slot':>15}")
+    for days in (1, 7, 31, 90, 365):
+        end = start + timedelta(days=days)
+        bookings = generate_bookings(start, days, rng)
+
+        engine_time, engine_slots = measure(lambda: SlotEngine(bookings).compute_slots(start, end, SLOT_DURATION))
+        if days <= 31:
+            pairwise_time, pairwise_slots = measure(pairwise_compute_slots, start, end, SLOT_DURATION, bookings)
+            assert pairwise_slots == engine_slots
+            pairwise_column = f"{pairwise_time * 1000:12.1f}"
+        else:
+            pairwise_column = f"{'skipped':>12}"
+
+        print(
+            f"{days:>5} {len(engine_slots):>7} {len(bookings):>9} {pairwise_column} "
+            f"{engine_time * 1000:10.1f} {engine_time / len(engine_slots) * 1e6:15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compares one SMTP session per message with the pooled SMTPConnectionPool.
+
+Run from the repository root:
+
+    python -m backend.tests.benchmarks.bench_smtp_pool
+
+The local sink sleeps on every new connection to stand in for the TCP, TLS and
+login round trips of a real relay, which is the cost pooling avoids.
+"""
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.infrastructure.services.smtp_connection_pool import SMTPConnectionPool
+from backend.tests.support.smtp_stub import SMTPStubServer
+
+HANDSHAKE_DELAY_SECONDS = 0.02
+MESSAGES = 500
+WORKERS = 4
+
+
+def outgoing(count):
+    return [("clinic@example.com", f"client{i}@example.com", f"Subject: Reminder {i}\r\n\r\nSee you soon.")
+            for i in range(count)]
+
+
+def connector(port):
+    def connect():
+        smtp = smtplib.SMTP("127.0.0.1", port, timeout=10)
+        smtp.login("clinic@example.com", "secret")
+        return smtp
+    return connect
+
+
+def send_unpooled(connect, messages):
+    def send(outgoing_message):
+        sender, recipient, message = outgoing_message
+        with connect() as smtp:
+            smtp.sendmail(sender, recipient, message)
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        list(executor.map(send, messages))
+
+
+def send_pooled(connect, messages):
+    pool = SMTPConnectionPool(connect, max_connections=WORKERS)
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        list(executor.map(lambda outgoing_message: pool.send(*outgoing_message), messages))
+    pool.close()
+
+
+def send_pooled_batches(connect, messages):
+    pool = SMTPConnectionPool(connect, max_connections=WORKERS)
+    chunk_size = -(-len(messages) // WORKERS)
+    chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        for errors in executor.map(pool.send_batch, chunks):
+            assert not any(errors)
+    pool.close()
+
+
+def main():
+    messages = outgoing(MESSAGES)
+    print(f"{MESSAGES} messages, {WORKERS} workers, {HANDSHAKE_DELAY_SECONDS * 1000:.0f} ms handshake")
+    print(f"{'mode':>16} {'connections':>12} {'seconds':>8} {'msg/s':>8}")
+    for name, send in (("unpooled", send_unpooled), ("pooled", send_pooled), ("pooled batches", send_pooled_batches)):
+        with SMTPStubServer(handshake_delay_seconds=HANDSHAKE_DELAY_SECONDS) as server:
+            started = time.perf_counter()
+            send(connector(server.port), messages)
+            elapsed = time.perf_counter() - started
+            assert len(server.messages) == MESSAGES
+            print(f"{name:>16} {server.connections:>12} {elapsed:8.2f} {MESSAGES / elapsed:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
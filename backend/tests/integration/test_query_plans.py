@@ -0,0 +1,165 @@
+"""Fails when a hot appointment query falls back to a sequential scan of the appointments table.
+
+Needs a Postgres database in TEST_DATABASE_URL (postgresql+asyncpg://...). Everything is created in a
+throwaway schema that is dropped afterwards; the btree_gist extension must be installable.
+"""
+import asyncio
+import os
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.service_type import ServiceType
+from backend.infrastructure.models.appointment_model import AppointmentModel
+from backend.infrastructure.models.service_model import ServiceModel
+from backend.infrastructure.models.user_model import UserModel
+from backend.infrastructure.repositories.postgres_appointment_repository import PostgresAppointmentRepository
+from backend.tests.support.postgres_schema import throwaway_schema
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+SERVICES_PER_TYPE = 4
+USERS_PER_SERVICE = 100
+APPOINTMENTS_PER_SERVICE = 2000
+NOW = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class Dataset:
+    def __init__(self):
+        self.service_ids: List[uuid.UUID] = []
+        self.service_types: Dict[uuid.UUID, ServiceType] = {}
+        self.user_ids: List[uuid.UUID] = []
+
+
+def hot_queries(dataset: Dataset):
+    service_id = str(dataset.service_ids[0])
+    type_service_ids = [str(sid) for sid, st in dataset.service_types.items() if st == ServiceType.CONSULTATION]
+    user_id = str(dataset.user_ids[0])
+    window_start, window_end = NOW + timedelta(days=2), NOW + timedelta(days=3)
+    cursor = (NOW - timedelta(days=30), str(uuid.UUID(int=0)))
+
+    return {
+        "find_scheduled_between": lambda repo: repo.find_scheduled_between(window_start, window_end, service_id),
+        "find_scheduled_between_for_services":
+            lambda repo: repo.find_scheduled_between_for_services(window_start, window_end, type_service_ids),
+        "find_scheduled_between_for_user":
+            lambda repo: repo.find_scheduled_between_for_user(user_id, window_start, window_end),
+        "find_scheduled_ending_after": lambda repo: repo.find_scheduled_ending_after(NOW),
+        "find_by_user_id": lambda repo: repo.find_by_user_id(user_id),
+        "find_admin_summaries": lambda repo: repo.find_admin_summaries(limit=51),
+        "find_admin_summaries_by_type":
+            lambda repo: repo.find_admin_summaries(service_type=ServiceType.EMERGENCY, limit=51),
+        "find_admin_summaries_after_cursor": lambda repo: repo.find_admin_summaries(limit=51, after=cursor),
+        "claim_due_reminders": lambda repo: repo.claim_due_reminders(NOW, NOW + timedelta(days=1), 200),
+    }
+
+
+async def seed(session: AsyncSession) -> Dataset:
+    rng = random.Random(11)
+    dataset = Dataset()
+    services, users, appointments = [], [], []
+
+    for service_type in ServiceType:
+        for index in range(SERVICES_PER_TYPE):
+            service_id = uuid.uuid4()
+            dataset.service_ids.append(service_id)
+            dataset.service_types[service_id] = service_type
+            services.append({
+                "id": service_id, "name": f"{service_type} {index}", "description": "Plan test service",
+                "duration_minutes": 30, "price": 100.0, "service_type": service_type,
+            })
+
+    for service_id in dataset.service_ids:
+        # Each service books its own users, so per-user overlaps stay impossible.
+        service_users = [uuid.uuid4() for _ in range(USERS_PER_SERVICE)]
+        dataset.user_ids.extend(service_users)
+        users.extend({
+            "id": user_id, "name": "Plan Test", "email": f"{user_id}@example.com", "hashed_password": "x",
+        } for user_id in service_users)
+
+        start = NOW - timedelta(days=640)
+        for index in range(APPOINTMENTS_PER_SERVICE):
+            start += timedelta(hours=rng.randint(6, 10))
+            if start < NOW:
+                status = AppointmentStatus.CANCELLED if rng.random() < 0.1 else AppointmentStatus.COMPLETED
+            else:
+                status = AppointmentStatus.SCHEDULED
+            appointments.append({
+                "id": uuid.uuid4(), "user_id": service_users[index % USERS_PER_SERVICE], "service_id": service_id,
+                "service_type": dataset.service_types[service_id], "scheduled_start": start,
+                "scheduled_end": start + timedelta(minutes=30), "status": status,
+                "view_token": str(uuid.uuid4()), "cancellation_token": str(uuid.uuid4()),
+                "reminder_sent_at": start - timedelta(days=1) if start < NOW else None,
+            })
+
+    await session.execute(insert(ServiceModel), services)
+    await session.execute(insert(UserModel), users)
+    for offset in range(0, len(appointments), 5000):
+        await session.execute(insert(AppointmentModel), appointments[offset:offset + 5000])
+    await session.commit()
+    return dataset
+
+
+async def collect_plans() -> Dict[str, List[str]]:
+    captured: List[Tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and "appointments" in statement:
+            captured.append((statement, parameters))
+
+    async with throwaway_schema(TEST_DATABASE_URL) as engine:
+        async with AsyncSession(engine) as session:
+            dataset = await seed(session)
+        async with engine.begin() as conn:
+            await conn.execute(text("ANALYZE"))
+
+        plans = {}
+        for name, query in hot_queries(dataset).items():
+            captured.clear()
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            try:
+                async with AsyncSession(engine) as session:
+                    await query(PostgresAppointmentRepository(session))
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+            plans[name] = []
+            async with engine.connect() as conn:
+                for statement, parameters in captured:
+                    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                    plans[name].append("\n".join(row[0] for row in result))
+        return plans
+
+
+@pytest.fixture(scope="module")
+def query_plans():
+    return asyncio.run(collect_plans())
+
+
+class TestAppointmentQueryPlans:
+
+    @pytest.mark.parametrize("query_name", [
+        "find_scheduled_between",
+        "find_scheduled_between_for_services",
+        "find_scheduled_between_for_user",
+        "find_scheduled_ending_after",
+        "find_by_user_id",
+        "find_admin_summaries",
+        "find_admin_summaries_by_type",
+        "find_admin_summaries_after_cursor",
+        "claim_due_reminders",
+    ])
+    def test_hot_query_uses_an_index(self, query_plans, query_name):
+        plans = query_plans[query_name]
+
+        assert plans, f"{query_name} issued no statement on appointments"
+        for plan in plans:
+            assert "Seq Scan on appointments" not in plan, plan
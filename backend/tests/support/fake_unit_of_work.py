@@ -0,0 +1,13 @@
+from backend.application.interfaces.unit_of_work import UnitOfWork
+
+
+class FakeUnitOfWork(UnitOfWork):
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
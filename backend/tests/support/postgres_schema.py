@@ -0,0 +1,24 @@
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from backend.infrastructure.database.schema_upgrades import create_extensions, apply_schema_upgrades
+from backend.infrastructure.models.base import Base
+
+@asynccontextmanager
+async def throwaway_schema(database_url: str) -> AsyncIterator[AsyncEngine]:
+    """Engine whose search_path points at a fresh schema with all tables; the schema is dropped on exit."""
+    schema = f"scheduleflow_test_{uuid.uuid4().hex[:8]}"
+    engine = create_async_engine(database_url, connect_args={"server_settings": {"search_path": f"{schema}, public"}})
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await create_extensions(conn)
+            await conn.run_sync(Base.metadata.create_all)
+            await apply_schema_upgrades(conn)
+        yield engine
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await engine.dispose()
@@ -0,0 +1,91 @@
+import socketserver
+import threading
+import time
+from typing import List, Tuple
+
+class _SMTPStubHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        server: SMTPStubServer = self.server
+        with server.lock:
+            server.connections += 1
+        time.sleep(server.handshake_delay_seconds)
+        self._reply("220 stub ESMTP ready")
+        mail_from, recipients = None, []
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().rstrip("\r\n")
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb == "EHLO":
+                self._reply("250-stub", "250 AUTH PLAIN LOGIN")
+            elif verb == "HELO":
+                self._reply("250 stub")
+            elif verb == "AUTH":
+                self._reply("235 Authentication successful")
+            elif verb == "MAIL":
+                mail_from, recipients = command[10:].strip("<>"), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command[8:].strip("<>"))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                for data_line in iter(self.rfile.readline, b""):
+                    if data_line in (b".\r\n", b".\n"):
+                        break
+                    body.append(data_line.decode())
+                time.sleep(server.delay_seconds)
+                with server.lock:
+                    server.messages.append((mail_from, recipients, "".join(body)))
+                self._reply("250 Message accepted")
+            elif verb == "RSET":
+                mail_from, recipients = None, []
+                self._reply("250 OK")
+            elif verb == "NOOP":
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _reply(self, *lines: str) -> None:
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+
+
+class SMTPStubServer(socketserver.ThreadingTCPServer):
+    """Minimal plain-text SMTP server for tests.
+
+    ``handshake_delay_seconds`` is paid once per connection (standing in for TLS and login),
+    ``delay_seconds`` on every message.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, delay_seconds: float = 0.0, handshake_delay_seconds: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _SMTPStubHandler)
+        self.delay_seconds = delay_seconds
+        self.handshake_delay_seconds = handshake_delay_seconds
+        self.connections = 0
+        self.messages: List[Tuple[str, List[str], str]] = []
+        self.lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
@@ -0,0 +1,152 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.application.dtos.get_availability_request import GetAvailabilityRequest
+from backend.application.dtos.get_availability_response import GetAvailabilityResponse
+from backend.core.models.service_type import ServiceType
+from backend.infrastructure.caching.in_memory_availability_cache import InMemoryAvailabilityCache
+from backend.infrastructure.caching.ttl_lru_cache import TTLLRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_request(service_type, start, end):
+    return GetAvailabilityRequest(service_type=service_type, start_date=start, end_date=end)
+
+
+def make_response(service_type):
+    return GetAvailabilityResponse(service_type=service_type, time_slots=[], available_services=[])
+
+
+class TestTTLLRUCache:
+
+    def test_get_counts_hits_and_misses(self):
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=10)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        clock = FakeClock()
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        removed = []
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=10, on_remove=removed.append)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert "a" in cache
+        assert removed == ["b"]
+        assert cache.stats()["evictions"] == 1
+
+    def test_cache_fails_with_non_positive_size(self):
+        with pytest.raises(ValueError, match="Cache size must be positive"):
+            TTLLRUCache(max_entries=0, ttl_seconds=10)
+
+
+class TestInMemoryAvailabilityCache:
+
+    @pytest.mark.asyncio
+    async def test_set_then_get_returns_cached_response(self):
+        cache = InMemoryAvailabilityCache()
+        start = datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc)
+        request = make_request(ServiceType.CONSULTATION, start, start + timedelta(hours=8))
+        response = make_response(ServiceType.CONSULTATION)
+
+        await cache.set(request, response)
+
+        assert await cache.get(request) is response
+        assert (await cache.stats())["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_only_affected_type_and_day(self):
+        cache = InMemoryAvailabilityCache()
+        day_one = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        day_two = day_one + timedelta(days=1)
+        consultation_day_one = make_request(ServiceType.CONSULTATION, day_one, day_two)
+        consultation_day_two = make_request(ServiceType.CONSULTATION, day_two, day_two + timedelta(days=1))
+        follow_up_day_one = make_request(ServiceType.FOLLOW_UP, day_one, day_two)
+        for request in (consultation_day_one, consultation_day_two, follow_up_day_one):
+            await cache.set(request, make_response(request.service_type))
+
+        removed = await cache.invalidate(
+            ServiceType.CONSULTATION,
+            day_one + timedelta(hours=10),
+            day_one + timedelta(hours=11)
+        )
+
+        assert removed == 1
+        assert await cache.get(consultation_day_one) is None
+        assert await cache.get(consultation_day_two) is not None
+        assert await cache.get(follow_up_day_one) is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_without_service_type_drops_every_type(self):
+        cache = InMemoryAvailabilityCache()
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        consultation = make_request(ServiceType.CONSULTATION, start, start + timedelta(days=1))
+        emergency = make_request(ServiceType.EMERGENCY, start, start + timedelta(days=1))
+        await cache.set(consultation, make_response(ServiceType.CONSULTATION))
+        await cache.set(emergency, make_response(ServiceType.EMERGENCY))
+
+        removed = await cache.invalidate(None, start, start + timedelta(hours=1))
+
+        assert removed == 2
+        assert (await cache.stats())["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_window_ending_at_midnight_does_not_cover_next_day(self):
+        cache = InMemoryAvailabilityCache()
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        request = make_request(ServiceType.CONSULTATION, start, start + timedelta(days=1))
+        await cache.set(request, make_response(ServiceType.CONSULTATION))
+
+        removed = await cache.invalidate(
+            ServiceType.CONSULTATION,
+            start + timedelta(days=1),
+            start + timedelta(days=1, hours=1)
+        )
+
+        assert removed == 0
+        assert await cache.get(request) is not None
+
+    @pytest.mark.asyncio
+    async def test_set_is_dropped_when_invalidated_after_generation_was_read(self):
+        cache = InMemoryAvailabilityCache()
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        request = make_request(ServiceType.CONSULTATION, start, start + timedelta(days=1))
+        generation = await cache.generation()
+
+        await cache.invalidate(ServiceType.CONSULTATION, start, start + timedelta(hours=1))
+        await cache.set(request, make_response(ServiceType.CONSULTATION), generation)
+
+        assert await cache.get(request) is None
+        assert (await cache.stats())["stale_sets"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_with_current_generation_is_stored(self):
+        cache = InMemoryAvailabilityCache()
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        request = make_request(ServiceType.CONSULTATION, start, start + timedelta(days=1))
+
+        await cache.set(request, make_response(ServiceType.CONSULTATION), await cache.generation())
+
+        assert await cache.get(request) is not None
@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+from backend.core.models.service import Service
+from backend.core.models.service_type import ServiceType
+from backend.infrastructure.caching.service_catalog import ServiceCatalog
+from backend.infrastructure.repositories.cached_service_repository import CachedServiceRepository
+from backend.infrastructure.repositories.postgres_service_repository import PostgresServiceRepository
+
+SERVICE_A = "0b6c9f2e-4c1a-4f5e-9d3b-7a2e8c1d5f60"
+SERVICE_B = "7d3e1a4b-2f6c-4b8d-a1e5-9c0f3b2d6e71"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+
+
+class FakeServiceRepository(PostgresServiceRepository):
+    def __init__(self, services):
+        super().__init__(db_session=FakeSession())
+        self.services = list(services)
+        self.loads = 0
+
+    async def find_all(self):
+        self.loads += 1
+        await asyncio.sleep(0)
+        return list(self.services)
+
+    async def save(self, service):
+        self.services.append(service)
+        return service
+
+
+def make_service(service_id, name, service_type=ServiceType.CONSULTATION):
+    return Service(id=service_id, name=name, description=name, duration_minutes=30, price=100.0,
+                   service_type=service_type)
+
+
+def make_repository(services, ttl_seconds=60, clock=None):
+    inner = FakeServiceRepository(services)
+    catalog = ServiceCatalog(ttl_seconds=ttl_seconds, clock=clock or FakeClock())
+    return inner, catalog, CachedServiceRepository(inner, catalog)
+
+
+class TestCachedServiceRepository:
+
+    @pytest.mark.asyncio
+    async def test_lookups_share_one_load(self):
+        inner, catalog, repository = make_repository([
+            make_service(SERVICE_A, "Checkup"),
+            make_service(SERVICE_B, "Emergency", ServiceType.EMERGENCY),
+        ])
+
+        assert (await repository.find_by_id(SERVICE_A)).name == "Checkup"
+        assert [service.id for service in await repository.find_by_type(ServiceType.EMERGENCY)] == [SERVICE_B]
+        assert (await repository.find_by_name("Emergency")).id == SERVICE_B
+        assert await repository.find_by_id("00000000-0000-4000-8000-000000000000") is None
+        assert await repository.find_by_type(ServiceType.FOLLOW_UP) == []
+        assert inner.loads == 1
+        assert catalog.stats()["hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_find_by_id_accepts_any_uuid_spelling(self):
+        _, _, repository = make_repository([make_service(SERVICE_A, "Checkup")])
+
+        assert (await repository.find_by_id(SERVICE_A.upper())).name == "Checkup"
+        assert (await repository.find_by_id("{" + SERVICE_A.replace("-", "") + "}")).name == "Checkup"
+        assert await repository.find_by_id("not-a-uuid") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        inner, _, repository = make_repository([make_service(SERVICE_A, "Checkup")])
+
+        await asyncio.gather(*(repository.find_by_id(SERVICE_A) for _ in range(10)))
+
+        assert inner.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_reloaded_after_ttl(self):
+        clock = FakeClock()
+        inner, _, repository = make_repository([make_service(SERVICE_A, "Checkup")], ttl_seconds=60, clock=clock)
+        await repository.find_by_id(SERVICE_A)
+
+        inner.services.append(make_service(SERVICE_B, "Emergency"))
+        assert await repository.find_by_id(SERVICE_B) is None
+
+        clock.now = 60
+        assert (await repository.find_by_id(SERVICE_B)).name == "Emergency"
+        assert inner.loads == 2
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates_now_and_after_commit(self):
+        inner, catalog, repository = make_repository([make_service(SERVICE_A, "Checkup")])
+        await repository.find_by_id(SERVICE_A)
+
+        await repository.save(make_service(SERVICE_B, "Emergency"))
+        assert (await repository.find_by_id(SERVICE_B)).name == "Emergency"
+
+        for callback in inner.db_session.info.pop("after_commit_callbacks"):
+            callback()
+        assert catalog.stats()["invalidations"] == 2
+        assert catalog.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_reload_racing_an_invalidation_is_discarded(self):
+        catalog = ServiceCatalog(ttl_seconds=60, clock=FakeClock())
+
+        async def load():
+            catalog.invalidate()
+            return [make_service(SERVICE_A, "Checkup")]
+
+        snapshot = await catalog.get(load)
+
+        assert SERVICE_A in snapshot.by_id
+        assert catalog.stats()["size"] == 0
+
+    def test_catalog_fails_with_non_positive_ttl(self):
+        with pytest.raises(ValueError, match="Cache TTL must be positive"):
+            ServiceCatalog(ttl_seconds=0)
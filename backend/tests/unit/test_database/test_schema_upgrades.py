@@ -0,0 +1,51 @@
+import pytest
+from contextlib import asynccontextmanager
+from sqlalchemy.dialects import postgresql
+from backend.infrastructure.database.schema_upgrades import apply_schema_upgrades, APPOINTMENT_CONSTRAINTS
+
+
+class FakeResult:
+    rowcount = 0
+
+
+class FakeConnection:
+    def __init__(self, failing_ddl=None):
+        self.dialect = postgresql.dialect()
+        self.failing_ddl = failing_ddl
+        self.executed = []
+
+    async def execute(self, statement, *args):
+        ddl = str(statement)
+        if self.failing_ddl and self.failing_ddl in ddl:
+            raise Exception("could not create exclusion constraint")
+        self.executed.append(ddl)
+        return FakeResult()
+
+    async def scalar(self, statement, parameters):
+        return None
+
+    async def run_sync(self, fn, **kwargs):
+        pass
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+
+class TestApplySchemaUpgrades:
+
+    @pytest.mark.asyncio
+    async def test_adds_missing_overlap_constraints(self):
+        conn = FakeConnection()
+
+        await apply_schema_upgrades(conn)
+
+        for constraint_name in APPOINTMENT_CONSTRAINTS:
+            assert any(constraint_name in ddl for ddl in conn.executed)
+
+    @pytest.mark.asyncio
+    async def test_startup_fails_when_a_constraint_cannot_be_added(self):
+        conn = FakeConnection(failing_ddl=APPOINTMENT_CONSTRAINTS[0])
+
+        with pytest.raises(RuntimeError, match=APPOINTMENT_CONSTRAINTS[0]):
+            await apply_schema_upgrades(conn)
@@ -0,0 +1,52 @@
+import pytest
+from backend.infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork, run_after_commit
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class TestSQLAlchemyUnitOfWork:
+
+    @pytest.mark.asyncio
+    async def test_after_commit_callbacks_run_once_after_commit(self):
+        session, calls = FakeSession(), []
+        run_after_commit(session, lambda: calls.append(session.commits))
+
+        unit_of_work = SQLAlchemyUnitOfWork(session)
+        await unit_of_work.commit()
+        await unit_of_work.commit()
+
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards_after_commit_callbacks(self):
+        session, calls = FakeSession(), []
+        run_after_commit(session, lambda: calls.append("occupied"))
+
+        unit_of_work = SQLAlchemyUnitOfWork(session)
+        await unit_of_work.rollback()
+        await unit_of_work.commit()
+
+        assert calls == []
+        assert session.rollbacks == 1
+
+    @pytest.mark.asyncio
+    async def test_context_manager_rolls_back_on_error(self):
+        session = FakeSession()
+
+        with pytest.raises(RuntimeError):
+            async with SQLAlchemyUnitOfWork(session):
+                raise RuntimeError("boom")
+
+        assert session.rollbacks == 1
+        assert session.commits == 0
@@ -360,3 +360,16 @@ class TestAppointment:
 
         assert appt1.is_conflicting_with(appt2)
         assert appt2.is_conflicting_with(appt1)
+
+    def test_from_trusted_matches_validated_appointment(self):
+        start = datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc)
+        slot = TimeSlot(start=start, end=start + timedelta(minutes=30))
+        fields = dict(
+            id=str(uuid.uuid4()), user_id="user", service_id="service", status=AppointmentStatus.SCHEDULED,
+            view_token="view", cancellation_token="cancel", created_at=start, updated_at=start, service_type=None
+        )
+
+        trusted = Appointment.from_trusted(scheduled_slot=TimeSlot.trusted(slot.start, slot.end), **fields)
+
+        assert trusted == Appointment(scheduled_slot=slot, **fields)
+        assert not hasattr(trusted, "__dict__")
@@ -167,3 +167,20 @@ class TestUser:
 
         with pytest.raises(ValueError, match="Password hash cannot be empty"):
             user.set_password(None)
+
+    def test_from_trusted_matches_validated_user(self):
+        created_at = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        password_hash_value = "$2b$12$LQY8CUb7bqg9L3U7P6V7nOZK1J2W3X4Y5Z6A7B8C9D0E1F2G3H4I5J6K"
+        user_id = str(uuid.uuid4())
+
+        trusted = User.from_trusted(
+            id=user_id, name="Fulano", email=Email.trusted("fulano@example.com"), phone="123",
+            hashed_password=HashedPassword.trusted(password_hash_value), created_at=created_at, updated_at=created_at
+        )
+        validated = User(
+            id=user_id, name="Fulano", email=Email("fulano@example.com"), phone="123",
+            hashed_password=HashedPassword(password_hash_value), created_at=created_at, updated_at=created_at
+        )
+
+        assert trusted == validated
+        assert not hasattr(trusted, "__dict__")
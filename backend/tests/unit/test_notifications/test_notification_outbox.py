@@ -0,0 +1,189 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.notification_kind import NotificationKind
+from backend.core.models.service_type import ServiceType
+from backend.infrastructure.models.notification_outbox_model import NotificationOutboxModel, OUTBOX_PENDING, \
+    OUTBOX_SENT, OUTBOX_FAILED
+from backend.infrastructure.notifications.notification_outbox_worker import NotificationOutboxWorker
+from backend.infrastructure.notifications.outbox_payload import serialize_details, deserialize_details
+from backend.infrastructure.repositories.postgres_notification_outbox_repository import \
+    PostgresNotificationOutboxRepository
+from backend.infrastructure.services.smtp_notification_service import SMTPNotificationService
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        self.commits += 1
+
+
+class FakeOutboxRepository(PostgresNotificationOutboxRepository):
+    def __init__(self, messages):
+        super().__init__(db_session=FakeSession())
+        self.messages = messages
+
+    async def claim_due(self, limit):
+        return [message for message in self.messages if message.status == OUTBOX_PENDING][:limit]
+
+
+class FakeNotificationService:
+    def __init__(self, result=True):
+        self.result = result
+        self.sent = []
+
+    async def send_appointment_confirmation(self, recipient, details):
+        return self._send("confirmation", recipient, details)
+
+    async def send_appointment_reminder(self, recipient, details):
+        return self._send("reminder", recipient, details)
+
+    async def send_appointment_cancellation(self, recipient, details):
+        return self._send("cancellation", recipient, details)
+
+    async def send_batch(self, notifications):
+        return [self._send(kind.value, recipient, details) for kind, recipient, details in notifications]
+
+    def _send(self, kind, recipient, details):
+        if isinstance(self.result, Exception):
+            raise self.result
+        self.sent.append((kind, recipient, details))
+        return self.result
+
+
+def make_message(kind=NotificationKind.CONFIRMATION, attempts=0):
+    return NotificationOutboxModel(
+        kind=kind.value,
+        recipient="client@example.com",
+        payload={"service_name": "Checkup", "scheduled_start": "2023-01-02T09:00:00+00:00"},
+        status=OUTBOX_PENDING,
+        attempts=attempts,
+        next_attempt_at=datetime.now(timezone.utc)
+    )
+
+
+def make_worker(repository, notification_service, **kwargs):
+    return NotificationOutboxWorker(
+        session_factory=lambda: repository.db_session,
+        notification_service=notification_service,
+        repository_factory=lambda session: repository,
+        **kwargs
+    )
+
+
+class TestOutboxPayload:
+
+    def test_round_trip_restores_datetimes(self):
+        start = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+        payload = serialize_details({
+            "scheduled_start": start,
+            "status": AppointmentStatus.SCHEDULED,
+            "service_type": ServiceType.CONSULTATION,
+            "service_price": 120.0
+        })
+
+        assert payload == {
+            "scheduled_start": "2023-01-02T09:00:00+00:00",
+            "status": "scheduled",
+            "service_type": "consultation",
+            "service_price": 120.0
+        }
+        details = deserialize_details(payload)
+        assert details["scheduled_start"] == start
+        assert details["status"] is AppointmentStatus.SCHEDULED
+        assert details["service_type"] is ServiceType.CONSULTATION
+
+    def test_round_tripped_confirmation_renders_in_smtp_templates(self):
+        start = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+        details = deserialize_details(serialize_details({
+            "client_name": "Jane",
+            "client_email": "jane@example.com",
+            "service_name": "Checkup",
+            "service_description": "Routine checkup",
+            "service_duration_minutes": 30,
+            "service_price": 120.0,
+            "service_type": ServiceType.CONSULTATION,
+            "scheduled_start": start,
+            "scheduled_end": start + timedelta(minutes=30),
+            "status": AppointmentStatus.SCHEDULED,
+            "view_token": "view",
+            "cancellation_token": "cancel",
+        }))
+        service = SMTPNotificationService()
+        try:
+            text_body = service._create_text_body(details)
+            html_body = service._create_html_body(details)
+        finally:
+            service.shutdown()
+
+        assert "Type: consultation" in text_body
+        assert "Status: scheduled" in text_body
+        assert "<strong>Type:</strong> consultation" in html_body
+        assert "<strong>Status:</strong> scheduled" in html_body
+
+
+class TestNotificationOutboxWorker:
+
+    @pytest.mark.asyncio
+    async def test_delivered_messages_are_marked_sent(self):
+        messages = [make_message(), make_message(NotificationKind.CANCELLATION)]
+        repository = FakeOutboxRepository(messages)
+        notification_service = FakeNotificationService()
+
+        processed = await make_worker(repository, notification_service).run_once()
+
+        assert processed == 2
+        assert [message.status for message in messages] == [OUTBOX_SENT, OUTBOX_SENT]
+        assert [kind for kind, _, _ in notification_service.sent] == ["confirmation", "cancellation"]
+        assert isinstance(notification_service.sent[0][2]["scheduled_start"], datetime)
+        assert repository.db_session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_retried_with_backoff(self):
+        message = make_message()
+        repository = FakeOutboxRepository([message])
+        worker = make_worker(repository, FakeNotificationService(result=False), base_backoff_seconds=10)
+        before = datetime.now(timezone.utc)
+
+        await worker.run_once()
+
+        assert message.status == OUTBOX_PENDING
+        assert message.attempts == 1
+        assert message.next_attempt_at >= before + timedelta(seconds=10)
+        assert message.last_error
+
+    @pytest.mark.asyncio
+    async def test_message_fails_after_max_attempts(self):
+        message = make_message(attempts=2)
+        repository = FakeOutboxRepository([message])
+        worker = make_worker(repository, FakeNotificationService(result=ConnectionError("down")), max_attempts=3)
+
+        await worker.run_once()
+
+        assert message.status == OUTBOX_FAILED
+        assert message.attempts == 3
+        assert message.last_error == "down"
+
+    @pytest.mark.asyncio
+    async def test_run_once_without_due_messages_does_not_commit(self):
+        repository = FakeOutboxRepository([])
+
+        assert await make_worker(repository, FakeNotificationService()).run_once() == 0
+        assert repository.db_session.commits == 0
+
+    def test_retry_delay_is_capped(self):
+        worker = make_worker(FakeOutboxRepository([]), FakeNotificationService(),
+                             base_backoff_seconds=10, max_backoff_seconds=60)
+
+        assert worker.retry_delay(1) == timedelta(seconds=10)
+        assert worker.retry_delay(3) == timedelta(seconds=40)
+        assert worker.retry_delay(10) == timedelta(seconds=60)
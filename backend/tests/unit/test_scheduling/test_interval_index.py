@@ -0,0 +1,103 @@
+import random
+import pytest
+from backend.core.scheduling.interval_index import IntervalIndex
+
+
+def brute_overlapping(intervals, start, end):
+    return sorted((s, e, k) for s, e, k in intervals if s < end and start < e)
+
+
+def brute_find_gap(intervals, after, length, step, before=None):
+    candidate = -(-after // step) * step
+    while before is None or candidate + length <= before:
+        if all(not (s < candidate + length and candidate < e) for s, e, _ in intervals):
+            return candidate
+        candidate += step
+    return None
+
+
+def brute_blocks(intervals):
+    blocks = []
+    for start, end, _ in sorted(intervals):
+        if blocks and start <= blocks[-1][1]:
+            blocks[-1] = (blocks[-1][0], max(blocks[-1][1], end))
+        else:
+            blocks.append((start, end))
+    return blocks
+
+
+class TestIntervalIndex:
+
+    def test_overlapping_returns_only_intersecting_intervals(self):
+        index = IntervalIndex([(0, 10, "a"), (10, 20, "b"), (5, 100, "c"), (30, 40, "d")])
+
+        assert index.overlapping(10, 30) == [(5, 100, "c"), (10, 20, "b")]
+        assert index.overlapping(100, 200) == []
+
+    def test_adjacent_intervals_form_one_block(self):
+        index = IntervalIndex([(0, 10, "a"), (20, 30, "c")])
+        index.insert(10, 20, "b")
+
+        assert index.blocks == [(0, 30)]
+        assert not index.is_free(25, 26)
+        assert index.is_free(30, 40)
+
+    def test_remove_splits_block(self):
+        index = IntervalIndex([(0, 10, "a"), (10, 20, "b"), (20, 30, "c")])
+
+        assert index.remove(10, 20, "b")
+        assert not index.remove(10, 20, "b")
+        assert index.blocks == [(0, 10), (20, 30)]
+        assert index.find_gap(0, 10) == 10
+
+    def test_find_gap_skips_narrow_gaps_and_respects_alignment(self):
+        index = IntervalIndex([(0, 10, "a"), (12, 20, "b"), (25, 40, "c")])
+
+        assert index.find_gap(0, 5) == 20
+        assert index.find_gap(0, 5, step=3) == 42
+        assert index.find_gap(0, 5, before=24) is None
+
+    def test_randomized_against_brute_force(self):
+        rng = random.Random(11)
+        index, intervals = IntervalIndex(), []
+        for round_number in range(600):
+            if intervals and rng.random() < 0.35:
+                interval = intervals.pop(rng.randrange(len(intervals)))
+                assert index.remove(*interval)
+            else:
+                start = rng.randrange(0, 2000)
+                interval = (start, start + rng.choice([5, 15, 30, 45, 90]), round_number)
+                intervals.append(interval)
+                index.insert(*interval)
+
+            query_start = rng.randrange(0, 2100)
+            query_end = query_start + rng.randrange(1, 120)
+            assert sorted(index.overlapping(query_start, query_end)) == brute_overlapping(
+                intervals, query_start, query_end
+            )
+            assert index.is_free(query_start, query_end) == (not brute_overlapping(intervals, query_start, query_end))
+            assert index.blocks == brute_blocks(intervals)
+
+            length, step = rng.choice([15, 30, 45, 60]), rng.choice([1, 15])
+            before = rng.choice([None, query_start + 300])
+            assert index.find_gap(query_start, length, step, before) == brute_find_gap(
+                intervals, query_start, length, step, before
+            )
+
+        assert len(index) == len(intervals)
+
+    def test_bulk_load_matches_incremental_inserts(self):
+        rng = random.Random(5)
+        intervals = [(start, start + rng.choice([15, 30]), key)
+                     for key, start in enumerate(rng.randrange(0, 1000) for _ in range(200))]
+        incremental = IntervalIndex()
+        for interval in intervals:
+            incremental.insert(*interval)
+
+        assert IntervalIndex(intervals).blocks == incremental.blocks
+
+    def test_rejects_empty_intervals_and_gaps(self):
+        with pytest.raises(ValueError, match="Start time must be before end time"):
+            IntervalIndex().insert(5, 5, "a")
+        with pytest.raises(ValueError, match="Gap length and step must be positive"):
+            IntervalIndex().find_gap(0, 0)
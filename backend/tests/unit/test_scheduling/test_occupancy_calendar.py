@@ -0,0 +1,103 @@
+import random
+from datetime import datetime, timezone, timedelta
+from backend.core.models.appointment import Appointment
+from backend.core.scheduling.occupancy_calendar import OccupancyCalendar
+from backend.core.scheduling.slot_engine import SlotEngine
+from backend.core.value_objects.time_slot import TimeSlot
+
+SERVICE_A = "service-a"
+SERVICE_B = "service-b"
+DAY = datetime(2023, 1, 2, tzinfo=timezone.utc)
+
+
+def at(hour, minute=0, days=0):
+    return DAY + timedelta(days=days, hours=hour, minutes=minute)
+
+
+def make_appointment(service_id, start, end):
+    return Appointment(id=None, user_id="user", service_id=service_id, scheduled_slot=TimeSlot(start, end))
+
+
+def loaded_calendar(appointments=()):
+    calendar = OccupancyCalendar()
+    calendar.rebuild(appointments, loaded_from=DAY)
+    return calendar
+
+
+class TestOccupancyCalendar:
+
+    def test_occupy_and_release(self):
+        calendar = loaded_calendar()
+        slot = TimeSlot(at(9), at(10))
+
+        calendar.occupy(SERVICE_A, slot)
+        assert not calendar.is_free(SERVICE_A, at(9, 45), at(10, 30))
+        assert calendar.is_free(SERVICE_A, at(10), at(11))
+        assert calendar.is_free(SERVICE_B, at(9), at(10))
+
+        calendar.release(SERVICE_A, slot)
+        assert calendar.is_free(SERVICE_A, at(9), at(10))
+
+    def test_occupy_across_midnight(self):
+        calendar = loaded_calendar()
+        calendar.occupy(SERVICE_A, TimeSlot(at(23, 30), at(0, 30, days=1)))
+
+        assert not calendar.is_free(SERVICE_A, at(23, 45), at(0, 0, days=1))
+        assert not calendar.is_free(SERVICE_A, at(0, 15, days=1), at(0, 30, days=1))
+        assert calendar.is_free(SERVICE_A, at(0, 30, days=1), at(1, 0, days=1))
+
+    def test_is_authoritative_requires_rebuild(self):
+        calendar = OccupancyCalendar()
+        assert not calendar.is_authoritative([SERVICE_A], at(9), at(10))
+
+        calendar.rebuild([], loaded_from=DAY)
+        assert calendar.is_authoritative([SERVICE_A], at(9), at(10))
+
+    def test_is_authoritative_rejects_days_before_rebuild(self):
+        calendar = loaded_calendar()
+        assert not calendar.is_authoritative([SERVICE_A], at(9, days=-1), at(10, days=-1))
+
+    def test_is_authoritative_rejects_off_grid_window(self):
+        calendar = loaded_calendar()
+        assert not calendar.is_authoritative([SERVICE_A], at(9, 5), at(10))
+
+    def test_off_grid_booking_marks_bucket_inexact(self):
+        calendar = loaded_calendar([make_appointment(SERVICE_A, at(9, 5), at(9, 50))])
+
+        assert not calendar.is_authoritative([SERVICE_A], at(8), at(12))
+        assert calendar.is_authoritative([SERVICE_B], at(8), at(12))
+        assert calendar.is_authoritative([SERVICE_A], at(8, days=1), at(12, days=1))
+
+    def test_overlapping_bookings_mark_bucket_inexact(self):
+        calendar = loaded_calendar([
+            make_appointment(SERVICE_A, at(9), at(10)),
+            make_appointment(SERVICE_A, at(9, 30), at(10, 30)),
+        ])
+
+        assert not calendar.is_authoritative([SERVICE_A], at(8), at(12))
+
+    def test_can_compute_slots_requires_grid_duration(self):
+        calendar = loaded_calendar()
+
+        assert calendar.can_compute_slots([SERVICE_A], at(9), at(17), timedelta(minutes=45))
+        assert not calendar.can_compute_slots([SERVICE_A], at(9), at(17), timedelta(minutes=50))
+
+    def test_compute_slots_matches_slot_engine(self):
+        rng = random.Random(3)
+        appointments = []
+        for service_id in (SERVICE_A, SERVICE_B):
+            cursor = DAY
+            while cursor < DAY + timedelta(days=3):
+                cursor += timedelta(minutes=15 * rng.randrange(0, 12))
+                end = cursor + timedelta(minutes=rng.choice([30, 45, 90]))
+                appointments.append(make_appointment(service_id, cursor, end))
+                cursor = end
+
+        calendar = loaded_calendar(appointments)
+        start, end = DAY, DAY + timedelta(days=3)
+        engine = SlotEngine(appointment.scheduled_slot for appointment in appointments)
+
+        for minutes in (15, 30, 45, 90):
+            slot_duration = timedelta(minutes=minutes)
+            assert calendar.compute_slots([SERVICE_A, SERVICE_B], start, end, slot_duration) == \
+                engine.compute_slots(start, end, slot_duration)
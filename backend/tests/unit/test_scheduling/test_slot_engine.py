@@ -0,0 +1,89 @@
+import pytest
+import random
+from datetime import datetime, timezone, timedelta
+from backend.core.scheduling.slot_engine import SlotEngine
+from backend.core.value_objects.time_slot import TimeSlot
+
+
+def naive_compute_slots(start, end, slot_duration, busy_slots):
+    slots = []
+    current_start = start
+    while current_start < end:
+        current_end = current_start + slot_duration
+        requested_slot = TimeSlot(start=current_start, end=current_end)
+        is_available = not any(requested_slot.overlaps(busy_slot) for busy_slot in busy_slots)
+        slots.append((current_start, current_end, is_available))
+        current_start = current_end
+    return slots
+
+
+class TestSlotEngine:
+
+    def test_compute_slots_without_busy_intervals(self):
+        start = datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 1, 1, 11, 0, tzinfo=timezone.utc)
+
+        slots = SlotEngine([]).compute_slots(start, end, timedelta(minutes=30))
+
+        assert len(slots) == 4
+        assert all(is_available for _, _, is_available in slots)
+        assert slots[0][0] == start
+        assert slots[-1][1] == end
+
+    def test_compute_slots_marks_overlapping_slots_busy(self):
+        start = datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 1, 1, 11, 0, tzinfo=timezone.utc)
+        busy = [TimeSlot(datetime(2023, 1, 1, 9, 45, tzinfo=timezone.utc), datetime(2023, 1, 1, 10, 15, tzinfo=timezone.utc))]
+
+        slots = SlotEngine(busy).compute_slots(start, end, timedelta(minutes=30))
+
+        assert [is_available for _, _, is_available in slots] == [True, False, False, True]
+
+    def test_compute_slots_touching_interval_is_not_a_conflict(self):
+        start = datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc)
+        busy = [TimeSlot(datetime(2023, 1, 1, 8, 0, tzinfo=timezone.utc), datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc))]
+
+        slots = SlotEngine(busy).compute_slots(start, end, timedelta(minutes=30))
+
+        assert [is_available for _, _, is_available in slots] == [True, True]
+
+    def test_compute_slots_keeps_partial_last_slot(self):
+        start = datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+        slots = SlotEngine([]).compute_slots(start, end, timedelta(minutes=45))
+
+        assert len(slots) == 2
+        assert slots[-1][1] == datetime(2023, 1, 1, 10, 30, tzinfo=timezone.utc)
+
+    def test_compute_slots_treats_naive_window_as_utc(self):
+        start = datetime(2023, 1, 1, 9, 0)
+        end = datetime(2023, 1, 1, 10, 0)
+        busy = [TimeSlot(datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc), datetime(2023, 1, 1, 9, 30, tzinfo=timezone.utc))]
+
+        slots = SlotEngine(busy).compute_slots(start, end, timedelta(minutes=30))
+
+        assert slots[0][0].tzinfo is None
+        assert [is_available for _, _, is_available in slots] == [False, True]
+
+    def test_compute_slots_fails_with_non_positive_duration(self):
+        start = datetime(2023, 1, 1, 9, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+        with pytest.raises(ValueError, match="Slot duration must be positive"):
+            SlotEngine([]).compute_slots(start, end, timedelta(0))
+
+    def test_compute_slots_matches_pairwise_overlap_check(self):
+        rng = random.Random(42)
+        start = datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc)
+        end = start + timedelta(days=7)
+        busy = []
+        for _ in range(200):
+            busy_start = start + timedelta(minutes=rng.randrange(0, 7 * 24 * 60, 5))
+            busy.append(TimeSlot(busy_start, busy_start + timedelta(minutes=rng.choice([15, 30, 45, 90]))))
+
+        for duration in (15, 30, 45, 90):
+            slot_duration = timedelta(minutes=duration)
+            assert SlotEngine(busy).compute_slots(start, end, slot_duration) == \
+                naive_compute_slots(start, end, slot_duration, busy)
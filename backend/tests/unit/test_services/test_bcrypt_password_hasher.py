@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import pytest
+from backend.core.exceptions.password_hasher_saturated_error import PasswordHasherSaturatedError
+from backend.infrastructure.services.bcrypt_password_hasher import BcryptPasswordHasher
+
+
+class TestBcryptPasswordHasher:
+
+    @pytest.mark.asyncio
+    async def test_hash_round_trips_through_verify(self):
+        hasher = BcryptPasswordHasher(max_workers=2, rounds=4)
+        try:
+            hashed = await hasher.hash("correct horse")
+
+            assert await hasher.verify("correct horse", hashed)
+            assert not await hasher.verify("wrong horse", hashed)
+            assert hasher.stats()["completed"] == 3
+            assert hasher.stats()["max_hash_ms"] > 0
+        finally:
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_work_beyond_workers_and_queue(self):
+        hasher = BcryptPasswordHasher(max_workers=1, max_pending=1, rounds=4)
+        release = threading.Event()
+        try:
+            blocked = [asyncio.create_task(hasher._submit(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            assert hasher.stats()["in_flight"] == 1
+            assert hasher.stats()["queued"] == 1
+            with pytest.raises(PasswordHasherSaturatedError):
+                await hasher.hash("password")
+            assert hasher.stats()["rejected"] == 1
+
+            release.set()
+            await asyncio.gather(*blocked)
+            assert await hasher.hash("password")
+        finally:
+            release.set()
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_its_slot_until_the_job_finishes(self):
+        hasher = BcryptPasswordHasher(max_workers=1, max_pending=1, rounds=4)
+        release = threading.Event()
+        try:
+            running = asyncio.create_task(hasher._submit(release.wait))
+            queued = asyncio.create_task(hasher._submit(release.wait))
+            await asyncio.sleep(0.05)
+
+            running.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await running
+
+            with pytest.raises(PasswordHasherSaturatedError):
+                await hasher.hash("password")
+            assert hasher.stats()["in_flight"] == 1
+
+            release.set()
+            await queued
+            assert await hasher.hash("password")
+        finally:
+            release.set()
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_hashing_does_not_block_the_event_loop(self):
+        hasher = BcryptPasswordHasher(max_workers=1, rounds=10)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await hasher.hash("password")
+        finally:
+            ticker_task.cancel()
+            hasher.shutdown()
+
+        assert ticks > 1
+
+    def test_hasher_fails_with_non_positive_workers(self):
+        with pytest.raises(ValueError, match="Password hasher workers must be positive"):
+            BcryptPasswordHasher(max_workers=0)
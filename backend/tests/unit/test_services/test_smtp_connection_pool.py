@@ -0,0 +1,121 @@
+import smtplib
+import pytest
+from backend.infrastructure.services.smtp_connection_pool import SMTPConnectionPool
+from backend.tests.support.smtp_stub import SMTPStubServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def smtp_stub():
+    with SMTPStubServer() as server:
+        yield server
+
+
+def make_pool(server, **kwargs):
+    def connect():
+        smtp = smtplib.SMTP("127.0.0.1", server.port, timeout=5)
+        smtp.login("clinic@example.com", "secret")
+        return smtp
+    return SMTPConnectionPool(connect, **kwargs)
+
+
+def outgoing(count):
+    return [("clinic@example.com", f"client{i}@example.com", f"Subject: {i}\r\n\r\nbody") for i in range(count)]
+
+
+class TestSMTPConnectionPool:
+
+    def test_sequential_sends_reuse_one_connection(self, smtp_stub):
+        pool = make_pool(smtp_stub)
+        for sender, recipient, message in outgoing(5):
+            pool.send(sender, recipient, message)
+        pool.close()
+
+        assert len(smtp_stub.messages) == 5
+        assert smtp_stub.connections == 1
+        assert pool.stats()["reused"] == 4
+
+    def test_connection_is_recycled_after_max_messages(self, smtp_stub):
+        pool = make_pool(smtp_stub, max_messages_per_connection=2)
+
+        errors = pool.send_batch(outgoing(5))
+        pool.close()
+
+        assert errors == [None] * 5
+        assert len(smtp_stub.messages) == 5
+        assert smtp_stub.connections == 3
+
+    def test_idle_connection_is_replaced(self, smtp_stub):
+        clock = FakeClock()
+        pool = make_pool(smtp_stub, idle_timeout_seconds=30, clock=clock)
+        (sender, recipient, message), = outgoing(1)
+
+        pool.send(sender, recipient, message)
+        clock.now = 31
+        pool.send(sender, recipient, message)
+        pool.close()
+
+        assert smtp_stub.connections == 2
+        assert pool.stats()["recycled"] == 1
+
+    def test_dropped_connection_is_retried_on_a_fresh_one(self, smtp_stub):
+        pool = make_pool(smtp_stub)
+        (sender, recipient, message), = outgoing(1)
+        pool.send(sender, recipient, message)
+
+        pool._idle[0].smtp.close()
+        pool.send(sender, recipient, message)
+        pool.close()
+
+        assert len(smtp_stub.messages) == 2
+        assert smtp_stub.connections == 2
+
+    def test_batch_fails_remaining_messages_when_no_session_opens(self):
+        attempts = []
+
+        def connect():
+            attempts.append(1)
+            raise ConnectionRefusedError("server down")
+
+        errors = SMTPConnectionPool(connect).send_batch(outgoing(20))
+
+        assert len(attempts) == 1
+        assert len(errors) == 20
+        assert all(isinstance(error, ConnectionRefusedError) for error in errors)
+
+    def test_batch_retries_a_stale_idle_session_once(self, smtp_stub):
+        pool = make_pool(smtp_stub)
+        (sender, recipient, message), = outgoing(1)
+        pool.send(sender, recipient, message)
+
+        pool._idle[0].smtp.close()
+        errors = pool.send_batch(outgoing(3))
+        pool.close()
+
+        assert errors == [None] * 3
+        assert len(smtp_stub.messages) == 4
+        assert smtp_stub.connections == 2
+
+    def test_batch_isolates_a_message_failing_outside_smtp(self, smtp_stub):
+        pool = make_pool(smtp_stub)
+        messages = outgoing(3)
+        messages[1] = ("clinic@example.com", "client1@example.com", "Subject: caf\u00e9\r\n\r\nbody")
+
+        errors = pool.send_batch(messages)
+        pool.close()
+
+        assert errors[0] is None and errors[2] is None
+        assert isinstance(errors[1], UnicodeEncodeError)
+        assert len(smtp_stub.messages) == 2
+        assert smtp_stub.connections == 2
+
+    def test_pool_fails_with_non_positive_size(self):
+        with pytest.raises(ValueError, match="Pool size must be positive"):
+            SMTPConnectionPool(lambda: None, max_connections=0)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.core.models.notification_kind import NotificationKind
+from backend.infrastructure.services.smtp_notification_service import SMTPNotificationService
+from backend.tests.support.smtp_stub import SMTPStubServer
+
+START = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+DETAILS = {
+    "client_name": "Jane",
+    "service_name": "Checkup",
+    "scheduled_start": START,
+    "scheduled_end": START + timedelta(minutes=30),
+}
+
+
+@pytest.fixture
+def smtp_stub(monkeypatch):
+    with SMTPStubServer(delay_seconds=0.5) as server:
+        monkeypatch.setenv("SMTP_SERVER", "127.0.0.1")
+        monkeypatch.setenv("SMTP_PORT", str(server.port))
+        monkeypatch.setenv("SMTP_USE_TLS", "false")
+        monkeypatch.setenv("EMAIL_ADDRESS", "clinic@example.com")
+        monkeypatch.setenv("EMAIL_PASSWORD", "secret")
+        monkeypatch.setenv("SMTP_MAX_CONCURRENCY", "2")
+        yield server
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - before - interval)
+    return worst
+
+
+class TestSMTPNotificationService:
+
+    @pytest.mark.asyncio
+    async def test_send_delivers_to_server(self, smtp_stub):
+        service = SMTPNotificationService()
+        try:
+            assert await service.send_appointment_confirmation("client@example.com", DETAILS)
+        finally:
+            service.shutdown()
+
+        mail_from, recipients, body = smtp_stub.messages[0]
+        assert mail_from == "clinic@example.com"
+        assert recipients == ["client@example.com"]
+        assert "Appointment Confirmation - Checkup" in body
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive_during_send(self, smtp_stub):
+        service = SMTPNotificationService()
+        stop = asyncio.Event()
+        lag_probe = asyncio.create_task(measure_loop_lag(stop))
+        try:
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                service.send_appointment_confirmation("a@example.com", DETAILS),
+                service.send_appointment_cancellation("b@example.com", DETAILS),
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            stop.set()
+            worst_lag = await lag_probe
+            service.shutdown()
+
+        assert results == [True, True]
+        assert elapsed >= smtp_stub.delay_seconds
+        assert worst_lag < 0.1
+
+    @pytest.mark.asyncio
+    async def test_send_batch_shares_pooled_sessions(self, smtp_stub):
+        service = SMTPNotificationService()
+        notifications = [
+            (NotificationKind.REMINDER, f"client{i}@example.com", DETAILS) for i in range(4)
+        ]
+        try:
+            results = await service.send_batch(notifications)
+        finally:
+            service.shutdown()
+
+        assert results == [True] * 4
+        assert len(smtp_stub.messages) == 4
+        assert smtp_stub.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_send_batch_reports_unrenderable_notifications(self, smtp_stub):
+        service = SMTPNotificationService()
+        try:
+            results = await service.send_batch([
+                (NotificationKind.CANCELLATION, "a@example.com", DETAILS),
+                (NotificationKind.CONFIRMATION, "b@example.com", {"service_name": "Checkup"}),
+            ])
+        finally:
+            service.shutdown()
+
+        assert results == [True, False]
+        assert [recipients for _, recipients, _ in smtp_stub.messages] == [["a@example.com"]]
+
+    def test_concurrency_must_be_positive(self, monkeypatch):
+        monkeypatch.setenv("SMTP_MAX_CONCURRENCY", "0")
+        with pytest.raises(ValueError, match="SMTP concurrency must be positive"):
+            SMTPNotificationService()
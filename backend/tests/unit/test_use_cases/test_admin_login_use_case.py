@@ -0,0 +1,56 @@
+import asyncio
+import pytest
+from backend.application.dtos.admin_login_request import AdminLoginRequest
+from backend.application.use_cases.admin_login_use_case import AdminLoginUseCase, ADMIN_PASSWORD, ADMIN_USERNAME
+
+
+class FakePasswordHasher:
+    def __init__(self):
+        self.hashes = 0
+
+    async def hash(self, password):
+        self.hashes += 1
+        await asyncio.sleep(0)
+        return f"hashed:{password}"
+
+    async def verify(self, password, hashed_password):
+        return hashed_password == f"hashed:{password}"
+
+
+class TestAdminLoginUseCase:
+
+    @pytest.mark.asyncio
+    async def test_admin_hash_is_computed_once_on_first_login(self, monkeypatch):
+        monkeypatch.setattr(AdminLoginUseCase, "_password_hash", None)
+        hasher = FakePasswordHasher()
+        use_case = AdminLoginUseCase(hasher)
+        request = AdminLoginRequest(username=ADMIN_USERNAME, password=ADMIN_PASSWORD)
+
+        responses = await asyncio.gather(*(use_case.execute(request) for _ in range(5)))
+
+        assert all(response.success for response in responses)
+        assert hasher.hashes == 1
+
+    @pytest.mark.asyncio
+    async def test_precomputed_hash_skips_hashing(self, monkeypatch):
+        monkeypatch.setattr(AdminLoginUseCase, "_password_hash", "hashed:from-env")
+        hasher = FakePasswordHasher()
+
+        response = await AdminLoginUseCase(hasher).execute(
+            AdminLoginRequest(username=ADMIN_USERNAME, password="from-env")
+        )
+
+        assert response.success
+        assert hasher.hashes == 0
+
+    @pytest.mark.asyncio
+    async def test_wrong_username_is_rejected_without_hashing(self, monkeypatch):
+        monkeypatch.setattr(AdminLoginUseCase, "_password_hash", None)
+        hasher = FakePasswordHasher()
+
+        response = await AdminLoginUseCase(hasher).execute(
+            AdminLoginRequest(username="someone-else", password=ADMIN_PASSWORD)
+        )
+
+        assert response.error_code == "INVALID_CREDENTIALS"
+        assert hasher.hashes == 0
@@ -0,0 +1,90 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.application.dtos.cancel_appointment_request import CancelAppointmentRequest
+from backend.application.dtos.cancelled_appointment_dto import CancelledAppointmentDTO
+from backend.application.use_cases.cancel_appointment_use_case import CancelAppointmentUseCase
+from backend.core.models.appointment import Appointment
+from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.notification_kind import NotificationKind
+from backend.core.models.service_type import ServiceType
+from backend.core.value_objects.time_slot import TimeSlot
+from backend.tests.support.fake_unit_of_work import FakeUnitOfWork
+
+START = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def make_cancelled(token):
+    return CancelledAppointmentDTO(
+        id="appointment", user_id="user", service_id="service", client_name="Jane",
+        client_email="jane@example.com", service_name="Checkup", service_description="Routine checkup",
+        service_type=ServiceType.CONSULTATION, scheduled_start=START, scheduled_end=START + timedelta(minutes=30),
+        status=AppointmentStatus.CANCELLED, view_token="view", cancellation_token=token,
+        created_at=START, updated_at=START
+    )
+
+
+class FakeAppointmentRepository:
+    def __init__(self, status=None):
+        self.status = status
+
+    async def cancel_by_token(self, token):
+        if self.status != AppointmentStatus.SCHEDULED:
+            return None
+        self.status = AppointmentStatus.CANCELLED
+        return make_cancelled(token)
+
+    async def find_by_cancellation_token(self, token):
+        if self.status is None:
+            return None
+        return Appointment(id="appointment", user_id="user", service_id="service",
+                           scheduled_slot=TimeSlot(START, START + timedelta(minutes=30)), status=self.status,
+                           cancellation_token=token)
+
+
+class FakeOutbox:
+    def __init__(self):
+        self.messages = []
+
+    async def enqueue(self, kind, recipient, details):
+        self.messages.append((kind, recipient, details))
+
+
+class TestCancelAppointmentUseCase:
+
+    @pytest.mark.asyncio
+    async def test_cancel_commits_update_and_notification_together(self):
+        repository, outbox, unit_of_work = FakeAppointmentRepository(AppointmentStatus.SCHEDULED), FakeOutbox(), \
+            FakeUnitOfWork()
+
+        response = await CancelAppointmentUseCase(repository, outbox, unit_of_work).execute(
+            CancelAppointmentRequest(cancellation_token="token")
+        )
+
+        assert response.success
+        assert unit_of_work.commits == 1
+        kind, recipient, details = outbox.messages[0]
+        assert kind == NotificationKind.CANCELLATION
+        assert recipient == "jane@example.com"
+        assert details["cancellation_token"] == "token"
+
+    @pytest.mark.asyncio
+    async def test_second_cancel_reports_invalid_status(self):
+        repository, outbox = FakeAppointmentRepository(AppointmentStatus.SCHEDULED), FakeOutbox()
+        use_case = CancelAppointmentUseCase(repository, outbox, FakeUnitOfWork())
+        request = CancelAppointmentRequest(cancellation_token="token")
+
+        await use_case.execute(request)
+        response = await use_case.execute(request)
+
+        assert response.error_code == "INVALID_STATUS_FOR_CANCELLATION"
+        assert len(outbox.messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_reports_not_found(self):
+        unit_of_work = FakeUnitOfWork()
+        response = await CancelAppointmentUseCase(FakeAppointmentRepository(), FakeOutbox(), unit_of_work).execute(
+            CancelAppointmentRequest(cancellation_token="missing")
+        )
+
+        assert response.error_code == "APPOINTMENT_NOT_FOUND"
+        assert unit_of_work.commits == 0
@@ -0,0 +1,177 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.application.dtos.find_next_available_slots_request import FindNextAvailableSlotsRequest
+from backend.application.use_cases.find_next_available_slots_use_case import FindNextAvailableSlotsUseCase
+from backend.core.models.appointment import Appointment
+from backend.core.models.service import Service
+from backend.core.models.service_type import ServiceType
+from backend.core.value_objects.time_slot import TimeSlot
+
+START = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def make_service(service_id, duration_minutes=30, service_type=ServiceType.CONSULTATION):
+    return Service(id=service_id, name=service_id, description=service_id, duration_minutes=duration_minutes,
+                   service_type=service_type)
+
+
+def book(service_id, start, minutes):
+    return Appointment(id=f"{service_id}-{start.isoformat()}", user_id="user", service_id=service_id,
+                       scheduled_slot=TimeSlot(start, start + timedelta(minutes=minutes)))
+
+
+class FakeServiceRepository:
+    def __init__(self, services):
+        self.services = services
+
+    async def find_by_id(self, service_id):
+        return next((service for service in self.services if service.id == service_id), None)
+
+    async def find_by_type(self, service_type):
+        return [service for service in self.services if service.service_type == service_type]
+
+
+class FakeAppointmentRepository:
+    def __init__(self, appointments):
+        self.appointments = appointments
+        self.windows = []
+
+    async def find_scheduled_between_for_services(self, start, end, service_ids):
+        self.windows.append((start, end))
+        result = {service_id: [] for service_id in service_ids}
+        for appointment in self.appointments:
+            slot = appointment.scheduled_slot
+            if appointment.service_id in result and slot.start < end and slot.end > start:
+                result[appointment.service_id].append(appointment)
+        return result
+
+
+def make_use_case(services, appointments=()):
+    appointment_repo = FakeAppointmentRepository(list(appointments))
+    return FindNextAvailableSlotsUseCase(appointment_repo, FakeServiceRepository(services)), appointment_repo
+
+
+class TestFindNextAvailableSlotsRequest:
+
+    def test_requires_exactly_one_target(self):
+        with pytest.raises(ValueError):
+            FindNextAvailableSlotsRequest()
+        with pytest.raises(ValueError):
+            FindNextAvailableSlotsRequest(service_id="a", service_type=ServiceType.CONSULTATION)
+
+
+class TestFindNextAvailableSlotsUseCase:
+
+    @pytest.mark.asyncio
+    async def test_skips_booked_time_and_stops_after_first_chunk(self):
+        use_case, appointment_repo = make_use_case([make_service("a")], [book("a", START, 60)])
+
+        response = await use_case.execute(FindNextAvailableSlotsRequest(service_id="a", count=3), now=START)
+
+        assert response.success
+        assert [slot.start for slot in response.slots] == [
+            START + timedelta(minutes=60), START + timedelta(minutes=90), START + timedelta(minutes=120)
+        ]
+        assert response.slots[0].end == START + timedelta(minutes=90)
+        assert len(appointment_repo.windows) == 1
+
+    @pytest.mark.asyncio
+    async def test_starts_are_aligned_to_quarter_hours(self):
+        use_case, _ = make_use_case([make_service("a")], [book("a", START, 20)])
+
+        response = await use_case.execute(
+            FindNextAvailableSlotsRequest(service_id="a", count=1, after=START + timedelta(minutes=1)), now=START
+        )
+
+        assert response.slots[0].start == START + timedelta(minutes=30)
+
+    @pytest.mark.asyncio
+    async def test_search_continues_past_fully_booked_chunks(self):
+        busy_until = START + timedelta(days=3)
+        use_case, appointment_repo = make_use_case(
+            [make_service("a")], [book("a", START, int((busy_until - START).total_seconds() // 60))]
+        )
+
+        response = await use_case.execute(FindNextAvailableSlotsRequest(service_id="a", count=1), now=START)
+
+        assert response.slots[0].start == busy_until
+        assert [end - start for start, end in appointment_repo.windows][:2] == [
+            timedelta(days=1, minutes=30), timedelta(days=2, minutes=30)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slot_starting_at_chunk_end_is_found_once(self):
+        chunk_end = START + timedelta(days=1)
+        use_case, _ = make_use_case(
+            [make_service("a")], [book("a", START, 24 * 60), book("a", chunk_end + timedelta(minutes=30), 30)]
+        )
+
+        response = await use_case.execute(FindNextAvailableSlotsRequest(service_id="a", count=2), now=START)
+
+        assert [slot.start for slot in response.slots] == [chunk_end, chunk_end + timedelta(minutes=60)]
+
+    @pytest.mark.asyncio
+    async def test_slot_crossing_a_chunk_boundary_is_not_overlapped(self):
+        chunk_end = START + timedelta(days=1)
+        use_case, _ = make_use_case([make_service("a", 60)], [book("a", START, 24 * 60 - 30)])
+
+        response = await use_case.execute(FindNextAvailableSlotsRequest(service_id="a", count=2), now=START)
+
+        assert [(slot.start, slot.end) for slot in response.slots] == [
+            (chunk_end - timedelta(minutes=30), chunk_end + timedelta(minutes=30)),
+            (chunk_end + timedelta(minutes=30), chunk_end + timedelta(minutes=90)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_service_type_merges_services_in_start_order(self):
+        services = [make_service("a", 60), make_service("b", 30)]
+        use_case, _ = make_use_case(services, [book("a", START, 60), book("b", START, 30)])
+
+        response = await use_case.execute(
+            FindNextAvailableSlotsRequest(service_type=ServiceType.CONSULTATION, count=3), now=START
+        )
+
+        assert [(slot.service_id, slot.start) for slot in response.slots] == [
+            ("b", START + timedelta(minutes=30)),
+            ("b", START + timedelta(minutes=60)),
+            ("a", START + timedelta(minutes=60)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_never_starts_in_the_past(self):
+        use_case, _ = make_use_case([make_service("a")])
+
+        response = await use_case.execute(
+            FindNextAvailableSlotsRequest(service_id="a", count=1, after=START - timedelta(days=1)), now=START
+        )
+
+        assert response.slots[0].start == START
+
+    @pytest.mark.asyncio
+    async def test_naive_after_is_read_as_utc(self):
+        use_case, _ = make_use_case([make_service("a")])
+        after = (START + timedelta(hours=2)).replace(tzinfo=None)
+
+        response = await use_case.execute(FindNextAvailableSlotsRequest(service_id="a", count=1, after=after), now=START)
+
+        assert response.success
+        assert response.slots[0].start == START + timedelta(hours=2)
+
+    @pytest.mark.asyncio
+    async def test_horizon_bounds_the_search(self):
+        use_case, _ = make_use_case([make_service("a")], [book("a", START, 3 * 24 * 60)])
+
+        response = await use_case.execute(
+            FindNextAvailableSlotsRequest(service_id="a", count=1, horizon_days=2), now=START
+        )
+
+        assert response.success
+        assert response.slots == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_service_is_reported(self):
+        use_case, _ = make_use_case([make_service("a")])
+
+        response = await use_case.execute(FindNextAvailableSlotsRequest(service_id="missing"), now=START)
+
+        assert response.error_code == "SERVICE_NOT_FOUND"
@@ -0,0 +1,85 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.application.dtos.get_availability_request import GetAvailabilityRequest
+from backend.application.use_cases.get_availability_use_case import GetAvailabilityUseCase
+from backend.core.models.appointment import Appointment
+from backend.core.models.service import Service
+from backend.core.models.service_type import ServiceType
+from backend.core.value_objects.time_slot import TimeSlot
+
+START = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def make_service(service_id, duration_minutes):
+    return Service(id=service_id, name=service_id, description=service_id, duration_minutes=duration_minutes,
+                   service_type=ServiceType.CONSULTATION)
+
+
+class FakeServiceRepository:
+    def __init__(self, services):
+        self.services = services
+
+    async def find_by_type(self, service_type):
+        return [service for service in self.services if service.service_type == service_type]
+
+
+class FakeAppointmentRepository:
+    def __init__(self, appointments):
+        self.appointments = appointments
+
+    async def find_scheduled_between_for_services(self, start, end, service_ids):
+        result = {service_id: [] for service_id in service_ids}
+        for appointment in self.appointments:
+            slot = appointment.scheduled_slot
+            if appointment.service_id in result and slot.start < end and slot.end > start:
+                result[appointment.service_id].append(appointment)
+        return result
+
+
+def make_use_case(services, appointments=()):
+    return GetAvailabilityUseCase(FakeAppointmentRepository(list(appointments)), FakeServiceRepository(services))
+
+
+def make_request(**kwargs):
+    return GetAvailabilityRequest(service_type=ServiceType.CONSULTATION, start_date=START,
+                                  end_date=START + timedelta(hours=1), **kwargs)
+
+
+class TestGetAvailabilityUseCase:
+
+    @pytest.mark.asyncio
+    async def test_booking_on_one_service_leaves_the_other_free(self):
+        booking = Appointment(id="booking", user_id="user", service_id="a",
+                              scheduled_slot=TimeSlot(START, START + timedelta(minutes=30)))
+        use_case = make_use_case([make_service("a", 30), make_service("b", 30)], [booking])
+
+        response = await use_case.execute(make_request(per_service=True))
+
+        availability = response.service_availability
+        assert [slot.is_available for slot in availability["a"].time_slots] == [False, True]
+        assert [slot.is_available for slot in availability["b"].time_slots] == [True, True]
+
+    @pytest.mark.asyncio
+    async def test_each_service_uses_its_own_duration(self):
+        use_case = make_use_case([make_service("a", 30), make_service("b", 60)])
+
+        response = await use_case.execute(make_request(per_service=True))
+
+        availability = response.service_availability
+        assert [slot.start for slot in availability["a"].time_slots] == [START, START + timedelta(minutes=30)]
+        assert [(slot.start, slot.end) for slot in availability["b"].time_slots] == [
+            (START, START + timedelta(hours=1))
+        ]
+        assert availability["b"].duration_minutes == 60
+
+    @pytest.mark.asyncio
+    async def test_only_available_drops_busy_slots(self):
+        booking = Appointment(id="booking", user_id="user", service_id="a",
+                              scheduled_slot=TimeSlot(START, START + timedelta(minutes=30)))
+        use_case = make_use_case([make_service("a", 30)], [booking])
+
+        response = await use_case.execute(make_request(per_service=True, only_available=True))
+
+        assert [slot.start for slot in response.service_availability["a"].time_slots] == [
+            START + timedelta(minutes=30)
+        ]
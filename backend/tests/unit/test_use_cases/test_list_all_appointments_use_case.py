@@ -0,0 +1,98 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.application.dtos.admin_appointment_summary_dto import AdminAppointmentSummaryDTO
+from backend.application.dtos.list_all_appointments_request import ListAllAppointmentsRequest
+from backend.application.pagination.appointment_cursor import encode_cursor, decode_cursor
+from backend.application.use_cases.list_all_appointments_use_case import ListAllAppointmentsUseCase
+from backend.core.models.appointment_status import AppointmentStatus
+from backend.core.models.service_type import ServiceType
+
+START = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def make_summary(index, start):
+    return AdminAppointmentSummaryDTO(
+        id=f"00000000-0000-0000-0000-{index:012d}",
+        user_id="user",
+        service_id="service",
+        client_name="Jane",
+        client_email="jane@example.com",
+        service_type=ServiceType.CONSULTATION,
+        scheduled_start=start,
+        scheduled_end=start + timedelta(minutes=30),
+        status=AppointmentStatus.SCHEDULED,
+        view_token=f"view-{index}",
+        cancellation_token=f"cancel-{index}",
+        created_at=START,
+        updated_at=START
+    )
+
+
+class FakeAppointmentRepository:
+    def __init__(self, summaries):
+        self.summaries = sorted(summaries, key=lambda dto: (dto.scheduled_start, dto.id), reverse=True)
+        self.count_calls = 0
+
+    async def find_admin_summaries(self, status=None, service_type=None, date_from=None, date_to=None,
+                                   limit=None, after=None):
+        rows = [dto for dto in self.summaries if after is None or (dto.scheduled_start, dto.id) < after]
+        return rows[:limit]
+
+    async def count_filtered(self, status=None, service_type=None, date_from=None, date_to=None):
+        self.count_calls += 1
+        return len(self.summaries)
+
+
+class TestAppointmentCursor:
+
+    def test_round_trip(self):
+        appointment_id = "6f1c2a8e-3b7d-4c1e-9a5f-0d2e4b6c8a10"
+        assert decode_cursor(encode_cursor(START, appointment_id)) == (START, appointment_id)
+
+    def test_invalid_cursor_raises(self):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(encode_cursor(START, "not-a-uuid"))
+
+
+class TestListAllAppointmentsUseCase:
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_row_once(self):
+        # Two rows share a start time so the id tie-breaker is exercised across a page boundary.
+        summaries = [make_summary(i, START + timedelta(hours=i // 2)) for i in range(7)]
+        use_case = ListAllAppointmentsUseCase(FakeAppointmentRepository(summaries))
+
+        seen, cursor = [], None
+        while True:
+            response = await use_case.execute(ListAllAppointmentsRequest(page_size=3, cursor=cursor))
+            seen.extend(dto.id for dto in response.appointments)
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert set(seen) == {dto.id for dto in summaries}
+
+    @pytest.mark.asyncio
+    async def test_total_is_only_counted_on_request(self):
+        repository = FakeAppointmentRepository([make_summary(i, START) for i in range(2)])
+        use_case = ListAllAppointmentsUseCase(repository)
+
+        response = await use_case.execute(ListAllAppointmentsRequest())
+        assert response.total_count is None
+        assert response.next_cursor is None
+        assert repository.count_calls == 0
+
+        response = await use_case.execute(ListAllAppointmentsRequest(include_total=True))
+        assert response.total_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_is_rejected(self):
+        use_case = ListAllAppointmentsUseCase(FakeAppointmentRepository([]))
+
+        response = await use_case.execute(ListAllAppointmentsRequest(cursor="garbage"))
+
+        assert not response.success
+        assert response.error_code == "INVALID_CURSOR"
@@ -0,0 +1,53 @@
+import pytest
+from backend.application.dtos.login_request import LoginRequest
+from backend.application.use_cases.login_use_case import LoginUseCase
+from backend.core.exceptions.password_hasher_saturated_error import PasswordHasherSaturatedError
+from backend.core.models.user import User
+from backend.core.value_objects.email import Email
+from backend.core.value_objects.hashed_password import HashedPassword
+
+HASH = "$2b$04$KIXQJ1pV7l8q9Q1nq7o4UeJ8oZ1k2m3n4o5p6q7r8s9t0u1v2w3x4"
+
+
+class FakeUserRepository:
+    async def find_by_email(self, email):
+        return User(id="user-1", name="Jane", email=Email(email), phone="123456789",
+                    hashed_password=HashedPassword(value=HASH))
+
+
+class FakePasswordHasher:
+    def __init__(self, result):
+        self.result = result
+
+    async def verify(self, password, hashed_password):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def make_request():
+    return LoginRequest(email="jane@example.com", password="password123")
+
+
+class TestLoginUseCase:
+
+    @pytest.mark.asyncio
+    async def test_valid_password_issues_token(self):
+        response = await LoginUseCase(FakeUserRepository(), FakePasswordHasher(True)).execute(make_request())
+
+        assert response.success
+        assert response.access_token
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_is_rejected(self):
+        response = await LoginUseCase(FakeUserRepository(), FakePasswordHasher(False)).execute(make_request())
+
+        assert response.error_code == "INVALID_CREDENTIALS"
+
+    @pytest.mark.asyncio
+    async def test_saturated_hasher_reports_service_unavailable(self):
+        hasher = FakePasswordHasher(PasswordHasherSaturatedError())
+
+        response = await LoginUseCase(FakeUserRepository(), hasher).execute(make_request())
+
+        assert response.error_code == "SERVICE_UNAVAILABLE"
@@ -0,0 +1,93 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.application.dtos.appointment_reminder_dto import AppointmentReminderDTO
+from backend.application.use_cases.send_appointment_reminders_use_case import SendAppointmentRemindersUseCase
+from backend.core.models.notification_kind import NotificationKind
+from backend.core.models.service_type import ServiceType
+from backend.tests.support.fake_unit_of_work import FakeUnitOfWork
+
+NOW = datetime(2023, 1, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def make_reminder(index, hours_ahead=1):
+    start = NOW + timedelta(hours=hours_ahead)
+    return AppointmentReminderDTO(
+        appointment_id=f"appointment-{index}",
+        client_name="Jane",
+        client_email=f"client{index}@example.com",
+        service_name="Checkup",
+        service_description="Routine checkup",
+        service_duration_minutes=30,
+        service_price=100.0,
+        service_type=ServiceType.CONSULTATION,
+        scheduled_start=start,
+        scheduled_end=start + timedelta(minutes=30)
+    )
+
+
+class FakeAppointmentRepository:
+    def __init__(self, reminders):
+        self.unclaimed = list(reminders)
+        self.claim_sizes = []
+
+    async def claim_due_reminders(self, start, end, limit):
+        due = [reminder for reminder in self.unclaimed if start <= reminder.scheduled_start < end][:limit]
+        for reminder in due:
+            self.unclaimed.remove(reminder)
+        self.claim_sizes.append(len(due))
+        return due
+
+
+class FakeOutbox:
+    def __init__(self, failing_recipients=()):
+        self.failing_recipients = set(failing_recipients)
+        self.messages = []
+
+    async def enqueue(self, kind, recipient, details):
+        if recipient in self.failing_recipients:
+            raise ConnectionError("database unavailable")
+        self.messages.append((kind, recipient, details))
+
+
+class TestSendAppointmentRemindersUseCase:
+
+    @pytest.mark.asyncio
+    async def test_queues_due_reminders_in_batches(self):
+        repository = FakeAppointmentRepository([make_reminder(i) for i in range(5)] + [make_reminder(9, 48)])
+        outbox, unit_of_work = FakeOutbox(), FakeUnitOfWork()
+        use_case = SendAppointmentRemindersUseCase(repository, outbox, unit_of_work, batch_size=2)
+
+        response = await use_case.execute(now=NOW)
+
+        assert response.success
+        assert response.queued_count == 5
+        assert repository.claim_sizes == [2, 2, 1]
+        assert len(repository.unclaimed) == 1
+        kind, recipient, details = outbox.messages[0]
+        assert kind == NotificationKind.REMINDER
+        assert recipient == "client0@example.com"
+        assert details["scheduled_start"] == NOW + timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_each_claim_commits_with_its_outbox_rows(self):
+        repository = FakeAppointmentRepository([make_reminder(i) for i in range(3)])
+        outbox, unit_of_work = FakeOutbox(), FakeUnitOfWork()
+        use_case = SendAppointmentRemindersUseCase(repository, outbox, unit_of_work, batch_size=2)
+
+        await use_case.execute(now=NOW)
+
+        assert unit_of_work.commits == 2
+        assert unit_of_work.rollbacks == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_enqueue_rolls_back_the_claim(self):
+        repository = FakeAppointmentRepository([make_reminder(i) for i in range(3)])
+        outbox, unit_of_work = FakeOutbox(failing_recipients={"client1@example.com"}), FakeUnitOfWork()
+        use_case = SendAppointmentRemindersUseCase(repository, outbox, unit_of_work, batch_size=1)
+
+        response = await use_case.execute(now=NOW)
+
+        assert response.error_code == "INTERNAL_ERROR"
+        assert response.queued_count == 1
+        assert unit_of_work.commits == 1
+        assert unit_of_work.rollbacks == 1
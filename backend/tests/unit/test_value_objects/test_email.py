@@ -22,3 +22,11 @@ class TestEmail:
     def test_email_empty_string(self):
         with pytest.raises(ValueError):
             Email("")
+
+    def test_trusted_email_equals_validated_email(self):
+        assert Email.trusted("test@example.com") == Email("test@example.com")
+
+    def test_trusted_email_is_immutable(self):
+        email = Email.trusted("test@example.com")
+        with pytest.raises(AttributeError):
+            email.value = "other@example.com"
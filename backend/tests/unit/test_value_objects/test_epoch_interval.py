@@ -0,0 +1,43 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from backend.core.value_objects.epoch_interval import EpochInterval, from_epoch_micros, to_epoch_micros
+from backend.core.value_objects.time_slot import TimeSlot
+
+START = datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+
+class TestEpochInterval:
+
+    def test_round_trips_through_time_slot(self):
+        slot = TimeSlot(START, START + timedelta(minutes=30, microseconds=7))
+
+        assert EpochInterval.from_time_slot(slot).to_time_slot() == slot
+
+    def test_offsets_and_naive_datetimes_map_to_the_same_instant(self):
+        offset = START.astimezone(timezone(timedelta(hours=-3)))
+        naive = START.replace(tzinfo=None)
+
+        assert to_epoch_micros(offset) == to_epoch_micros(naive) == to_epoch_micros(START)
+        assert from_epoch_micros(to_epoch_micros(START)) == START
+
+    def test_overlaps_matches_time_slot(self):
+        base = EpochInterval.from_datetimes(START, START + timedelta(hours=1))
+        for minutes, expected in ((-60, False), (-30, True), (30, True), (60, False)):
+            other_start = START + timedelta(minutes=minutes)
+            other = EpochInterval.from_datetimes(other_start, other_start + timedelta(hours=1))
+            assert base.overlaps(other) is expected
+            assert TimeSlot(START, START + timedelta(hours=1)).overlaps(other.to_time_slot()) is expected
+
+    def test_contains_is_half_open(self):
+        interval = EpochInterval(10, 20)
+
+        assert interval.contains(10)
+        assert not interval.contains(20)
+        assert interval.duration == 10
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(EpochInterval(1, 2), "__dict__")
+
+    def test_start_must_be_before_end(self):
+        with pytest.raises(ValueError, match="Start time must be before end time"):
+            EpochInterval(5, 5)
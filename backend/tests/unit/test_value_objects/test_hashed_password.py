@@ -26,3 +26,7 @@ class TestHashedPassword:
         wrong_generic = "plain_string_without_dollar_signs"
         with pytest.raises(ValueError, match="Invalid hashed password format"):
             HashedPassword(wrong_generic)
+
+    def test_trusted_hashed_password_equals_validated_one(self):
+        valid_hash = "$2b$12$LQY8CUb7bqg9L3U7P6V7nOZK1J2W3X4Y5Z6A7B8C9D0E1F2G3H4I5J6K"
+        assert HashedPassword.trusted(valid_hash) == HashedPassword(valid_hash)
@@ -163,3 +163,8 @@ class TestTimeSlot:
         )
         dt_naive = datetime(2023, 1, 1, 11, 0)
         assert slot.contains(dt_naive)
+
+    def test_trusted_slot_equals_validated_slot(self):
+        start = datetime(2023, 1, 1, 10, 0, tzinfo=timezone.utc)
+        end = datetime(2023, 1, 1, 12, 0, tzinfo=timezone.utc)
+        assert TimeSlot.trusted(start, end) == TimeSlot(start, end)
@@ -54,11 +54,19 @@ export interface AvailableService {
   updated_at: string; // ISO 8601 string
 }
 
+// Definir o tipo para a grade de slots de um único serviço (per_service=true)
+export interface ServiceAvailability {
+  service_id: string;
+  duration_minutes: number;
+  time_slots: TimeSlot[];
+}
+
 // Definir o tipo para a resposta da disponibilidade
 export interface GetAvailabilityResponse {
   service_type: ServiceType; // O tipo de serviço solicitado
   time_slots: TimeSlot[]; // Lista de slots e sua disponibilidade
   available_services: AvailableService[]; // Lista de serviços disponíveis para o tipo
+  service_availability?: Record<string, ServiceAvailability>; // Grades por serviço, indexadas pelo ID
 }
 
 // Se o backend retornar os tipos de serviço em outro formato, ajuste GetAvailabilityResponse